@@ -0,0 +1,78 @@
+"""
+Compare writing a catalog with json.dump and with the Xcode-format serializer.
+
+Usage:
+    python benchmarks/bench_catalog_serializer.py [--keys 10000 100000] [--languages 5] [--repeat 3]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "localizable_xstrings_mcp"))
+os.environ.setdefault("OPENAI_API_KEY", "benchmark")
+
+from xcstrings_format import dump_catalog  # noqa: E402
+
+LANGUAGES = ["de", "es", "fr", "it", "ja", "ko", "pt-BR", "ru", "zh-Hans", "zh-Hant"]
+WORDS = ["account", "settings", "delete", "photo", "share", "continue", "your", "the", "to", "Übersicht", "写真", "設定"]
+
+
+def synthetic_catalog(key_count: int, language_count: int, seed: int = 7) -> dict:
+    """Build a catalog with ``key_count`` keys translated into ``language_count`` languages."""
+    rng = random.Random(seed)
+    languages = LANGUAGES[:language_count]
+    strings = {}
+    for index in range(key_count):
+        text = " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 8))) + f" {index}"
+        strings[text] = {
+            "localizations": {
+                lang: {"stringUnit": {"state": "translated", "value": f"{lang}: {text}"}}
+                for lang in languages
+            }
+        }
+    return {"sourceLanguage": "en", "strings": strings, "version": "1.0"}
+
+
+def time_write(write, data: dict, path: str, repeat: int) -> float:
+    """Return the best wall time of writing ``data`` to ``path``."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        with open(path, "w", encoding="utf-8") as f:
+            write(data, f)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--keys", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--languages", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    writers = {
+        "json.dump": lambda data, f: json.dump(data, f, indent=2, ensure_ascii=False),
+        "xcode": dump_catalog,
+    }
+
+    print(f"{'keys':>8}{'writer':>12}{'seconds':>10}{'MB':>8}")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "Localizable.xcstrings")
+        for key_count in args.keys:
+            data = synthetic_catalog(key_count, args.languages)
+            timings = {}
+            for name, write in writers.items():
+                timings[name] = time_write(write, data, path, args.repeat)
+                size = os.path.getsize(path) / 1_000_000
+                print(f"{key_count:>8}{name:>12}{timings[name]:>10.3f}{size:>8.1f}")
+            print(f"{'':>8}{'speedup':>12}{timings['json.dump'] / timings['xcode']:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
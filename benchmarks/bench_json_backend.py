@@ -0,0 +1,56 @@
+"""
+Compare catalog parse time of the installed JSON backends.
+
+Usage:
+    python benchmarks/bench_json_backend.py [--keys 10000 100000] [--languages 5] [--repeat 5]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "localizable_xstrings_mcp"))
+sys.path.insert(0, os.path.dirname(__file__))
+os.environ.setdefault("OPENAI_API_KEY", "benchmark")
+
+import json_backend  # noqa: E402
+from bench_catalog_serializer import synthetic_catalog  # noqa: E402
+from xcstrings_format import dumps_catalog  # noqa: E402
+
+
+def best_time(parse, data: bytes, repeat: int) -> float:
+    """Return the best wall time of parsing ``data``."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        parse(data)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--keys", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--languages", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    backends = json_backend.available_backends()
+    print(f"Installed backends: {', '.join(backends)}")
+    print(f"{'keys':>8}{'backend':>10}{'seconds':>10}{'speedup':>10}")
+    for key_count in args.keys:
+        catalog = synthetic_catalog(key_count, args.languages)
+        data = dumps_catalog(catalog).encode("utf-8")
+        baseline = None
+        for name, parse in reversed(list(backends.items())):
+            if parse(data) != catalog:
+                raise SystemExit(f"{name} parsed the catalog differently from json.loads")
+            seconds = best_time(parse, data, args.repeat)
+            baseline = baseline or seconds
+            print(f"{key_count:>8}{name:>10}{seconds:>10.3f}{baseline / seconds:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Compare prompt payload size of the legacy and short-ID chunk encodings.
+
+Usage:
+    python benchmarks/bench_payload_encoding.py [--keys 1000]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "localizable_xstrings_mcp"))
+os.environ.setdefault("OPENAI_API_KEY", "benchmark")
+
+from tokens import estimate_tokens  # noqa: E402
+from xcstrings_tools import encode_chunk_payload  # noqa: E402
+
+WORDS = [
+    "account", "settings", "delete", "photo", "share", "continue", "subscription", "notifications",
+    "privacy", "your", "the", "to", "is", "has", "been", "updated", "please", "try", "again", "later",
+    "unable", "connect", "server", "download", "file", "remaining", "days", "welcome", "back", "profile",
+]
+PLACEHOLDERS = ["%@", "%lld", "%d"]
+
+
+def synthetic_keys(count: int, seed: int = 7) -> list:
+    """Build source strings with a realistic mix of labels, sentences and placeholders."""
+    rng = random.Random(seed)
+    keys = []
+    while len(keys) < count:
+        length = rng.choice([1, 2, 3, 5, 8, 13, 21])
+        words = [rng.choice(WORDS) for _ in range(length)]
+        if rng.random() < 0.3:
+            words.insert(rng.randrange(len(words) + 1), rng.choice(PLACEHOLDERS))
+        text = " ".join(words).capitalize()
+        if length > 3:
+            text += "."
+        if text not in keys:
+            keys.append(text)
+    return keys
+
+
+def legacy_payload(chunk: list) -> str:
+    """Encoding used before short IDs: every key sent as both key and value, indented."""
+    return json.dumps({key: key for key in chunk}, ensure_ascii=False, indent=2)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--keys", type=int, default=1000)
+    parser.add_argument("--chunk-size", type=int, default=50)
+    args = parser.parse_args()
+
+    keys = synthetic_keys(args.keys)
+    chunks = [keys[i:i + args.chunk_size] for i in range(0, len(keys), args.chunk_size)]
+
+    legacy_bytes = legacy_tokens = compact_bytes = compact_tokens = 0
+    for chunk in chunks:
+        legacy = legacy_payload(chunk)
+        compact, _ = encode_chunk_payload({key: key for key in chunk})
+        legacy_bytes += len(legacy.encode("utf-8"))
+        legacy_tokens += estimate_tokens(legacy)
+        compact_bytes += len(compact.encode("utf-8"))
+        compact_tokens += estimate_tokens(compact)
+
+    print(f"{len(keys)} keys in {len(chunks)} chunks of {args.chunk_size}")
+    print(f"{'encoding':<12}{'bytes':>12}{'est. tokens':>14}")
+    print(f"{'legacy':<12}{legacy_bytes:>12}{legacy_tokens:>14}")
+    print(f"{'short-id':<12}{compact_bytes:>12}{compact_tokens:>14}")
+    print(f"input token reduction: {1 - compact_tokens / legacy_tokens:.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Crash-safe file replacement via a synced temporary file and rename."""
+
+import os
+import secrets
+import stat
+from typing import IO, Callable
+
+# Large buffer so big catalogs are written in few system calls
+_WRITE_BUFFER_SIZE = 1024 * 1024
+
+
+def atomic_write(file_path: str, write: Callable[[IO[str]], None]) -> None:
+    """
+    Replace a file's contents so readers only ever see the old or the new version.
+
+    The new contents are written to a temporary file in the same directory,
+    flushed and fsync'd, given the original file's permissions, then renamed
+    over the original with ``os.replace``. The directory is fsync'd as well so
+    the rename itself survives a crash. Symlinks are followed and the file
+    they point to is replaced.
+
+    Args:
+        file_path (str): Path of the file to replace or create
+        write (Callable[[IO[str]], None]): Writes the new contents to the given text stream
+
+    Raises:
+        OSError: If the temporary file can't be written or renamed
+    """
+    target = os.path.realpath(file_path)
+    directory = os.path.dirname(target)
+
+    temp_path = os.path.join(directory, f".{os.path.basename(target)}.{secrets.token_hex(6)}.tmp")
+    # Mode 0o666 is narrowed by the umask, as for a file created with open()
+    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8', newline='', buffering=_WRITE_BUFFER_SIZE) as f:
+            _copy_permissions(f.fileno(), target)
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, target)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+    _fsync_directory(directory)
+
+
+def _copy_permissions(fd: int, target: str) -> None:
+    try:
+        st = os.stat(target)
+    except FileNotFoundError:
+        return
+
+    os.fchmod(fd, stat.S_IMODE(st.st_mode))
+    try:
+        os.fchown(fd, st.st_uid, st.st_gid)
+    except (AttributeError, PermissionError):
+        # Only privileged users can give a file away; keep our own ownership
+        pass
+
+
+def _fsync_directory(directory: str) -> None:
+    try:
+        dir_fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        # Not supported on every platform and filesystem
+        pass
+    finally:
+        os.close(dir_fd)
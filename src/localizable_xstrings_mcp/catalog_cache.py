@@ -0,0 +1,137 @@
+"""Process-wide cache of parsed .xcstrings catalogs."""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, NamedTuple, Tuple
+
+import json_backend
+from settings import settings
+
+
+class FileIdentity(NamedTuple):
+    """Identity of a file on disk; any change means the cached parse is stale."""
+
+    inode: int
+    mtime_ns: int
+    size: int
+
+
+def _identity_from_stat(stat_result: os.stat_result) -> FileIdentity:
+    return FileIdentity(stat_result.st_ino, stat_result.st_mtime_ns, stat_result.st_size)
+
+
+class CatalogCache:
+    """
+    LRU cache of parsed catalogs keyed by real path and file identity.
+
+    Entries are invalidated automatically when the file's inode, mtime or size
+    changes, and evicted least-recently-used first once the total size of the
+    cached files exceeds ``max_bytes``.
+
+    Cached documents are shared between callers and must be treated as
+    read-only.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Tuple[FileIdentity, Dict[str, Any]]]" = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, file_path: str) -> Dict[str, Any]:
+        """
+        Return the parsed catalog for a file, parsing it only if needed.
+
+        Args:
+            file_path (str): Path to the .xcstrings file
+
+        Returns:
+            Dict[str, Any]: Parsed catalog (read-only)
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+            json.JSONDecodeError: If the file is not valid JSON
+        """
+        real_path = os.path.realpath(file_path)
+        identity = _identity_from_stat(os.stat(real_path))
+
+        with self._lock:
+            entry = self._entries.get(real_path)
+            if entry is not None and entry[0] == identity:
+                self._entries.move_to_end(real_path)
+                self.hits += 1
+                return entry[1]
+
+        # Catalogs are replaced atomically rather than rewritten in place, so the
+        # open descriptor sees one complete version and its identity keys the parse
+        with open(real_path, 'rb') as f:
+            identity = _identity_from_stat(os.fstat(f.fileno()))
+            data = json_backend.loads(f.read())
+
+        with self._lock:
+            self.misses += 1
+            self._store(real_path, identity, data)
+        return data
+
+    def put(self, file_path: str, data: Dict[str, Any]) -> None:
+        """
+        Prime the cache with a document that was just written to ``file_path``.
+
+        Args:
+            file_path (str): Path the document was written to
+            data (Dict[str, Any]): The document as written
+        """
+        real_path = os.path.realpath(file_path)
+        identity = _identity_from_stat(os.stat(real_path))
+        with self._lock:
+            self._store(real_path, identity, data)
+
+    def invalidate(self, file_path: str) -> None:
+        """Drop any cached entry for ``file_path``."""
+        with self._lock:
+            self._discard(os.path.realpath(file_path))
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def _store(self, real_path: str, identity: FileIdentity, data: Dict[str, Any]) -> None:
+        self._discard(real_path)
+        if identity.size > self.max_bytes:
+            return
+        self._entries[real_path] = (identity, data)
+        self._total_bytes += identity.size
+        while self._total_bytes > self.max_bytes:
+            _, (evicted_identity, _) = self._entries.popitem(last=False)
+            self._total_bytes -= evicted_identity.size
+
+    def _discard(self, real_path: str) -> None:
+        entry = self._entries.pop(real_path, None)
+        if entry is not None:
+            self._total_bytes -= entry[0].size
+
+
+# Global cache instance
+catalog_cache = CatalogCache(settings.catalog_cache_max_bytes)
+
+
+def load_catalog(file_path: str) -> Dict[str, Any]:
+    """
+    Load a parsed .xcstrings catalog through the shared cache.
+
+    Args:
+        file_path (str): Path to the .xcstrings file
+
+    Returns:
+        Dict[str, Any]: Parsed catalog (read-only)
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    return catalog_cache.get(file_path)
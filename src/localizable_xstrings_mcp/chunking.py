@@ -0,0 +1,135 @@
+"""Token-budget-aware chunking of strings for translation requests."""
+
+import json
+import math
+from typing import Dict, List, Tuple
+
+from tokens import estimate_tokens
+
+# Translations are usually longer than their source, and non-Latin scripts
+# cost more tokens per character, so budget output generously
+OUTPUT_EXPANSION = 1.5
+
+# Per-entry JSON overhead of the short-ID payload: "123":"...",
+_ENTRY_OVERHEAD_TOKENS = 4
+
+
+def estimate_entry_cost(text: str) -> Tuple[int, int]:
+    """
+    Estimate the input and output token cost of translating one string.
+
+    Args:
+        text (str): Source text
+
+    Returns:
+        Tuple[int, int]: Tuple of (estimated input tokens, estimated output tokens)
+    """
+    input_tokens = estimate_tokens(json.dumps(text, ensure_ascii=False)) + _ENTRY_OVERHEAD_TOKENS
+    return input_tokens, math.ceil(input_tokens * OUTPUT_EXPANSION)
+
+
+def chunk_by_token_budget(
+    strings: Dict[str, str],
+    max_input_tokens: int,
+    max_output_tokens: int,
+    max_items: int
+) -> List[Dict[str, str]]:
+    """
+    Split strings into chunks of roughly equal token cost.
+
+    The number of chunks is the smallest that fits the input token, output
+    token and item budgets; entries are then spread over that many chunks so
+    each carries about the same cost, keeping the original key order. An entry
+    that exceeds the budget on its own is sent as a chunk by itself.
+
+    Args:
+        strings (Dict[str, str]): Key-value pairs to translate
+        max_input_tokens (int): Input token budget per chunk
+        max_output_tokens (int): Output token budget per chunk
+        max_items (int): Maximum number of strings per chunk
+
+    Returns:
+        List[Dict[str, str]]: Chunks of key-value pairs
+    """
+    if not strings:
+        return []
+
+    costs = [estimate_entry_cost(text) for text in strings.values()]
+
+    # Cost of each entry as a fraction of a full chunk, in whichever budget it fills fastest
+    weights = [
+        max(input_tokens / max_input_tokens, output_tokens / max_output_tokens, 1 / max_items)
+        for input_tokens, output_tokens in costs
+    ]
+    chunk_count = max(1, math.ceil(sum(weights)))
+    target = sum(weights) / chunk_count
+
+    # Assign each entry to the chunk its cost midpoint falls into
+    groups: List[List[int]] = [[] for _ in range(chunk_count)]
+    position = 0.0
+    for index, weight in enumerate(weights):
+        groups[min(chunk_count - 1, int((position + weight / 2) / target))].append(index)
+        position += weight
+
+    # Enforce the hard budgets on chunks that came out over because of large entries
+    keys = list(strings)
+    chunks = []
+    for group in groups:
+        current: Dict[str, str] = {}
+        input_total = output_total = 0
+        for index in group:
+            input_tokens, output_tokens = costs[index]
+            over_budget = (
+                input_total + input_tokens > max_input_tokens
+                or output_total + output_tokens > max_output_tokens
+                or len(current) >= max_items
+            )
+            if current and over_budget:
+                chunks.append(current)
+                current, input_total, output_total = {}, 0, 0
+            current[keys[index]] = strings[keys[index]]
+            input_total += input_tokens
+            output_total += output_tokens
+        if current:
+            chunks.append(current)
+
+    return chunks
+
+
+def top_up_chunk(
+    chunk: Dict[str, str],
+    extra: Dict[str, str],
+    max_input_tokens: int,
+    max_output_tokens: int,
+    max_items: int
+) -> Dict[str, str]:
+    """
+    Add entries from ``extra`` to a chunk while it stays within budget.
+
+    Args:
+        chunk (Dict[str, str]): Planned chunk of key-value pairs
+        extra (Dict[str, str]): Entries waiting to be merged into a chunk
+        max_input_tokens (int): Input token budget per chunk
+        max_output_tokens (int): Output token budget per chunk
+        max_items (int): Maximum number of strings per chunk
+
+    Returns:
+        Dict[str, str]: New chunk with as many extra entries as fit, extra entries first
+    """
+    costs = [estimate_entry_cost(text) for text in chunk.values()]
+    input_total = sum(input_tokens for input_tokens, _ in costs)
+    output_total = sum(output_tokens for _, output_tokens in costs)
+
+    merged: Dict[str, str] = {}
+    for key, text in extra.items():
+        if len(merged) + len(chunk) >= max_items:
+            break
+        input_tokens, output_tokens = estimate_entry_cost(text)
+        if input_total + input_tokens > max_input_tokens or output_total + output_tokens > max_output_tokens:
+            continue
+        merged[key] = text
+        input_total += input_tokens
+        output_total += output_tokens
+
+    merged.update(chunk)
+    return merged
@@ -0,0 +1,98 @@
+"""Grouping of keys that share the same source text, so each text is translated once."""
+
+import unicodedata
+from typing import Any, Dict, List, Optional
+
+
+def normalize_source_text(text: str) -> str:
+    """
+    Normalize source text for deduplication.
+
+    Texts that differ only in Unicode composition or surrounding whitespace
+    translate the same way, so they share one normalized form.
+
+    Args:
+        text (str): Source text
+
+    Returns:
+        str: Normalized text
+    """
+    return unicodedata.normalize("NFC", text).strip()
+
+
+def lookup_source_texts(keys: List[str], strings: Dict[str, Any], source_language: str) -> Dict[str, str]:
+    """
+    Look up the source-language text of each key.
+
+    Keys are often identifiers ("settings.title") whose text lives in the
+    source language's string unit; keys without one are their own text.
+
+    Args:
+        keys (List[str]): Keys to look up
+        strings (Dict[str, Any]): The catalog's strings
+        source_language (str): The catalog's source language code
+
+    Returns:
+        Dict[str, str]: Source text by key
+    """
+    texts = {}
+    for key in keys:
+        entry = strings.get(key)
+        localization = entry.get("localizations", {}).get(source_language, {}) if isinstance(entry, dict) else {}
+        value = localization.get("stringUnit", {}).get("value") if isinstance(localization, dict) else None
+        texts[key] = value if isinstance(value, str) else key
+    return texts
+
+
+class SourceTextGroups:
+    """Keys grouped by normalized source text, with the mapping back from translated texts to keys."""
+
+    def __init__(self, keys: List[str], texts: Optional[Dict[str, str]] = None):
+        self.key_count = len(keys)
+        # Key -> its own source text, used to restore surrounding whitespace
+        self.sources: Dict[str, str] = {key: texts.get(key, key) if texts else key for key in keys}
+        # Normalized text -> keys sharing it, in first-seen order
+        self.groups: Dict[str, List[str]] = {}
+        for key, source in self.sources.items():
+            text = normalize_source_text(source)
+            # Whitespace-only texts have nothing to share; keep them as they are
+            self.groups.setdefault(text or source, []).append(key)
+
+    @property
+    def texts(self) -> List[str]:
+        """Unique texts to translate, in first-seen order."""
+        return list(self.groups)
+
+    @property
+    def duplicates(self) -> int:
+        """Number of keys that don't need a request of their own."""
+        return self.key_count - len(self.groups)
+
+    def fan_out(self, by_text: Dict[str, str], rewrap: bool = True) -> Dict[str, str]:
+        """
+        Copy per-text results back to every key that shares the text.
+
+        Args:
+            by_text (Dict[str, str]): Results keyed by unique text
+            rewrap (bool): Give keys whose source text only differed in surrounding whitespace
+                their own leading and trailing whitespace around the shared translation;
+                disable for results that aren't translations, such as skip reasons
+
+        Returns:
+            Dict[str, str]: Results keyed by the original keys
+        """
+        by_key = {}
+        for text, value in by_text.items():
+            for key in self.groups.get(text, ()):
+                source = self.sources[key]
+                by_key[key] = _rewrap(source, value) if rewrap and source != text else value
+        return by_key
+
+
+def _rewrap(source: str, translation: str) -> str:
+    stripped = source.strip()
+    if not stripped:
+        return translation
+    leading = source[:len(source) - len(source.lstrip())]
+    trailing = source[len(source.rstrip()):]
+    return leading + translation.strip() + trailing
@@ -0,0 +1,127 @@
+"""Planning which catalog entries need the API, which can be copied verbatim, and which to leave alone."""
+
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from chunking import chunk_by_token_budget, estimate_entry_cost
+from settings import settings
+from utils import PLACEHOLDER_PATTERN
+
+TRANSLATE = "translate"
+COPY_VERBATIM = "copy-verbatim"
+SKIP = "skip"
+
+
+def brand_names() -> Set[str]:
+    """Return the configured brand names, case-folded for matching."""
+    return {name.strip().casefold() for name in settings.translation_brand_names.split(",") if name.strip()}
+
+
+def classify_entry(text: str, entry: Dict[str, Any], brands: Set[str]) -> Tuple[str, str]:
+    """
+    Decide how a catalog entry should be filled in a target language.
+
+    Args:
+        text (str): The entry's source-language text
+        entry (Dict[str, Any]): The key's entry in the catalog's strings
+        brands (Set[str]): Case-folded brand names to copy verbatim
+
+    Returns:
+        Tuple[str, str]: Tuple of (action: TRANSLATE, COPY_VERBATIM or SKIP, reason for not translating)
+    """
+    if entry.get("shouldTranslate") is False:
+        return SKIP, "Marked shouldTranslate: false"
+    if not text.strip():
+        return SKIP, "Empty string"
+    if text.strip().casefold() in brands:
+        return COPY_VERBATIM, "Brand name"
+    # Nothing left to translate once placeholders are removed, e.g. "%lld", "%@ / %@" or "2024"
+    if not any(ch.isalpha() for ch in PLACEHOLDER_PATTERN.sub("", text)):
+        return COPY_VERBATIM, "Only placeholders, numbers or symbols"
+    return TRANSLATE, ""
+
+
+class TranslationPlan:
+    """Keys split into those to send to the API, those copied verbatim and those skipped."""
+
+    def __init__(self, keys: List[str], source_texts: Optional[Dict[str, str]] = None):
+        self.keys = keys
+        # Key -> source-language text; keys are their own text if they have none
+        self.source_texts: Dict[str, str] = {key: (source_texts or {}).get(key, key) for key in keys}
+        self.translate: List[str] = []
+        # Key -> value to apply, taken from the source text
+        self.verbatim: Dict[str, str] = {}
+        # Key -> reason it is left untranslated
+        self.skipped: Dict[str, str] = {}
+
+    def for_keys(self, keys: Iterable[str]) -> "TranslationPlan":
+        """Return the part of the plan covering the given keys, e.g. one language's missing keys."""
+        keys = list(keys)
+        plan = TranslationPlan(keys, self.source_texts)
+        translate = set(self.translate)
+        for key in keys:
+            if key in translate:
+                plan.translate.append(key)
+            elif key in self.verbatim:
+                plan.verbatim[key] = self.verbatim[key]
+            elif key in self.skipped:
+                plan.skipped[key] = self.skipped[key]
+        return plan
+
+    def savings(self) -> Tuple[int, int]:
+        """
+        Estimate the API requests and tokens saved for one target language.
+
+        Returns:
+            Tuple[int, int]: Tuple of (requests saved, input and output tokens saved)
+        """
+        if not self.verbatim and not self.skipped:
+            return 0, 0
+        budget = (
+            settings.translation_chunk_input_tokens,
+            settings.translation_chunk_output_tokens,
+            settings.translation_chunk_size,
+        )
+        texts = self.source_texts
+        requests_before = len(chunk_by_token_budget({key: texts[key] for key in self.keys}, *budget))
+        requests_after = len(chunk_by_token_budget({key: texts[key] for key in self.translate}, *budget))
+        tokens = sum(sum(estimate_entry_cost(texts[key])) for key in (*self.verbatim, *self.skipped))
+        return requests_before - requests_after, tokens
+
+
+def plan_translations(
+    keys: List[str],
+    strings: Dict[str, Any],
+    brands: Optional[Set[str]] = None,
+    source_texts: Optional[Dict[str, str]] = None
+) -> TranslationPlan:
+    """
+    Classify keys as translate, copy-verbatim or skip before any API call.
+
+    Entries marked ``shouldTranslate: false`` and empty strings are skipped.
+    Brand names and strings with no letters outside their placeholders
+    (numbers, symbols, format strings) are filled with the source text.
+    Everything else is translated. Entries are classified by their
+    source-language text, which is also what is copied verbatim, so
+    identifier-style keys ("error.404") are judged by their value.
+
+    Args:
+        keys (List[str]): Keys to fill in a target language
+        strings (Dict[str, Any]): The catalog's strings
+        brands (Optional[Set[str]]): Case-folded brand names; the configured list if omitted
+        source_texts (Optional[Dict[str, str]]): Source-language text by key, from lookup_source_texts; keys are their own text if omitted
+
+    Returns:
+        TranslationPlan: The classified keys
+    """
+    if brands is None:
+        brands = brand_names()
+    plan = TranslationPlan(keys, source_texts)
+    for key in keys:
+        action, reason = classify_entry(plan.source_texts[key], strings.get(key, {}), brands)
+        if action == TRANSLATE:
+            plan.translate.append(key)
+        elif action == COPY_VERBATIM:
+            plan.verbatim[key] = plan.source_texts[key]
+        else:
+            plan.skipped[key] = reason
+    return plan
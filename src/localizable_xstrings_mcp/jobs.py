@@ -0,0 +1,320 @@
+"""Background translation jobs that run on the server event loop."""
+
+import asyncio
+import os
+import time
+import uuid
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from journal import JobJournal, journal_dir
+from retry import create_retry_policy
+from translation_stats import TranslationStats
+from xcstrings_tools import apply_missing_translations_async, translate_and_apply_async
+
+JOB_MODES = ("missing", "all")
+
+# Finished jobs kept around so their status can still be polled
+_MAX_FINISHED_JOBS = 100
+
+
+class TranslationJob:
+    """
+    One translation run over a catalog, tracked per target language.
+
+    Languages are translated one after another through the chunk pipeline;
+    each gets its own ``TranslationStats`` so progress can be reported per
+    language while the job is running. Chunk results are journaled to disk
+    so a job interrupted by a crash, failure or cancellation can be resumed
+    without paying for them again.
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        languages: List[str],
+        mode: str,
+        source_language: str = "en",
+        app_description: Optional[str] = None,
+        job_id: Optional[str] = None,
+        journal: Optional[JobJournal] = None,
+        retry_budget: Optional[int] = None
+    ):
+        self.id = job_id or uuid.uuid4().hex[:12]
+        self.file_path = file_path
+        self.languages = languages
+        self.mode = mode
+        self.source_language = source_language
+        self.app_description = app_description
+        # Retries allowed across all languages; None for TRANSLATION_RETRY_BUDGET
+        self.retry_budget = retry_budget
+        self.status = "pending"
+        self.error: Optional[str] = None
+        self.stats: Dict[str, TranslationStats] = {lang: TranslationStats() for lang in languages}
+        self.language_status: Dict[str, str] = {lang: "pending" for lang in languages}
+        self.language_summary: Dict[str, str] = {}
+        self.backups: Dict[str, str] = {}
+        self.created_at = time.time()
+        self.finished_at: Optional[float] = None
+        self.task: Optional[asyncio.Task] = None
+        self.journal = journal
+        self.resumed = journal is not None
+
+    @property
+    def done(self) -> bool:
+        """True once the job has completed, failed or been cancelled."""
+        return self.status in ("completed", "failed", "cancelled")
+
+    async def run(self) -> None:
+        """Translate and apply each target language in turn, recording the outcome."""
+        self.status = "running"
+        current = None
+        try:
+            if self.journal is None:
+                await self._create_journal()
+            applied_earlier = self.journal.completed_languages() if self.journal is not None else set()
+            # One retry budget for the whole job, however many languages it covers
+            retry_policy = create_retry_policy(self.retry_budget)
+
+            for lang in self.languages:
+                if lang in applied_earlier:
+                    self.language_status[lang] = "completed"
+                    self.language_summary[lang] = "Already applied before the job was resumed"
+                    continue
+                current = lang
+                self.language_status[lang] = "running"
+                apply = apply_missing_translations_async if self.mode == "missing" else translate_and_apply_async
+                try:
+                    _, backup_path, summary, _ = await apply(
+                        self.file_path,
+                        lang,
+                        source_language=self.source_language,
+                        app_description=self.app_description,
+                        stats=self.stats[lang],
+                        journal=self.journal.language(lang) if self.journal is not None else None,
+                        retry_policy=retry_policy,
+                    )
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    # One failing language shouldn't stop the others
+                    self.language_status[lang] = "failed"
+                    self.language_summary[lang] = str(e)
+                    continue
+                self.language_status[lang] = "completed"
+                self.language_summary[lang] = summary
+                if backup_path:
+                    self.backups[lang] = backup_path
+                if self.journal is not None:
+                    await asyncio.to_thread(self.journal.record_language_done, lang)
+            current = None
+
+            failed = [lang for lang, status in self.language_status.items() if status == "failed"]
+            if failed and len(failed) == len(self.languages):
+                self.status = "failed"
+                self.error = "All languages failed"
+            else:
+                self.status = "completed"
+            if not failed and self.journal is not None:
+                # Nothing left to resume
+                await asyncio.to_thread(self.journal.delete)
+                self.journal = None
+        except asyncio.CancelledError:
+            self.status = "cancelled"
+            for lang, status in self.language_status.items():
+                if status in ("pending", "running"):
+                    self.language_status[lang] = "cancelled"
+            if current is not None:
+                self.language_summary[current] = self._cancelled_summary(self.stats[current])
+                if self.stats[current].backup_path:
+                    self.backups[current] = self.stats[current].backup_path
+            raise
+        except Exception as e:
+            self.status = "failed"
+            self.error = str(e)
+        finally:
+            self.finished_at = time.time()
+
+    def _cancelled_summary(self, stats: TranslationStats) -> str:
+        # Translations flushed by write-back are already in the catalog
+        if stats.keys_written:
+            summary = f"Cancelled after writing {stats.keys_written} translations to the catalog"
+        else:
+            summary = "Cancelled before writing"
+        if self.journal is not None:
+            return summary + "; completed chunks are journaled"
+        return summary if stats.keys_written else "Cancelled; no changes written for this language"
+
+    async def _create_journal(self) -> None:
+        directory = journal_dir()
+        if directory is None:
+            return
+        params = {
+            "file_path": os.path.abspath(self.file_path),
+            "languages": self.languages,
+            "mode": self.mode,
+            "source_language": self.source_language,
+            "app_description": self.app_description,
+            "retry_budget": self.retry_budget,
+        }
+        try:
+            self.journal = await asyncio.to_thread(JobJournal.create, directory, self.id, params)
+        except OSError as e:
+            # The job can still run, it just can't be resumed
+            print(f"Warning: Could not create job journal: {e}")
+
+    def status_report(self) -> str:
+        """
+        Format the job's overall and per-language progress.
+
+        Returns:
+            str: Multi-line status report for tool output
+        """
+        elapsed = (self.finished_at or time.time()) - self.created_at
+        lines = [
+            f"Job {self.id}: {self.status} ({elapsed:.1f}s elapsed)" + (" [resumed]" if self.resumed else ""),
+            f"File: {self.file_path}",
+            f"Mode: {self.mode}",
+        ]
+        if self.error:
+            lines.append(f"Error: {self.error}")
+        if self.done and self.journal is not None:
+            lines.append("Use resume_job_tool to finish this job without repeating completed chunks.")
+
+        for lang in self.languages:
+            stats = self.stats[lang]
+            lines.append(f"\n{lang}: {self.language_status[lang]}")
+            if stats.keys_total or self.language_status[lang] in ("running", "completed"):
+                lines.append(f"  Progress: {stats.progress()}")
+                lines.append(f"  Stats: {stats.summary()}")
+            if lang in self.language_summary:
+                lines.append(f"  Summary: {self.language_summary[lang]}")
+            if lang in self.backups:
+                lines.append(f"  Backup created: {self.backups[lang]}")
+
+        return "\n".join(lines)
+
+
+class JobManager:
+    """Registry of background translation jobs, keyed by job ID."""
+
+    def __init__(self, max_finished_jobs: int = _MAX_FINISHED_JOBS):
+        self.max_finished_jobs = max_finished_jobs
+        self._jobs: "OrderedDict[str, TranslationJob]" = OrderedDict()
+
+    def start(
+        self,
+        file_path: str,
+        languages: List[str],
+        mode: str = "missing",
+        source_language: str = "en",
+        app_description: Optional[str] = None,
+        retry_budget: Optional[int] = None
+    ) -> TranslationJob:
+        """
+        Create a job and schedule it on the running event loop.
+
+        Args:
+            file_path (str): Path to the .xcstrings file
+            languages (List[str]): Target language codes, translated in order
+            mode (str): "missing" to fill only untranslated keys, "all" to retranslate every key
+            source_language (str): Source language code (default: 'en')
+            app_description (Optional[str]): Optional description of the app for better translation context
+            retry_budget (Optional[int]): Retries allowed across all languages of the job (defaults to TRANSLATION_RETRY_BUDGET)
+
+        Returns:
+            TranslationJob: The scheduled job
+
+        Raises:
+            ValueError: If the mode is unknown
+        """
+        if mode not in JOB_MODES:
+            raise ValueError(f"Unknown job mode: {mode} (expected one of: {', '.join(JOB_MODES)})")
+
+        job = TranslationJob(file_path, languages, mode, source_language, app_description, retry_budget=retry_budget)
+        self._schedule(job)
+        return job
+
+    async def resume(self, job_id: str) -> TranslationJob:
+        """
+        Restart an interrupted job from its journal, replaying completed chunks.
+
+        Works for jobs that failed or were cancelled, and for jobs lost when the
+        server process stopped. Languages already applied are skipped and only
+        keys without a journaled translation are sent to the API.
+
+        Args:
+            job_id (str): ID of the job to resume
+
+        Returns:
+            TranslationJob: The rescheduled job
+
+        Raises:
+            ValueError: If the job is still running or journaling is disabled
+            FileNotFoundError: If the job left no journal behind
+        """
+        existing = self._jobs.get(job_id)
+        if existing is not None and not existing.done:
+            raise ValueError(f"Job {job_id} is still {existing.status}")
+
+        directory = journal_dir()
+        if directory is None:
+            raise ValueError("Job journal is disabled (TRANSLATION_JOURNAL_ENABLED=false)")
+
+        journal = await asyncio.to_thread(JobJournal.open, directory, job_id)
+        job = TranslationJob(**journal.params, job_id=job_id, journal=journal)
+        self._jobs.pop(job_id, None)
+        self._schedule(job)
+        return job
+
+    def get(self, job_id: str) -> Optional[TranslationJob]:
+        """Return the job with the given ID, or None if it's unknown or was pruned."""
+        return self._jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> Optional[TranslationJob]:
+        """
+        Cancel a running job, aborting its in-flight chunk requests.
+
+        Args:
+            job_id (str): Job ID returned when the job was started
+
+        Returns:
+            Optional[TranslationJob]: The job, or None if it's unknown
+        """
+        job = self._jobs.get(job_id)
+        if job is None or job.done or job.task is None:
+            return job
+        job.task.cancel()
+        if job.status == "pending":
+            # The task never started, so run() won't get to record the cancellation
+            job.status = "cancelled"
+            job.language_status = {lang: "cancelled" for lang in job.languages}
+            job.finished_at = time.time()
+        return job
+
+    def jobs(self) -> List[TranslationJob]:
+        """Return all known jobs, oldest first."""
+        return list(self._jobs.values())
+
+    async def shutdown(self) -> None:
+        """Cancel every unfinished job and wait for them to stop."""
+        tasks = [job.task for job in self._jobs.values() if job.task is not None and not job.task.done()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _schedule(self, job: TranslationJob) -> None:
+        job.task = asyncio.create_task(job.run())
+        # Retrieve the result so a cancelled job doesn't log "exception was never retrieved"
+        job.task.add_done_callback(lambda task: task.cancelled() or task.exception())
+        self._jobs[job.id] = job
+        self._prune()
+
+    def _prune(self) -> None:
+        finished = [job_id for job_id, job in self._jobs.items() if job.done]
+        for job_id in finished[:max(0, len(finished) - self.max_finished_jobs)]:
+            del self._jobs[job_id]
+
+
+# Global job manager used by the server tools
+job_manager = JobManager()
@@ -0,0 +1,198 @@
+"""Append-only on-disk journal of translation job results, used to resume interrupted jobs."""
+
+import json
+import os
+import re
+import threading
+from typing import Any, Dict, List, Optional, Set
+
+from settings import settings
+
+_JOB_ID_PATTERN = re.compile(r"[0-9a-f]+")
+
+
+def default_journal_dir() -> str:
+    """Return the default directory for translation job journals."""
+    return os.path.join(os.path.expanduser("~"), ".cache", "localizable-xcstrings-mcp", "journal")
+
+
+class JobJournal:
+    """
+    JSON-lines log of one job's parameters and per-chunk translations.
+
+    Every record is flushed and fsync'd before the call returns, so chunks
+    that were paid for survive a crash. A torn final line left by a crash is
+    ignored when the journal is read back.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self.params: Dict[str, Any] = {}
+        self._translations: Dict[str, Dict[str, str]] = {}
+        self._completed_languages: Set[str] = set()
+        if os.path.exists(path):
+            self._load()
+
+    @classmethod
+    def create(cls, directory: str, job_id: str, params: Dict[str, Any]) -> "JobJournal":
+        """
+        Start a new journal for a job.
+
+        Args:
+            directory (str): Directory holding journal files
+            job_id (str): Job ID
+            params (Dict[str, Any]): Job parameters needed to resume it
+
+        Returns:
+            JobJournal: The new journal
+        """
+        os.makedirs(directory, exist_ok=True)
+        journal = cls(journal_path(directory, job_id))
+        journal.params = dict(params)
+        journal._append({"type": "job", "job_id": job_id, **params})
+        return journal
+
+    @classmethod
+    def open(cls, directory: str, job_id: str) -> "JobJournal":
+        """
+        Open an existing job journal.
+
+        Args:
+            directory (str): Directory holding journal files
+            job_id (str): Job ID
+
+        Returns:
+            JobJournal: The journal with its recorded results loaded
+
+        Raises:
+            FileNotFoundError: If no journal exists for the job
+        """
+        path = journal_path(directory, job_id)
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"No journal found for job {job_id}")
+        return cls(path)
+
+    def language(self, language: str) -> "LanguageJournal":
+        """Return a view of the journal for one target language."""
+        return LanguageJournal(self, language)
+
+    def translations(self, language: str) -> Dict[str, str]:
+        """Return the translations recorded so far for a language."""
+        with self._lock:
+            return dict(self._translations.get(language, {}))
+
+    def completed_languages(self) -> Set[str]:
+        """Return the languages whose translations were written to the catalog."""
+        with self._lock:
+            return set(self._completed_languages)
+
+    def record_chunk(self, language: str, translations: Dict[str, str]) -> None:
+        """
+        Durably record the translations returned for one chunk.
+
+        Args:
+            language (str): Target language code
+            translations (Dict[str, str]): Translated key-value pairs
+        """
+        if not translations:
+            return
+        self._append({"type": "chunk", "language": language, "translations": translations})
+        with self._lock:
+            self._translations.setdefault(language, {}).update(translations)
+
+    def record_language_done(self, language: str) -> None:
+        """Record that a language's translations were written to the catalog."""
+        self._append({"type": "language_done", "language": language})
+        with self._lock:
+            self._completed_languages.add(language)
+
+    def delete(self) -> None:
+        """Remove the journal file once the job no longer needs it."""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with self._lock:
+            with open(self.path, "a+b") as f:
+                # Terminate a line torn by an earlier crash so this record stays readable
+                if f.tell() > 0:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b"\n":
+                        f.write(b"\n")
+                f.write(line.encode("utf-8"))
+                f.flush()
+                os.fsync(f.fileno())
+
+    def _load(self) -> None:
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # Partial record from a crash mid-append
+                    continue
+                kind = record.get("type")
+                if kind == "job":
+                    self.params = {key: value for key, value in record.items() if key not in ("type", "job_id")}
+                elif kind == "chunk":
+                    self._translations.setdefault(record["language"], {}).update(record["translations"])
+                elif kind == "language_done":
+                    self._completed_languages.add(record["language"])
+
+
+class LanguageJournal:
+    """A job journal bound to one target language, as passed to the translation pipeline."""
+
+    def __init__(self, journal: JobJournal, language: str):
+        self.journal = journal
+        self.language = language
+
+    def translations(self) -> Dict[str, str]:
+        """Return the translations recorded so far for this language."""
+        return self.journal.translations(self.language)
+
+    def record_chunk(self, translations: Dict[str, str]) -> None:
+        """Durably record the translations returned for one chunk."""
+        self.journal.record_chunk(self.language, translations)
+
+
+def journal_path(directory: str, job_id: str) -> str:
+    """
+    Return the journal file path for a job.
+
+    Args:
+        directory (str): Directory holding journal files
+        job_id (str): Job ID
+
+    Returns:
+        str: Path of the job's journal file
+
+    Raises:
+        ValueError: If the job ID is not a valid job ID
+    """
+    if not _JOB_ID_PATTERN.fullmatch(job_id):
+        raise ValueError(f"Invalid job ID: {job_id}")
+    return os.path.join(directory, f"{job_id}.jsonl")
+
+
+def journal_dir() -> Optional[str]:
+    """Return the configured journal directory, or None if journaling is disabled."""
+    if not settings.translation_journal_enabled:
+        return None
+    return settings.translation_journal_dir or default_journal_dir()
+
+
+def list_journaled_jobs() -> List[str]:
+    """Return the IDs of jobs that left a journal behind, e.g. after a crash."""
+    directory = journal_dir()
+    if directory is None or not os.path.isdir(directory):
+        return []
+    return sorted(
+        name[:-len(".jsonl")]
+        for name in os.listdir(directory)
+        if name.endswith(".jsonl") and _JOB_ID_PATTERN.fullmatch(name[:-len(".jsonl")])
+    )
@@ -0,0 +1,89 @@
+"""JSON parsing through orjson or msgspec when installed, with the stdlib as fallback."""
+
+import json
+import re
+from typing import Any, Callable, Dict, Optional, Union
+
+from settings import settings
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+# orjson turns integers outside the 64-bit range into floats; any run of this many
+# digits might be one, so such documents go to the stdlib, which keeps them exact
+_LONG_DIGIT_RUN = re.compile(r"\d{19}")
+_LONG_DIGIT_RUN_BYTES = re.compile(rb"\d{19}")
+
+
+def _stdlib_loads(data: Union[bytes, str]) -> Any:
+    return json.loads(data)
+
+
+def available_backends() -> Dict[str, Callable[[Union[bytes, str]], Any]]:
+    """Return the parse function of each installed backend, fastest first."""
+    backends: Dict[str, Callable[[Union[bytes, str]], Any]] = {}
+    if orjson is not None:
+        backends["orjson"] = orjson.loads
+    if msgspec is not None:
+        backends["msgspec"] = msgspec.json.Decoder().decode
+    backends["stdlib"] = _stdlib_loads
+    return backends
+
+
+def _select_backend(name: str) -> str:
+    backends = _BACKENDS
+    if name == "auto":
+        return next(iter(backends))
+    if name not in backends:
+        print(f"Warning: JSON backend '{name}' is unknown or not installed, using the standard library")
+        return "stdlib"
+    return name
+
+
+_BACKENDS = available_backends()
+
+# Name of the backend in use
+backend_name = _select_backend(settings.json_backend)
+_fast_loads: Optional[Callable[[Union[bytes, str]], Any]] = None if backend_name == "stdlib" else _BACKENDS[backend_name]
+
+
+def _may_lose_integers(data: Union[bytes, str]) -> bool:
+    if _fast_loads is not getattr(orjson, "loads", None):
+        return False
+    pattern = _LONG_DIGIT_RUN_BYTES if isinstance(data, (bytes, bytearray, memoryview)) else _LONG_DIGIT_RUN
+    return pattern.search(data) is not None
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Parse a JSON document with the fastest available backend.
+
+    Input the fast backend rejects is handed to ``json.loads``, so results
+    and errors are the same as with the standard library: documents it
+    accepts but the fast backend doesn't (such as NaN) still parse, and
+    invalid JSON raises ``json.JSONDecodeError``. Documents with integers
+    orjson would read as floats are parsed by the standard library too.
+
+    Args:
+        data (Union[bytes, str]): JSON text, as UTF-8 bytes or a string
+
+    Returns:
+        Any: Parsed document
+
+    Raises:
+        json.JSONDecodeError: If the data is not valid JSON
+    """
+    if _fast_loads is not None and not _may_lose_integers(data):
+        try:
+            return _fast_loads(data)
+        except Exception:
+            pass
+    return json.loads(data)
@@ -0,0 +1,79 @@
+"""Long-lived, pooled AsyncOpenAI clients shared across translation requests."""
+
+import asyncio
+import weakref
+
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+from settings import settings
+
+
+class OpenAIClientManager:
+    """
+    Hands out one pooled AsyncOpenAI client per event loop.
+
+    httpx connection pools are bound to the event loop that created them, so a
+    client is kept for each running loop and reused by every chunk and tool
+    call scheduled on it. Clients whose loop has been garbage collected are
+    dropped automatically.
+    """
+
+    def __init__(self):
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncOpenAI]" = weakref.WeakKeyDictionary()
+
+    def get_client(self) -> AsyncOpenAI:
+        """
+        Return the pooled client for the running event loop, creating it on first use.
+
+        Returns:
+            AsyncOpenAI: Shared client with keep-alive connection pooling
+        """
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None or client.is_closed():
+            client = self._create_client()
+            self._clients[loop] = client
+        return client
+
+    async def aclose(self) -> None:
+        """Close the client bound to the running event loop, if any."""
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.close()
+
+    def _create_client(self) -> AsyncOpenAI:
+        max_connections = settings.openai_max_connections or settings.translation_max_concurrent_chunks
+        http_client = DefaultAsyncHttpxClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+                keepalive_expiry=settings.openai_keepalive_expiry,
+            )
+        )
+        return AsyncOpenAI(
+            api_key=settings.openai_api_key,
+            base_url=settings.openai_base_url,
+            http_client=http_client,
+            # Retries are handled per job by RetryPolicy
+            max_retries=0,
+        )
+
+
+# Global client manager instance
+client_manager = OpenAIClientManager()
+
+
+def get_openai_client() -> AsyncOpenAI:
+    """
+    Return the shared AsyncOpenAI client for the running event loop.
+
+    Returns:
+        AsyncOpenAI: Pooled client
+    """
+    return client_manager.get_client()
+
+
+async def close_openai_client() -> None:
+    """Close the shared AsyncOpenAI client for the running event loop."""
+    await client_manager.aclose()
@@ -0,0 +1,189 @@
+"""Adaptive concurrency control and provider rate limiting for translation requests."""
+
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional
+
+import openai
+
+from settings import settings
+
+
+def is_overload_error(error: Exception) -> bool:
+    """
+    Return True if an API error means the provider is overloaded or rate limiting us.
+
+    Args:
+        error (Exception): Exception raised by the OpenAI client
+
+    Returns:
+        bool: True for 429, 5xx and timeout errors
+    """
+    if isinstance(error, (openai.RateLimitError, openai.APITimeoutError)):
+        return True
+    return isinstance(error, openai.APIStatusError) and error.status_code >= 500
+
+
+class AIMDLimiter:
+    """
+    Concurrency limiter using additive increase / multiplicative decrease.
+
+    The window grows by roughly one slot per window's worth of healthy
+    responses, and is cut by ``decrease_factor`` on 429, 5xx or timeout
+    errors. Only requests started after the last cut can trigger another
+    one, so a burst of failures from the same congestion event shrinks the
+    window once.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int,
+        min_limit: int,
+        max_limit: int,
+        latency_threshold: float,
+        decrease_factor: float = 0.5
+    ):
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.latency_threshold = latency_threshold
+        self.decrease_factor = decrease_factor
+        self._limit = float(min(max(initial_limit, self.min_limit), self.max_limit))
+        self._in_flight = 0
+        self._condition = asyncio.Condition()
+        self._last_decrease = 0.0
+        self.peak_window = self.window
+        self.decreases = 0
+        self.successes = 0
+        self.failures = 0
+
+    @property
+    def window(self) -> int:
+        """Current number of requests allowed in flight."""
+        return int(self._limit)
+
+    @asynccontextmanager
+    async def request(self) -> AsyncIterator[None]:
+        """
+        Hold a concurrency slot for one API request and feed its outcome back.
+
+        Raises:
+            Exception: Re-raises whatever the wrapped request raised
+        """
+        # Waiters are woken when a slot is released, which is also when the window changes
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self.window)
+            self._in_flight += 1
+
+        started = time.monotonic()
+        try:
+            yield
+        except Exception as e:
+            self._on_failure(e, started)
+            raise
+        else:
+            self._on_success(time.monotonic() - started)
+        finally:
+            async with self._condition:
+                self._in_flight -= 1
+                self._condition.notify_all()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return the current window and outcome counters.
+
+        Returns:
+            Dict[str, int]: Counters keyed by name
+        """
+        return {
+            "window": self.window,
+            "peak_window": self.peak_window,
+            "decreases": self.decreases,
+            "successes": self.successes,
+            "failures": self.failures,
+        }
+
+    def _on_success(self, latency: float) -> None:
+        self.successes += 1
+        if latency > self.latency_threshold:
+            # Slow but successful: hold the window steady
+            return
+        self._set_limit(self._limit + 1 / self._limit)
+
+    def _on_failure(self, error: Exception, started: float) -> None:
+        self.failures += 1
+        if not is_overload_error(error) or started < self._last_decrease:
+            return
+        self._last_decrease = time.monotonic()
+        self.decreases += 1
+        self._set_limit(self._limit * self.decrease_factor)
+
+    def _set_limit(self, limit: float) -> None:
+        previous = self.window
+        self._limit = min(max(limit, self.min_limit), self.max_limit)
+        if self.window != previous:
+            self.peak_window = max(self.peak_window, self.window)
+            print(f"Concurrency window: {previous} -> {self.window}")
+
+
+class TokenBucketLimiter:
+    """
+    Token buckets for a provider's requests-per-minute and tokens-per-minute limits.
+
+    Each bucket holds up to one minute of quota and refills continuously.
+    Callers reserve their cost up front and then sleep until the reservation
+    is covered, so waiters are served in order without holding a concurrency
+    slot. The limiter is safe to share between event loops and threads.
+    """
+
+    def __init__(self, requests_per_minute: Optional[int], tokens_per_minute: Optional[int]):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._requests = float(requests_per_minute or 0)
+        self._tokens = float(tokens_per_minute or 0)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self.waited_seconds = 0.0
+
+    async def acquire(self, tokens: int) -> None:
+        """
+        Wait until one request costing ``tokens`` fits within the limits.
+
+        Args:
+            tokens (int): Estimated total (input + output) tokens of the request
+        """
+        wait = self._reserve(tokens)
+        if wait > 0:
+            self.waited_seconds += wait
+            await asyncio.sleep(wait)
+
+    def _reserve(self, tokens: int) -> float:
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated
+            self._updated = now
+            wait = 0.0
+
+            if self.requests_per_minute:
+                rate = self.requests_per_minute / 60
+                self._requests = min(self.requests_per_minute, self._requests + elapsed * rate) - 1
+                if self._requests < 0:
+                    wait = max(wait, -self._requests / rate)
+
+            if self.tokens_per_minute:
+                rate = self.tokens_per_minute / 60
+                # A request larger than the whole bucket may go once the bucket is full
+                cost = min(tokens, self.tokens_per_minute)
+                self._tokens = min(self.tokens_per_minute, self._tokens + elapsed * rate) - cost
+                if self._tokens < 0:
+                    wait = max(wait, -self._tokens / rate)
+
+            return wait
+
+
+# Global provider rate limiter shared by every translation job
+provider_rate_limiter = TokenBucketLimiter(
+    settings.translation_requests_per_minute,
+    settings.translation_tokens_per_minute,
+)
@@ -0,0 +1,149 @@
+"""Retry policy with capped exponential backoff for translation requests."""
+
+import email.utils
+import random
+import re
+import time
+from typing import Optional
+
+import httpx
+import openai
+
+from rate_limiting import is_overload_error
+from settings import settings
+
+# Durations used by x-ratelimit-reset-* headers, e.g. "1s", "6m0s", "20ms", "1h2m3.5s"
+_DURATION_PATTERN = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 0.001}
+
+
+def parse_duration(value: str) -> Optional[float]:
+    """
+    Parse a rate-limit reset duration such as "6m0s" or "20ms" into seconds.
+
+    Args:
+        value (str): Header value
+
+    Returns:
+        Optional[float]: Duration in seconds, or None if the value can't be parsed
+    """
+    value = value.strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    parts = _DURATION_PATTERN.findall(value)
+    if not parts or "".join(number + unit for number, unit in parts) != value:
+        return None
+    return sum(float(number) * _DURATION_UNITS[unit] for number, unit in parts)
+
+
+def retry_after_from_headers(headers: httpx.Headers) -> Optional[float]:
+    """
+    Read how long the provider asked us to wait from response headers.
+
+    Honours ``retry-after-ms``, ``retry-after`` (seconds or HTTP date) and the
+    ``x-ratelimit-reset-requests`` / ``x-ratelimit-reset-tokens`` headers.
+
+    Args:
+        headers (httpx.Headers): Response headers
+
+    Returns:
+        Optional[float]: Seconds to wait, or None if no header says
+    """
+    if "retry-after-ms" in headers:
+        try:
+            return float(headers["retry-after-ms"]) / 1000
+        except ValueError:
+            pass
+
+    if "retry-after" in headers:
+        value = headers["retry-after"]
+        try:
+            return float(value)
+        except ValueError:
+            try:
+                retry_at = email.utils.parsedate_to_datetime(value)
+            except (TypeError, ValueError):
+                retry_at = None
+            if retry_at is not None:
+                return max(0.0, retry_at.timestamp() - time.time())
+
+    resets = [
+        parse_duration(headers[name])
+        for name in ("x-ratelimit-reset-requests", "x-ratelimit-reset-tokens")
+        if name in headers
+    ]
+    resets = [reset for reset in resets if reset is not None]
+    return max(resets) if resets else None
+
+
+def is_retryable_error(error: Exception) -> bool:
+    """Return True for transient errors worth retrying: 429, 5xx, timeouts and connection errors."""
+    return is_overload_error(error) or isinstance(error, openai.APIConnectionError)
+
+
+class RetryPolicy:
+    """
+    Capped exponential backoff with full jitter and a per-job retry budget.
+
+    Delays requested by the provider through ``Retry-After`` or rate-limit
+    reset headers take precedence over the computed backoff. Once the job's
+    budget of retries is spent, failures are no longer retried.
+    """
+
+    def __init__(self, max_attempts: int, base_delay: float, max_delay: float, budget: int):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.remaining_budget = budget
+
+    def next_delay(self, error: Exception, attempt: int) -> Optional[float]:
+        """
+        Decide whether to retry a failed request and how long to wait first.
+
+        Consumes one retry from the job budget when a retry is granted.
+
+        Args:
+            error (Exception): Error raised by the request
+            attempt (int): Number of attempts made so far (1 for the first failure)
+
+        Returns:
+            Optional[float]: Seconds to wait before retrying, or None to give up
+        """
+        if not is_retryable_error(error) or attempt >= self.max_attempts or self.remaining_budget <= 0:
+            return None
+
+        backoff = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+        requested = None
+        if isinstance(error, openai.APIStatusError):
+            requested = retry_after_from_headers(error.response.headers)
+
+        if requested is not None:
+            if requested > self.max_delay:
+                # Waiting that long would stall the job; report the chunk as failed instead
+                return None
+            delay = requested + backoff * 0.1
+        else:
+            delay = backoff
+
+        self.remaining_budget -= 1
+        return delay
+
+
+def create_retry_policy(budget: Optional[int] = None) -> RetryPolicy:
+    """
+    Create a retry policy from the translation settings.
+
+    Args:
+        budget (Optional[int]): Retries allowed for the whole job (defaults to TRANSLATION_RETRY_BUDGET)
+
+    Returns:
+        RetryPolicy: New policy with a fresh budget
+    """
+    return RetryPolicy(
+        max_attempts=settings.translation_max_attempts,
+        base_delay=settings.translation_retry_base_delay,
+        max_delay=settings.translation_retry_max_delay,
+        budget=settings.translation_retry_budget if budget is None else budget,
+    )
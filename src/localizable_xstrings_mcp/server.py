@@ -1,18 +1,99 @@
+import asyncio
 import logging
-
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional
+
+from catalog_cache import load_catalog
+from jobs import JOB_MODES, job_manager
+from journal import list_journaled_jobs
+from openai_client import close_openai_client
+from retry import create_retry_policy
+from translation_memory import translation_memory
+from translation_stats import TranslationStats
+from dedup import lookup_source_texts
+from eligibility import plan_translations
 from xcstrings_tools import (
+    catalog_keys,
+    catalog_languages,
     get_supported_languages,
     get_base_language_strings,
     extract_base_keys,
-    translate_strings,
-    translate_and_apply,
-    apply_missing_translations,
-    translate_single_key
+    translate_strings_async,
+    translate_and_apply_async,
+    apply_missing_translations_async,
+    translate_single_key_async,
+    apply_languages_async,
+    fill_all_missing_async,
+    record_plan
 )
-from utils import validate_xcstrings_file, validate_language_code, format_error_message
-from mcp.server.fastmcp import FastMCP
+from utils import validate_xcstrings_file, validate_language_code, validate_retry_budget, format_error_message
+from mcp.server.fastmcp import Context, FastMCP
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Cancel background jobs and close the pooled OpenAI client and translation memory on shutdown."""
+    try:
+        yield
+    finally:
+        await job_manager.shutdown()
+        await close_openai_client()
+        if translation_memory is not None:
+            translation_memory.close()
+
+
+mcp = FastMCP("xcstrings-mcp", lifespan=lifespan)
+
+
+def create_stats(ctx: Context = None) -> TranslationStats:
+    """
+    Create counters for one tool call that report key progress to the client.
+
+    Args:
+        ctx (Context): MCP request context; progress is only sent if the client supplied a progress token
+
+    Returns:
+        TranslationStats: New counters
+    """
+    if ctx is None:
+        return TranslationStats()
+
+    async def report(stats: TranslationStats) -> None:
+        await ctx.report_progress(stats.keys_done, stats.keys_total, stats.progress())
+
+    return TranslationStats(on_progress=report)
+
+
+def format_languages_result(
+    file_path: str,
+    translations: Dict[str, Dict[str, str]],
+    backup_path: str,
+    summaries: Dict[str, str],
+    skipped: Dict[str, Dict[str, str]],
+    stats: TranslationStats
+) -> str:
+    """Format the outcome of a multi-language apply for a tool response."""
+    total = sum(len(trans_dict) for trans_dict in translations.values())
+    result = [
+        f"Applied {total} translations across {len(translations)} language(s) to {file_path}",
+        f"Stats: {stats.summary()}",
+    ]
+
+    if backup_path:
+        result.append(f"Backup created: {backup_path}")
+
+    result.append("\nLanguages:")
+    for summary in summaries.values():
+        result.append(f"  {summary}")
+
+    if skipped:
+        result.append("\nSkipped strings:")
+        for lang, skipped_keys in skipped.items():
+            for key, reason in skipped_keys.items():
+                result.append(f"  {lang} {key}: {reason}")
+
+    return "\n".join(result)
 
-mcp = FastMCP("xcstrings-mcp")
 
 @mcp.tool()
 def get_languages_tool(file_path: str) -> str:
@@ -74,13 +155,14 @@ def get_base_strings_tool(file_path: str) -> str:
         return format_error_message(e, "Failed to get base language strings")
 
 @mcp.tool()
-def translate_tool(file_path: str, target_language: str) -> str:
+async def translate_tool(file_path: str, target_language: str, ctx: Context = None) -> str:
     """
     MCP tool to translate strings to target language and return translated keys.
 
     Args:
         file_path (str): Path to the .xcstrings file
         target_language (str): Target language code
+        ctx (Context): MCP request context, used to send progress notifications
 
     Returns:
         str: Translation result with translated keys or error message
@@ -93,16 +175,25 @@ def translate_tool(file_path: str, target_language: str) -> str:
             return f"Error: Invalid language code: {target_language}"
 
         # Get base keys
-        base_keys = get_base_language_strings(file_path)
+        data = await asyncio.to_thread(load_catalog, file_path)
+        base_keys = catalog_keys(data)
         if not base_keys:
             return "Error: No base language keys found"
 
-        # Translate
-        translated, skipped = translate_strings(base_keys, target_language)
+        # Translate, filling entries that need no translation locally
+        stats = create_stats(ctx)
+        source_texts = lookup_source_texts(base_keys, data['strings'], data.get('sourceLanguage', 'en'))
+        plan = plan_translations(base_keys, data['strings'], source_texts=source_texts)
+        record_plan(plan, stats)
+        translated, skipped = await translate_strings_async(
+            plan.translate, target_language, stats=stats, source_texts=source_texts
+        )
+        translated = {**plan.verbatim, **translated}
+        skipped = {**plan.skipped, **skipped}
         if not translated and not skipped:
             return "Error: Translation failed or returned no results"
 
-        result = []
+        result = [f"Stats: {stats.summary()}"]
         if translated:
             result.append(f"Translated {len(translated)} strings to {target_language}:")
             for key, value in translated.items():
@@ -118,7 +209,13 @@ def translate_tool(file_path: str, target_language: str) -> str:
         return format_error_message(e, "Translation failed")
 
 @mcp.tool()
-def apply_tool(file_path: str, target_language: str, app_description: str = "") -> str:
+async def apply_tool(
+    file_path: str,
+    target_language: str,
+    app_description: str = "",
+    retry_budget: Optional[int] = None,
+    ctx: Context = None
+) -> str:
     """
     MCP tool to translate and apply translations to xcstrings file.
 
@@ -126,6 +223,8 @@ def apply_tool(file_path: str, target_language: str, app_description: str = "")
         file_path (str): Path to the .xcstrings file
         target_language (str): Target language code
         app_description (str): Optional description of the app for better translation context
+        retry_budget (Optional[int]): Retries allowed across all requests of this call (defaults to TRANSLATION_RETRY_BUDGET)
+        ctx (Context): MCP request context, used to send progress notifications
 
     Returns:
         str: Application result with translated keys or error message
@@ -137,8 +236,14 @@ def apply_tool(file_path: str, target_language: str, app_description: str = "")
         if not validate_language_code(target_language):
             return f"Error: Invalid language code: {target_language}"
 
+        if not validate_retry_budget(retry_budget):
+            return f"Error: Invalid retry budget: {retry_budget} (expected a non-negative integer)"
+
+        # Load the catalog once and reuse it for the check and the translation
+        data = await asyncio.to_thread(load_catalog, file_path)
+
         # Check if target language already exists
-        supported_languages = get_supported_languages(file_path)
+        supported_languages = catalog_languages(data)
         
         if target_language in supported_languages:
             warning_msg = f"Warning: {target_language} translations already exist in this file.\n"
@@ -150,12 +255,17 @@ def apply_tool(file_path: str, target_language: str, app_description: str = "")
 
         # Translate and apply in one step
         app_desc = app_description if app_description else None
-        applied_translations, backup_path, summary, skipped_keys = translate_and_apply(file_path, target_language, app_description=app_desc)
+        stats = create_stats(ctx)
+        applied_translations, backup_path, summary, skipped_keys = await translate_and_apply_async(
+            file_path, target_language, app_description=app_desc, data=data, stats=stats,
+            retry_policy=create_retry_policy(retry_budget)
+        )
         if not applied_translations and not skipped_keys:
             return "Error: Translation failed or returned no results"
 
         result = [
             f"Summary: {summary}",
+            f"Stats: {stats.summary()}",
             f"Backup created: {backup_path}",
         ]
         
@@ -175,7 +285,13 @@ def apply_tool(file_path: str, target_language: str, app_description: str = "")
         return format_error_message(e, "Failed to apply translations")
 
 @mcp.tool()
-def apply_missing_tool(file_path: str, target_language: str, app_description: str = "") -> str:
+async def apply_missing_tool(
+    file_path: str,
+    target_language: str,
+    app_description: str = "",
+    retry_budget: Optional[int] = None,
+    ctx: Context = None
+) -> str:
     """
     MCP tool to apply only missing translations for a target language in xcstrings file.
     Only translates keys that don't already have translations in the target language.
@@ -184,6 +300,8 @@ def apply_missing_tool(file_path: str, target_language: str, app_description: st
         file_path (str): Path to the .xcstrings file
         target_language (str): Target language code
         app_description (str): Optional description of the app for better translation context
+        retry_budget (Optional[int]): Retries allowed across all requests of this call (defaults to TRANSLATION_RETRY_BUDGET)
+        ctx (Context): MCP request context, used to send progress notifications
 
     Returns:
         str: Application result with newly translated keys or error message
@@ -195,12 +313,20 @@ def apply_missing_tool(file_path: str, target_language: str, app_description: st
         if not validate_language_code(target_language):
             return f"Error: Invalid language code: {target_language}"
 
+        if not validate_retry_budget(retry_budget):
+            return f"Error: Invalid retry budget: {retry_budget} (expected a non-negative integer)"
+
         # Apply only missing translations
         app_desc = app_description if app_description else None
-        applied_translations, backup_path, summary, skipped_keys = apply_missing_translations(file_path, target_language, app_description=app_desc)
+        stats = create_stats(ctx)
+        applied_translations, backup_path, summary, skipped_keys = await apply_missing_translations_async(
+            file_path, target_language, app_description=app_desc, stats=stats,
+            retry_policy=create_retry_policy(retry_budget)
+        )
         
         result = [
             f"Summary: {summary}",
+            f"Stats: {stats.summary()}",
         ]
         
         if backup_path:
@@ -222,7 +348,7 @@ def apply_missing_tool(file_path: str, target_language: str, app_description: st
         return format_error_message(e, "Failed to apply missing translations")
 
 @mcp.tool()
-def translate_key_tool(file_path: str, key: str, target_languages: str, app_description: str = "") -> str:
+async def translate_key_tool(file_path: str, key: str, target_languages: str, app_description: str = "", ctx: Context = None) -> str:
     """
     MCP tool to translate a specific key to multiple target languages and apply translations.
 
@@ -231,6 +357,7 @@ def translate_key_tool(file_path: str, key: str, target_languages: str, app_desc
         key (str): The specific key to translate
         target_languages (str): Comma-separated list of target language codes (e.g., "es,fr,de")
         app_description (str): Optional description of the app for better translation context
+        ctx (Context): MCP request context, used to send progress notifications
 
     Returns:
         str: Translation results or error message
@@ -251,8 +378,9 @@ def translate_key_tool(file_path: str, key: str, target_languages: str, app_desc
 
         # Translate the key
         app_desc = app_description if app_description else None
-        translations, backup_path, errors = translate_single_key(
-            file_path, key, languages, app_description=app_desc
+        stats = create_stats(ctx)
+        translations, backup_path, errors = await translate_single_key_async(
+            file_path, key, languages, app_description=app_desc, stats=stats
         )
 
         if not translations and errors:
@@ -262,6 +390,7 @@ def translate_key_tool(file_path: str, key: str, target_languages: str, app_desc
 
         result = [
             f"Translated key '{key}' to {len(translations)} language(s)",
+            f"Stats: {stats.summary()}",
             f"Backup created: {backup_path}",
         ]
 
@@ -283,6 +412,225 @@ def translate_key_tool(file_path: str, key: str, target_languages: str, app_desc
     except Exception as e:
         return format_error_message(e, "Failed to translate key")
 
+@mcp.tool()
+async def apply_languages_tool(
+    file_path: str,
+    target_languages: str,
+    mode: str = "missing",
+    app_description: str = "",
+    retry_budget: Optional[int] = None,
+    ctx: Context = None
+) -> str:
+    """
+    MCP tool to translate an xcstrings file into several languages at once and apply them in one write.
+    All languages share one concurrency budget, and the file is backed up and written once.
+
+    Args:
+        file_path (str): Path to the .xcstrings file
+        target_languages (str): Comma-separated list of target language codes (e.g., "es,fr,de")
+        mode (str): "missing" to translate only missing keys, "all" to retranslate every key (default: "missing")
+        app_description (str): Optional description of the app for better translation context
+        retry_budget (Optional[int]): Retries allowed across all requests of this call (defaults to TRANSLATION_RETRY_BUDGET)
+        ctx (Context): MCP request context, used to send progress notifications
+
+    Returns:
+        str: Per-language results or error message
+    """
+    try:
+        if not validate_xcstrings_file(file_path):
+            return f"Error: Invalid file path or not an .xcstrings file: {file_path}"
+
+        if not validate_retry_budget(retry_budget):
+            return f"Error: Invalid retry budget: {retry_budget} (expected a non-negative integer)"
+
+        # Parse target languages, dropping duplicates
+        languages = list(dict.fromkeys(lang.strip() for lang in target_languages.split(',') if lang.strip()))
+        if not languages:
+            return "Error: No target languages provided"
+
+        # Validate all language codes
+        for lang in languages:
+            if not validate_language_code(lang):
+                return f"Error: Invalid language code: {lang}"
+
+        if mode not in JOB_MODES:
+            return f"Error: Invalid mode: {mode} (expected one of: {', '.join(JOB_MODES)})"
+
+        app_desc = app_description if app_description else None
+        stats = create_stats(ctx)
+        translations, backup_path, summaries, skipped = await apply_languages_async(
+            file_path, languages, app_description=app_desc, only_missing=(mode == "missing"), stats=stats,
+            retry_policy=create_retry_policy(retry_budget)
+        )
+        return format_languages_result(file_path, translations, backup_path, summaries, skipped, stats)
+
+    except Exception as e:
+        return format_error_message(e, "Failed to apply translations")
+
+@mcp.tool()
+async def fill_all_missing_tool(
+    file_path: str,
+    app_description: str = "",
+    retry_budget: Optional[int] = None,
+    ctx: Context = None
+) -> str:
+    """
+    MCP tool to fill the missing translations of every language already in an xcstrings file.
+    Missing keys are found for all languages in one scan, translated on one shared concurrency budget,
+    and written back once with a single backup.
+
+    Args:
+        file_path (str): Path to the .xcstrings file
+        app_description (str): Optional description of the app for better translation context
+        retry_budget (Optional[int]): Retries allowed across all requests of this call (defaults to TRANSLATION_RETRY_BUDGET)
+        ctx (Context): MCP request context, used to send progress notifications
+
+    Returns:
+        str: Per-language results or error message
+    """
+    try:
+        if not validate_xcstrings_file(file_path):
+            return f"Error: Invalid file path or not an .xcstrings file: {file_path}"
+
+        if not validate_retry_budget(retry_budget):
+            return f"Error: Invalid retry budget: {retry_budget} (expected a non-negative integer)"
+
+        app_desc = app_description if app_description else None
+        stats = create_stats(ctx)
+        translations, backup_path, summaries, skipped = await fill_all_missing_async(
+            file_path, app_description=app_desc, stats=stats, retry_policy=create_retry_policy(retry_budget)
+        )
+        if not summaries:
+            return f"No target languages found in {file_path}"
+        return format_languages_result(file_path, translations, backup_path, summaries, skipped, stats)
+
+    except Exception as e:
+        return format_error_message(e, "Failed to fill missing translations")
+
+@mcp.tool()
+async def start_translation_job_tool(
+    file_path: str,
+    target_languages: str,
+    mode: str = "missing",
+    app_description: str = "",
+    retry_budget: Optional[int] = None
+) -> str:
+    """
+    MCP tool to start a background translation job and return its job ID immediately.
+    Poll progress with job_status_tool and stop the job with cancel_job_tool.
+
+    Args:
+        file_path (str): Path to the .xcstrings file
+        target_languages (str): Comma-separated list of target language codes (e.g., "es,fr,de")
+        mode (str): "missing" to translate only missing keys, "all" to retranslate every key (default: "missing")
+        app_description (str): Optional description of the app for better translation context
+        retry_budget (Optional[int]): Retries allowed across all languages of the job (defaults to TRANSLATION_RETRY_BUDGET)
+
+    Returns:
+        str: Job ID or error message
+    """
+    try:
+        if not validate_xcstrings_file(file_path):
+            return f"Error: Invalid file path or not an .xcstrings file: {file_path}"
+
+        # Parse target languages
+        languages = [lang.strip() for lang in target_languages.split(',') if lang.strip()]
+        if not languages:
+            return "Error: No target languages provided"
+
+        # Validate all language codes
+        for lang in languages:
+            if not validate_language_code(lang):
+                return f"Error: Invalid language code: {lang}"
+
+        if mode not in JOB_MODES:
+            return f"Error: Invalid mode: {mode} (expected one of: {', '.join(JOB_MODES)})"
+
+        if not validate_retry_budget(retry_budget):
+            return f"Error: Invalid retry budget: {retry_budget} (expected a non-negative integer)"
+
+        app_desc = app_description if app_description else None
+        job = job_manager.start(file_path, languages, mode=mode, app_description=app_desc, retry_budget=retry_budget)
+        return (
+            f"Started translation job {job.id} for {', '.join(languages)} (mode: {mode})\n"
+            f"Use job_status_tool with job_id={job.id} to check progress."
+        )
+    except Exception as e:
+        return format_error_message(e, "Failed to start translation job")
+
+@mcp.tool()
+def job_status_tool(job_id: str) -> str:
+    """
+    MCP tool to report the progress of a background translation job.
+
+    Args:
+        job_id (str): Job ID returned by start_translation_job_tool
+
+    Returns:
+        str: Job status with per-language progress or error message
+    """
+    try:
+        job = job_manager.get(job_id)
+        if job is None:
+            return f"Error: Unknown job ID: {job_id}"
+        return job.status_report()
+    except Exception as e:
+        return format_error_message(e, "Failed to get job status")
+
+@mcp.tool()
+def cancel_job_tool(job_id: str) -> str:
+    """
+    MCP tool to cancel a background translation job.
+    Languages already applied keep their translations. For the language in progress, translations
+    already written back (see TRANSLATION_WRITE_BACK_CHUNKS) stay in the catalog and the job status
+    reports how many; the rest are not written.
+
+    Args:
+        job_id (str): Job ID returned by start_translation_job_tool
+
+    Returns:
+        str: Cancellation result or error message
+    """
+    try:
+        job = job_manager.get(job_id)
+        if job is None:
+            return f"Error: Unknown job ID: {job_id}"
+        if job.done:
+            return f"Job {job_id} already {job.status}"
+        job_manager.cancel(job_id)
+        return f"Cancellation requested for job {job_id}"
+    except Exception as e:
+        return format_error_message(e, "Failed to cancel job")
+
+@mcp.tool()
+async def resume_job_tool(job_id: str) -> str:
+    """
+    MCP tool to resume an interrupted background translation job from its on-disk journal.
+    Chunks translated before the interruption are replayed instead of being sent to the API again.
+
+    Args:
+        job_id (str): Job ID returned by start_translation_job_tool
+
+    Returns:
+        str: Resume result or error message
+    """
+    try:
+        job = await job_manager.resume(job_id)
+        return (
+            f"Resumed translation job {job.id} for {', '.join(job.languages)} (mode: {job.mode})\n"
+            f"Use job_status_tool with job_id={job.id} to check progress."
+        )
+    except FileNotFoundError:
+        resumable = list_journaled_jobs()
+        message = f"Error: No journal found for job {job_id}"
+        if resumable:
+            message += f"\nResumable jobs: {', '.join(resumable)}"
+        return message
+    except ValueError as e:
+        return f"Error: {str(e)}"
+    except Exception as e:
+        return format_error_message(e, "Failed to resume job")
+
 
 if __name__ == "__main__":
     logging.info("Starting localizable xcstrings mcp server")
@@ -38,19 +38,145 @@ class Settings(BaseSettings):
         description="Maximum number of strings per translation request"
     )
     
+    translation_min_chunk_size: int = Field(
+        default=1,
+        description="Smallest chunk a failed or truncated chunk is split down to"
+    )
+    
+    translation_max_key_attempts: int = Field(
+        default=3,
+        description="Maximum times a key missing from responses is sent again before it is skipped"
+    )
+    
+    translation_chunk_input_tokens: int = Field(
+        default=2000,
+        description="Estimated input token budget for the strings in one translation request"
+    )
+    
+    translation_chunk_output_tokens: int = Field(
+        default=4000,
+        description="Estimated output token budget for the translations in one translation request"
+    )
+    
+    translation_language_group_size: int = Field(
+        default=1,
+        description="Target languages requested together when translating several languages at once (1 sends one request per language)"
+    )
+    
     translation_temperature: float = Field(
         default=0.3,
         description="Temperature setting for translation model"
     )
     
     translation_max_concurrent_chunks: int = Field(
-        default=2,
+        default=8,
         description="Maximum number of concurrent translation chunks"
     )
     
-    translation_rate_limit_delay: float = Field(
+    translation_initial_concurrent_chunks: int = Field(
+        default=2,
+        description="Starting number of concurrent translation chunks before adaptive scaling"
+    )
+    
+    translation_latency_threshold: float = Field(
+        default=60.0,
+        description="Chunk latency in seconds above which concurrency stops growing"
+    )
+    
+    translation_max_attempts: int = Field(
+        default=5,
+        description="Maximum attempts per translation request, including the first"
+    )
+    
+    translation_retry_base_delay: float = Field(
         default=1.0,
-        description="Delay in seconds between translation requests"
+        description="Initial backoff delay in seconds before retrying a failed request"
+    )
+    
+    translation_retry_max_delay: float = Field(
+        default=60.0,
+        description="Maximum backoff delay in seconds; longer provider-requested waits fail the request"
+    )
+    
+    translation_retry_budget: int = Field(
+        default=50,
+        description="Maximum number of retries across all requests of one translation job"
+    )
+    
+    translation_requests_per_minute: Optional[int] = Field(
+        default=None,
+        description="Provider requests-per-minute limit to stay under (unlimited if unset)"
+    )
+    
+    translation_tokens_per_minute: Optional[int] = Field(
+        default=None,
+        description="Provider tokens-per-minute limit to stay under (unlimited if unset)"
+    )
+    
+    openai_max_connections: Optional[int] = Field(
+        default=None,
+        description="Connection pool size for the shared OpenAI client (defaults to translation_max_concurrent_chunks)"
+    )
+    
+    openai_keepalive_expiry: float = Field(
+        default=30.0,
+        description="Seconds an idle pooled connection to the OpenAI API is kept alive"
+    )
+    
+    # Translation Memory Configuration
+    translation_memory_enabled: bool = Field(
+        default=True,
+        description="Reuse previously paid-for translations from a local SQLite cache"
+    )
+    
+    translation_memory_path: Optional[str] = Field(
+        default=None,
+        description="Path of the translation memory database (defaults to ~/.cache/localizable-xcstrings-mcp/)"
+    )
+    
+    translation_memory_max_entries: int = Field(
+        default=200_000,
+        description="Maximum number of cached translations before least recently used entries are evicted"
+    )
+    
+    # Write-back Configuration
+    translation_write_back_chunks: int = Field(
+        default=0,
+        description="Write translations to the catalog after this many completed chunks instead of only at the end (0 disables)"
+    )
+    
+    translation_write_back_seconds: float = Field(
+        default=0.0,
+        description="Write translations to the catalog at most this many seconds apart while a job runs (0 disables)"
+    )
+    
+    # Job Journal Configuration
+    translation_journal_enabled: bool = Field(
+        default=True,
+        description="Journal each background job's chunk results to disk so interrupted jobs can be resumed"
+    )
+    
+    translation_journal_dir: Optional[str] = Field(
+        default=None,
+        description="Directory for job journals (defaults to ~/.cache/localizable-xcstrings-mcp/journal)"
+    )
+    
+    # Eligibility Configuration
+    translation_brand_names: str = Field(
+        default="",
+        description="Comma-separated brand and product names that are copied verbatim instead of translated"
+    )
+    
+    # JSON Configuration
+    json_backend: str = Field(
+        default="auto",
+        description="JSON parser for catalogs and API responses: auto, orjson, msgspec or stdlib (auto picks the fastest installed)"
+    )
+    
+    # Catalog Cache Configuration
+    catalog_cache_max_bytes: int = Field(
+        default=256 * 1024 * 1024,
+        description="Maximum total on-disk size of .xcstrings files kept parsed in memory"
     )
 
 
@@ -0,0 +1,35 @@
+"""Offline token estimation for translation payloads."""
+
+import math
+import re
+
+# Runs of letters/digits, runs of whitespace, or single punctuation characters,
+# which is roughly how BPE tokenizers split text
+_PIECE_PATTERN = re.compile(r"[^\W_]+|\s+|[\W_]", re.UNICODE)
+
+# Average number of ASCII characters per token inside a word
+_CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate how many tokens a model will count for a piece of text.
+
+    This is a dependency-free approximation of a BPE tokenizer: words cost one
+    token per four ASCII characters, non-ASCII characters cost one token each,
+    and every punctuation mark or whitespace run costs one token.
+
+    Args:
+        text (str): Text to estimate
+
+    Returns:
+        int: Estimated token count
+    """
+    tokens = 0
+    for piece in _PIECE_PATTERN.findall(text):
+        if piece[0].isalnum():
+            ascii_chars = sum(1 for c in piece if c.isascii())
+            tokens += math.ceil(ascii_chars / _CHARS_PER_TOKEN) + (len(piece) - ascii_chars)
+        else:
+            tokens += 1
+    return tokens
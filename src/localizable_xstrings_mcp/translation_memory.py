@@ -0,0 +1,233 @@
+"""Persistent translation memory backed by SQLite."""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, Optional
+
+from settings import settings
+
+# SQLite limits the number of bound parameters per statement
+_LOOKUP_BATCH_SIZE = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS translations (
+    source_text TEXT NOT NULL,
+    source_language TEXT NOT NULL,
+    target_language TEXT NOT NULL,
+    model TEXT NOT NULL,
+    prompt_version TEXT NOT NULL,
+    context_hash TEXT NOT NULL,
+    translation TEXT NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (source_language, target_language, model, prompt_version, context_hash, source_text)
+);
+CREATE INDEX IF NOT EXISTS translations_last_used ON translations (last_used);
+"""
+
+
+def default_translation_memory_path() -> str:
+    """Return the default location of the translation memory database."""
+    return os.path.join(os.path.expanduser("~"), ".cache", "localizable-xcstrings-mcp", "translation_memory.sqlite3")
+
+
+def context_hash(app_description: Optional[str]) -> str:
+    """Hash the app description so it can be part of the cache key."""
+    return hashlib.sha256((app_description or "").encode("utf-8")).hexdigest()[:16]
+
+
+class TranslationMemory:
+    """
+    Local cache of previously paid-for translations.
+
+    Entries are keyed by (source text, source language, target language, model,
+    prompt version, app description hash). The database runs in WAL mode so
+    concurrent readers are not blocked by writes, and the least recently used
+    entries are evicted once ``max_entries`` is exceeded. If the database
+    can't be opened or used, the memory turns itself off for the rest of the
+    process instead of failing translations.
+    """
+
+    def __init__(self, path: str, max_entries: int):
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        # Set once the database failed; lookups then find nothing and stores are dropped
+        self.enabled = True
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def lookup(
+        self,
+        texts: Iterable[str],
+        source_language: str,
+        target_language: str,
+        model: str,
+        prompt_version: str,
+        app_description: Optional[str] = None
+    ) -> Dict[str, str]:
+        """
+        Look up cached translations for source texts.
+
+        Args:
+            texts (Iterable[str]): Source texts to look up
+            source_language (str): Source language code
+            target_language (str): Target language code
+            model (str): Model the translations were produced with
+            prompt_version (str): Version of the translation prompt
+            app_description (Optional[str]): App description used as translation context
+
+        Returns:
+            Dict[str, str]: Cached translations for the texts that were found
+        """
+        texts = list(dict.fromkeys(texts))
+        found: Dict[str, str] = {}
+        key_prefix = (source_language, target_language, model, prompt_version, context_hash(app_description))
+
+        with self._lock:
+            if not self.enabled:
+                return {}
+            try:
+                connection = self._connect()
+                for i in range(0, len(texts), _LOOKUP_BATCH_SIZE):
+                    batch = texts[i:i + _LOOKUP_BATCH_SIZE]
+                    placeholders = ",".join("?" * len(batch))
+                    rows = connection.execute(
+                        "SELECT source_text, translation FROM translations "
+                        "WHERE source_language = ? AND target_language = ? AND model = ? "
+                        "AND prompt_version = ? AND context_hash = ? "
+                        f"AND source_text IN ({placeholders})",
+                        (*key_prefix, *batch),
+                    ).fetchall()
+                    found.update(rows)
+
+                if found:
+                    now = time.time()
+                    connection.executemany(
+                        "UPDATE translations SET last_used = ? "
+                        "WHERE source_language = ? AND target_language = ? AND model = ? "
+                        "AND prompt_version = ? AND context_hash = ? AND source_text = ?",
+                        [(now, *key_prefix, text) for text in found],
+                    )
+                    connection.commit()
+            except (OSError, sqlite3.Error) as e:
+                self._disable(e)
+                return {}
+
+            self.hits += len(found)
+            self.misses += len(texts) - len(found)
+        return found
+
+    def store(
+        self,
+        translations: Dict[str, str],
+        source_language: str,
+        target_language: str,
+        model: str,
+        prompt_version: str,
+        app_description: Optional[str] = None
+    ) -> None:
+        """
+        Store translations and evict the least recently used entries over the size cap.
+
+        Args:
+            translations (Dict[str, str]): Source text to translation pairs
+            source_language (str): Source language code
+            target_language (str): Target language code
+            model (str): Model the translations were produced with
+            prompt_version (str): Version of the translation prompt
+            app_description (Optional[str]): App description used as translation context
+        """
+        if not translations:
+            return
+
+        now = time.time()
+        key_prefix = (source_language, target_language, model, prompt_version, context_hash(app_description))
+        rows = [(text, *key_prefix, translation, now) for text, translation in translations.items()]
+
+        with self._lock:
+            if not self.enabled:
+                return
+            try:
+                connection = self._connect()
+                connection.executemany(
+                    "INSERT OR REPLACE INTO translations "
+                    "(source_text, source_language, target_language, model, prompt_version, context_hash, translation, last_used) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                self._evict(connection)
+                connection.commit()
+            except (OSError, sqlite3.Error) as e:
+                self._disable(e)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return hit/miss counters and the number of stored entries.
+
+        Returns:
+            Dict[str, int]: Counters keyed by name
+        """
+        with self._lock:
+            entries = 0
+            if self.enabled:
+                try:
+                    entries = self._connect().execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+                except (OSError, sqlite3.Error) as e:
+                    self._disable(e)
+            return {"hits": self.hits, "misses": self.misses, "entries": entries}
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(_SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    def _disable(self, error: Exception) -> None:
+        print(f"Warning: Translation memory at {self.path} is unavailable, continuing without it: {error}")
+        self.enabled = False
+        if self._connection is not None:
+            try:
+                self._connection.close()
+            except sqlite3.Error:
+                pass
+            self._connection = None
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        count = connection.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+        excess = count - self.max_entries
+        if excess > 0:
+            connection.execute(
+                "DELETE FROM translations WHERE rowid IN "
+                "(SELECT rowid FROM translations ORDER BY last_used LIMIT ?)",
+                (excess,),
+            )
+
+
+def _create_translation_memory() -> Optional[TranslationMemory]:
+    if not settings.translation_memory_enabled:
+        return None
+    return TranslationMemory(
+        settings.translation_memory_path or default_translation_memory_path(),
+        settings.translation_memory_max_entries,
+    )
+
+
+# Global translation memory instance (None when disabled)
+translation_memory = _create_translation_memory()
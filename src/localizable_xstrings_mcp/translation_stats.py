@@ -0,0 +1,118 @@
+"""Counters collected while running a translation job."""
+
+from typing import Awaitable, Callable, Optional
+
+
+class TranslationStats:
+    """Counters for one translation job, reported in tool summaries and job status."""
+
+    def __init__(self, on_progress: Optional[Callable[["TranslationStats"], Awaitable[None]]] = None):
+        # Called with these stats each time more keys are done, e.g. to notify the client
+        self.on_progress = on_progress
+
+        # Progress
+        self.keys_total = 0
+        self.keys_translated = 0
+        self.keys_skipped = 0
+        self.chunks_started = 0
+        self.chunks_done = 0
+
+        # Cost
+        self.api_requests = 0
+        self.retries = 0
+        self.retry_wait_seconds = 0.0
+        self.memory_hits = 0
+        self.memory_misses = 0
+        self.chunk_splits = 0
+        self.requeued_keys = 0
+        self.journal_replayed = 0
+        self.source_keys = 0
+        self.unique_texts = 0
+        self.planned_verbatim = 0
+        self.planned_skipped = 0
+        self.requests_saved = 0
+        self.tokens_saved = 0
+
+        # Write-back: translations already in the catalog while the job runs
+        self.keys_written = 0
+        self.backup_path = ""
+
+    def record_retry(self, delay: float) -> None:
+        """Record one retried request and the time waited before it."""
+        self.retries += 1
+        self.retry_wait_seconds += delay
+
+    def record_dedup(self, key_count: int, unique_count: int) -> None:
+        """Record keys that were reduced to fewer unique source texts before translation."""
+        self.source_keys += key_count
+        self.unique_texts += unique_count
+
+    def record_plan(self, verbatim: int, skipped: int, requests_saved: int, tokens_saved: int) -> None:
+        """Record entries the eligibility planner filled locally or skipped, and the API cost avoided."""
+        self.planned_verbatim += verbatim
+        self.planned_skipped += skipped
+        self.requests_saved += requests_saved
+        self.tokens_saved += tokens_saved
+
+    def record_write_back(self, keys_written: int, backup_path: str) -> None:
+        """Record how many translations have been written to the catalog so far, and the backup taken first."""
+        self.keys_written = keys_written
+        self.backup_path = backup_path
+
+    @property
+    def dedup_ratio(self) -> float:
+        """Keys per unique source text sent for translation (1.0 when nothing was shared)."""
+        return self.source_keys / self.unique_texts if self.unique_texts else 1.0
+
+    @property
+    def keys_done(self) -> int:
+        """Keys that are finished, either translated or skipped."""
+        return self.keys_translated + self.keys_skipped
+
+    async def report_progress(self) -> None:
+        """Pass the current progress to the ``on_progress`` callback, if any."""
+        if self.on_progress is None:
+            return
+        try:
+            await self.on_progress(self)
+        except Exception as e:
+            # Progress is informational; never fail a translation over it
+            print(f"Warning: Failed to report progress: {e}")
+
+    def progress(self) -> str:
+        """
+        Format key and chunk progress as a one-line summary.
+
+        Returns:
+            str: Progress line for job status output
+        """
+        return (
+            f"{self.keys_translated}/{self.keys_total} keys translated, "
+            f"{self.keys_skipped} skipped, "
+            f"{self.chunks_done}/{self.chunks_started} chunks done"
+        )
+
+    def summary(self) -> str:
+        """
+        Format the counters as a one-line summary.
+
+        Returns:
+            str: Summary line for tool output
+        """
+        return (
+            f"API requests: {self.api_requests}, "
+            f"retries: {self.retries} ({self.retry_wait_seconds:.1f}s waiting), "
+            f"chunk splits: {self.chunk_splits}, "
+            f"requeued keys: {self.requeued_keys}, "
+            f"translation memory hits: {self.memory_hits}, misses: {self.memory_misses}"
+            + (f", replayed from journal: {self.journal_replayed}" if self.journal_replayed else "")
+            + (
+                f", planner: {self.planned_verbatim} copied verbatim, {self.planned_skipped} skipped, "
+                f"~{self.requests_saved} requests and ~{self.tokens_saved} tokens saved"
+                if self.planned_verbatim or self.planned_skipped else ""
+            )
+            + (
+                f", deduplicated: {self.source_keys} keys to {self.unique_texts} unique texts ({self.dedup_ratio:.2f}x)"
+                if self.source_keys else ""
+            )
+        )
@@ -1,5 +1,9 @@
 import os
-from typing import Dict, Any
+import re
+from typing import Dict, Any, Optional
+
+# iOS format placeholders like %@, %lld, %d, %f, including positional ones like %1$@
+PLACEHOLDER_PATTERN = re.compile(r'%(?:\d+\$)?(?:@|lld|ld|d|f|s|u|i|o|x|X|e|E|g|G|c|C|p|a|A|F)')
 
 
 def validate_xcstrings_file(file_path: str) -> bool:
@@ -41,6 +45,21 @@ def validate_language_code(language_code: str) -> bool:
     return all(c.isalpha() or c == '-' for c in language_code)
 
 
+def validate_retry_budget(retry_budget: Optional[int]) -> bool:
+    """
+    Validate a per-job retry budget.
+    
+    Args:
+        retry_budget (Optional[int]): Retries allowed for the job, or None for the configured default
+        
+    Returns:
+        bool: True if the budget is omitted or a non-negative integer, False otherwise
+    """
+    if retry_budget is None:
+        return True
+    return isinstance(retry_budget, int) and not isinstance(retry_budget, bool) and retry_budget >= 0
+
+
 def format_error_message(error: Exception, context: str = "") -> str:
     """
     Format error messages consistently.
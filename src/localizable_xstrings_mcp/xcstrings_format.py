@@ -0,0 +1,152 @@
+"""Serializer that writes .xcstrings catalogs the way Xcode formats them."""
+
+import json
+import re
+from typing import IO, Any, Callable, Dict, List, Tuple
+
+# C-accelerated string escaping from the stdlib encoder (quotes, backslashes, control characters)
+_encode_basestring = getattr(json.encoder, "c_encode_basestring", None) or json.encoder.py_encode_basestring
+
+_DIGIT_RUNS = re.compile(r"(\d+)")
+
+# Number of buffered pieces written out at a time
+_FLUSH_PARTS = 8192
+
+# Key orders of dictionaries up to this size are remembered for the rest of the dump
+_CACHED_ORDER_MAX_KEYS = 16
+
+
+def catalog_sort_key(key: str) -> Tuple[str, str]:
+    """
+    Sort key matching the order Xcode writes catalog keys in.
+
+    Xcode sorts dictionary keys numerically ("Item 2" before "Item 10") and
+    case-insensitively, falling back to a plain comparison so the order is
+    always total.
+
+    Args:
+        key (str): Dictionary key
+
+    Returns:
+        Tuple[str, str]: Value to sort by
+    """
+    parts = []
+    for index, run in enumerate(_DIGIT_RUNS.split(key)):
+        if index % 2:
+            # A digit run sorts where its first digit would, then by numeric value:
+            # "0", the length of the number, then its digits
+            digits = str(int(run))
+            parts.append("0" + chr(len(digits)) + digits)
+        else:
+            parts.append(run.casefold())
+    return ("".join(parts), key)
+
+
+def encode_string(value: str) -> str:
+    """Encode a string as Xcode does: non-ASCII text kept as is, forward slashes escaped."""
+    return _encode_basestring(value).replace("/", "\\/")
+
+
+def _write_catalog(data: Any, write: Callable[[str], Any]) -> None:
+    parts: List[str] = []
+    append = parts.append
+    # Catalogs repeat the same few key sets ({"stringUnit"}, {"state", "value"}, language
+    # codes, ...) thousands of times, so their order and encoding is worked out once per dump
+    orders: Dict[Tuple[str, ...], List[Tuple[str, str]]] = {}
+    single_orders: Dict[str, List[Tuple[str, str]]] = {}
+
+    def key_order(value: Dict[str, Any]) -> List[Tuple[str, str]]:
+        if len(value) == 1:
+            # Common case, e.g. {"stringUnit": ...}: no tuple to build and nothing to sort
+            for key in value:
+                order = single_orders.get(key)
+                if order is None:
+                    order = single_orders[key] = [(key, encode_string(key) + " : ")]
+                return order
+        keys = tuple(value)
+        order = orders.get(keys) if len(keys) <= _CACHED_ORDER_MAX_KEYS else None
+        if order is None:
+            order = [(key, encode_string(key) + " : ") for key in sorted(keys, key=catalog_sort_key)]
+            if len(keys) <= _CACHED_ORDER_MAX_KEYS:
+                orders[keys] = order
+        return order
+
+    def encode_dict(value: Dict[str, Any], indent: str) -> None:
+        inner = indent + "  "
+        separator = "{\n" + inner
+        next_separator = ",\n" + inner
+        check_flush = len(indent) <= 2
+        for key, encoded_key in key_order(value):
+            item = value[key]
+            if isinstance(item, str):
+                append(separator + encoded_key + encode_string(item))
+            elif isinstance(item, dict) and item:
+                append(separator + encoded_key)
+                encode_dict(item, inner)
+            else:
+                append(separator + encoded_key)
+                encode(item, inner)
+            separator = next_separator
+            if check_flush and len(parts) >= _FLUSH_PARTS:
+                write("".join(parts))
+                parts.clear()
+        append("\n" + indent + "}")
+
+    def encode(value: Any, indent: str) -> None:
+        if isinstance(value, str):
+            append(encode_string(value))
+        elif isinstance(value, dict):
+            if value:
+                encode_dict(value, indent)
+            else:
+                append("{\n\n" + indent + "}")
+        elif isinstance(value, (list, tuple)):
+            if not value:
+                append("[\n\n" + indent + "]")
+                return
+            inner = indent + "  "
+            append("[\n")
+            separator = inner
+            for item in value:
+                append(separator)
+                separator = ",\n" + inner
+                encode(item, inner)
+            append("\n" + indent + "]")
+        else:
+            # true / false / null and numbers
+            append(json.dumps(value))
+
+    encode(data, "")
+    if parts:
+        write("".join(parts))
+
+
+def dump_catalog(data: Any, f: IO[str]) -> None:
+    """
+    Write a catalog to a text stream in Xcode's format.
+
+    Matches what Xcode itself writes, so applying translations doesn't turn
+    into a whole-file diff: two-space indentation, ``"key" : value``
+    separators, keys in Xcode's sort order and escaped forward slashes.
+    Output is written in large pieces rather than token by token.
+
+    Args:
+        data (Any): Parsed .xcstrings document
+        f (IO[str]): Text stream to write to
+    """
+    _write_catalog(data, f.write)
+
+
+def dumps_catalog(data: Any) -> str:
+    """
+    Serialize a catalog to a string in Xcode's format.
+
+    Args:
+        data (Any): Parsed .xcstrings document
+
+    Returns:
+        str: Catalog text
+    """
+    chunks: List[str] = []
+    _write_catalog(data, chunks.append)
+    return "".join(chunks)
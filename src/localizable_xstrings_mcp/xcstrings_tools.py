@@ -1,45 +1,60 @@
 import json
 import os
 import asyncio
+import hashlib
 import shutil
+import time
+import weakref
+from collections import deque
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Tuple
-from openai import AsyncOpenAI
+from typing import Awaitable, Callable, Dict, Iterator, List, Optional, Any, Tuple
+from openai import APITimeoutError
 from concurrent.futures import ThreadPoolExecutor
 
 from settings import settings
+from atomic_write import atomic_write
+from catalog_cache import catalog_cache, load_catalog
+from chunking import chunk_by_token_budget, estimate_entry_cost, top_up_chunk
+from dedup import SourceTextGroups, lookup_source_texts
+from eligibility import TranslationPlan, plan_translations
+import json_backend
+from journal import LanguageJournal
+from openai_client import close_openai_client, get_openai_client
+from rate_limiting import AIMDLimiter, provider_rate_limiter
+from retry import RetryPolicy, create_retry_policy
+from tokens import estimate_tokens
+from translation_memory import translation_memory
+from translation_stats import TranslationStats
+from utils import PLACEHOLDER_PATTERN
+from xcstrings_format import dump_catalog
+
+try:
+    import fcntl
+except ImportError:
+    # Not available on Windows; writes are then only coordinated within this process
+    fcntl = None
+
+# Bump whenever the translation prompt changes so cached translations are not reused
+TRANSLATION_PROMPT_VERSION = "2"
 
 
 def extract_placeholders(text: str) -> List[str]:
     """Extract iOS placeholders from a string."""
-    import re
-    # Match iOS placeholders like %@, %lld, %d, %f, etc.
-    # Also match positional ones like %1$@ to detect unwanted modifications
-    pattern = r'%(?:\d+\$)?(?:@|lld|ld|d|f|s|u|i|o|x|X|e|E|g|G|c|C|p|a|A|F)'
-    return re.findall(pattern, text)
+    # Positional placeholders like %1$@ are matched too, to detect unwanted modifications
+    return PLACEHOLDER_PATTERN.findall(text)
 
 
-def get_supported_languages(file_path: str) -> List[str]:
+def catalog_languages(data: Dict[str, Any]) -> List[str]:
     """
-    Extract supported language codes from a Localizable.xcstrings file.
+    Extract supported language codes from an already-loaded catalog.
     
     Args:
-        file_path (str): Path to the .xcstrings file
+        data (Dict[str, Any]): Parsed .xcstrings document
         
     Returns:
-        List[str]: List of supported language codes
-        
-    Raises:
-        FileNotFoundError: If the file doesn't exist
-        json.JSONDecodeError: If the file is not valid JSON
-        KeyError: If the file doesn't have the expected structure
+        List[str]: Sorted list of supported language codes
     """
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"File not found: {file_path}")
-    
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
     languages = set()
     
     # Add source language
@@ -55,6 +70,91 @@ def get_supported_languages(file_path: str) -> List[str]:
     return sorted(list(languages))
 
 
+def catalog_keys(data: Dict[str, Any]) -> List[str]:
+    """
+    Extract all string keys from an already-loaded catalog.
+    
+    Args:
+        data (Dict[str, Any]): Parsed .xcstrings document
+        
+    Returns:
+        List[str]: List of all string keys
+    """
+    if 'strings' not in data:
+        return []
+    
+    return list(data['strings'].keys())
+
+
+def missing_keys_by_language(data: Dict[str, Any], languages: Optional[List[str]] = None) -> Dict[str, List[str]]:
+    """
+    Find the keys without a translation in each language in one pass over the catalog.
+    
+    Args:
+        data (Dict[str, Any]): Parsed .xcstrings document
+        languages (Optional[List[str]]): Languages to check; every language in the catalog except the source language if omitted
+        
+    Returns:
+        Dict[str, List[str]]: Keys missing a translation, in catalog order, by language
+    """
+    strings = data.get('strings', {})
+    source_language = data.get('sourceLanguage')
+    discover = languages is None
+    missing: Dict[str, List[str]] = {} if discover else {lang: [] for lang in languages}
+    seen_keys: List[str] = []
+    
+    for key, value in strings.items():
+        localizations = value.get('localizations', {})
+        if discover:
+            for lang in localizations:
+                if lang not in missing and lang != source_language:
+                    # None of the keys before the first one with this language have it
+                    missing[lang] = list(seen_keys)
+        for lang, keys in missing.items():
+            if lang not in localizations:
+                keys.append(key)
+        seen_keys.append(key)
+    
+    if discover:
+        return {lang: missing[lang] for lang in sorted(missing)}
+    return missing
+
+
+def record_plan(plan: TranslationPlan, stats: Optional[TranslationStats], label: str = "") -> None:
+    """Log a translation plan and add the work it saved to the job's counters."""
+    if not plan.verbatim and not plan.skipped:
+        return
+    requests_saved, tokens_saved = plan.savings()
+    print(
+        f"Planner{' (' + label + ')' if label else ''}: {len(plan.translate)} to translate, "
+        f"{len(plan.verbatim)} copied verbatim, {len(plan.skipped)} skipped "
+        f"(~{requests_saved} requests, ~{tokens_saved} tokens saved)"
+    )
+    if stats is not None:
+        stats.record_plan(len(plan.verbatim), len(plan.skipped), requests_saved, tokens_saved)
+
+
+def get_supported_languages(file_path: str) -> List[str]:
+    """
+    Extract supported language codes from a Localizable.xcstrings file.
+    
+    Args:
+        file_path (str): Path to the .xcstrings file
+        
+    Returns:
+        List[str]: List of supported language codes
+        
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        json.JSONDecodeError: If the file is not valid JSON
+        KeyError: If the file doesn't have the expected structure
+    """
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"File not found: {file_path}")
+    
+    return catalog_languages(load_catalog(file_path))
+
+
 def extract_base_keys(file_path: str) -> List[str]:
     """
     Extract all string keys from a Localizable.xcstrings file.
@@ -73,13 +173,7 @@ def extract_base_keys(file_path: str) -> List[str]:
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"File not found: {file_path}")
     
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    if 'strings' not in data:
-        return []
-    
-    return list(data['strings'].keys())
+    return catalog_keys(load_catalog(file_path))
 
 
 def get_base_language_strings(file_path: str) -> List[str]:
@@ -100,77 +194,565 @@ def get_base_language_strings(file_path: str) -> List[str]:
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"File not found: {file_path}")
     
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    return catalog_keys(load_catalog(file_path))
 
-    if 'strings' not in data:
-        return []
+
+def apply_translations_to_catalog(
+    data: Dict[str, Any],
+    target_language: str,
+    translations: Dict[str, str]
+) -> Dict[str, Any]:
+    """
+    Return a copy of a catalog with translations set for a target language.
+    
+    Only the containers along modified paths are copied, so the input document
+    (which may be shared through the catalog cache) is never mutated.
+    
+    Args:
+        data (Dict[str, Any]): Parsed .xcstrings document
+        target_language (str): Target language code
+        translations (Dict[str, str]): Translated key-value pairs to apply
         
-    return list(data['strings'].keys())
+    Returns:
+        Dict[str, Any]: Updated document
+    """
+    updated = dict(data)
+    strings = dict(data.get('strings', {}))
+    updated['strings'] = strings
+    
+    for key, value in translations.items():
+        entry = dict(strings.get(key, {}))
+        localizations = dict(entry.get('localizations', {}))
+        localizations[target_language] = {
+            "stringUnit": {
+                "state": "translated",
+                "value": value
+            }
+        }
+        entry['localizations'] = localizations
+        strings[key] = entry
+    
+    return updated
+
+
+def create_backup(file_path: str) -> str:
+    """
+    Create a timestamped backup of a catalog before modifying it.
+    
+    The backup is an independent copy with the original's metadata, so
+    nothing done to the catalog afterwards, in place or not, can change it.
+    
+    Args:
+        file_path (str): Path to the .xcstrings file
+        
+    Returns:
+        str: Path of the backup file
+        
+    Raises:
+        Exception: If the backup cannot be created
+    """
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    backup_path = f"{file_path}.bak.{timestamp}"
+    # Don't overwrite a backup taken earlier in the same second
+    suffix = 1
+    while os.path.lexists(backup_path):
+        backup_path = f"{file_path}.bak.{timestamp}_{suffix}"
+        suffix += 1
+    try:
+        shutil.copy2(file_path, backup_path)
+        print(f"Created backup: {backup_path}")
+    except Exception as e:
+        raise Exception(f"Failed to create backup: {str(e)}")
+    return backup_path
+
+
+def write_catalog(file_path: str, data: Dict[str, Any]) -> None:
+    """
+    Write a catalog back to disk and prime the catalog cache with it.
+    
+    The file is written in Xcode's own format, so only changed entries show up
+    in diffs, and replaced atomically, so readers such as Xcode or the catalog
+    cache never see a partially written catalog, even if the process dies
+    mid-write.
+    
+    Args:
+        file_path (str): Path to the .xcstrings file
+        data (Dict[str, Any]): Document to write
+        
+    Raises:
+        Exception: If the file cannot be written
+    """
+    try:
+        atomic_write(file_path, lambda f: dump_catalog(data, f))
+    except Exception as e:
+        catalog_cache.invalidate(file_path)
+        raise Exception(f"Failed to write file: {str(e)}")
+    catalog_cache.put(file_path, data)
 
 
+def default_lock_dir() -> str:
+    """Return the directory holding the advisory lock files for catalog writes."""
+    return os.path.join(os.path.expanduser("~"), ".cache", "localizable-xcstrings-mcp", "locks")
 
-async def translate_chunk_async(
+
+@contextmanager
+def catalog_file_lock(file_path: str) -> Iterator[None]:
+    """
+    Hold an exclusive advisory lock on a catalog across processes.
+    
+    The lock is taken on a separate lock file, because atomic writes replace
+    the catalog's inode and a lock on the catalog itself would not carry over.
+    Lock files live in a cache directory so they don't clutter the project.
+    If the lock file can't be created, e.g. because the home directory is
+    read-only, writes are only coordinated within this process.
+    
+    Args:
+        file_path (str): Path to the .xcstrings file
+    """
+    if fcntl is None:
+        yield
+        return
+    
+    name = hashlib.sha256(os.path.realpath(file_path).encode("utf-8")).hexdigest()[:32]
+    try:
+        lock_dir = default_lock_dir()
+        os.makedirs(lock_dir, exist_ok=True)
+        lock_file = open(os.path.join(lock_dir, f"{name}.lock"), 'a')
+    except OSError as e:
+        print(f"Warning: Could not open catalog lock file, not locking against other processes: {e}")
+        yield
+        return
+    with lock_file:
+        try:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        except OSError as e:
+            print(f"Warning: Could not lock {lock_file.name}, not locking against other processes: {e}")
+            yield
+            return
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+class _CatalogUpdate:
+    """One caller's pending translations for a catalog, waiting to be written."""
+    
+    def __init__(self, file_path: str, updates: Dict[str, Dict[str, str]], backup: bool, future: asyncio.Future):
+        self.file_path = file_path
+        self.updates = updates
+        self.backup = backup
+        self.future = future
+
+
+class CatalogWriteCoordinator:
+    """
+    Serialise and merge writes to each catalog file.
+    
+    Every file gets an actor task on the event loop that drains its queue of
+    pending updates. Updates that arrive while a write is in progress are
+    merged into the next one, so concurrent jobs for different languages cost
+    a single read-modify-write rather than one full rewrite each. Each write
+    re-reads the current file under an ``fcntl`` lock and applies only the
+    queued translations, so no caller overwrites another's work, whether the
+    other caller is in this process or another one.
+    """
+    
+    def __init__(self):
+        self._queues: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, List[_CatalogUpdate]]]" = weakref.WeakKeyDictionary()
+        self._actors: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Task]]" = weakref.WeakKeyDictionary()
+        self.writes = 0
+        self.merged_updates = 0
+    
+    async def update(self, file_path: str, updates: Dict[str, Dict[str, str]], backup: bool = False) -> str:
+        """
+        Apply translations to a catalog file, merged with other pending updates.
+        
+        Args:
+            file_path (str): Path to the .xcstrings file
+            updates (Dict[str, Dict[str, str]]): Translated key-value pairs by target language
+            backup (bool): Back up the file before writing these updates
+            
+        Returns:
+            str: Path of the backup created for this update, or "" if none was requested
+            
+        Raises:
+            Exception: If the file cannot be read or written
+        """
+        loop = asyncio.get_running_loop()
+        real_path = os.path.realpath(file_path)
+        queues = self._queues.setdefault(loop, {})
+        actors = self._actors.setdefault(loop, {})
+        
+        future = loop.create_future()
+        queues.setdefault(real_path, []).append(_CatalogUpdate(file_path, updates, backup, future))
+        actor = actors.get(real_path)
+        if actor is None or actor.done():
+            actors[real_path] = asyncio.create_task(self._run_actor(queues, real_path))
+        return await future
+    
+    async def _run_actor(self, queues: Dict[str, List[_CatalogUpdate]], real_path: str) -> None:
+        while queues.get(real_path):
+            batch = [update for update in queues.pop(real_path) if not update.future.cancelled()]
+            if not batch:
+                continue
+            try:
+                backup_path = await asyncio.to_thread(self._write_batch, real_path, batch)
+            except Exception as e:
+                for update in batch:
+                    if not update.future.done():
+                        update.future.set_exception(e)
+            else:
+                for update in batch:
+                    if not update.future.done():
+                        update.future.set_result(backup_path if update.backup else "")
+    
+    def _write_batch(self, real_path: str, batch: List[_CatalogUpdate]) -> str:
+        merged: Dict[str, Dict[str, str]] = {}
+        for update in batch:
+            for language, translations in update.updates.items():
+                merged.setdefault(language, {}).update(translations)
+        
+        with catalog_file_lock(real_path):
+            # Start from the file as it is now, not from the caller's snapshot
+            data = load_catalog(real_path)
+            strings = data.get('strings', {})
+            
+            backup_path = ""
+            if any(update.backup for update in batch):
+                backup_path = create_backup(next(update.file_path for update in batch if update.backup))
+            
+            for language, translations in merged.items():
+                # Keys removed from the catalog in the meantime stay removed
+                present = {key: value for key, value in translations.items() if key in strings}
+                data = apply_translations_to_catalog(data, language, present)
+            write_catalog(real_path, data)
+        
+        self.writes += 1
+        self.merged_updates += len(batch)
+        if len(batch) > 1:
+            print(f"Merged {len(batch)} pending updates into one write of {real_path}")
+        return backup_path
+
+
+# Global write coordinator used by every catalog write path
+catalog_writer = CatalogWriteCoordinator()
+
+
+class IncrementalCatalogWriter:
+    """
+    Write a language's translations to a catalog while the job is running.
+    
+    Chunk results are coalesced in memory and flushed every
+    ``TRANSLATION_WRITE_BACK_CHUNKS`` chunks or ``TRANSLATION_WRITE_BACK_SECONDS``
+    seconds, whichever comes first, so partial progress shows up in Xcode
+    and survives an interrupted job. Each flush hands the translations added
+    since the last one to the write coordinator, and a backup of the original
+    file is taken before the first write.
+    """
+    
+    def __init__(
+        self,
+        file_path: str,
+        target_language: str,
+        every_chunks: Optional[int] = None,
+        every_seconds: Optional[float] = None,
+        stats: Optional[TranslationStats] = None
+    ):
+        self.file_path = file_path
+        self.target_language = target_language
+        self.every_chunks = settings.translation_write_back_chunks if every_chunks is None else every_chunks
+        self.every_seconds = settings.translation_write_back_seconds if every_seconds is None else every_seconds
+        self.backup_path = ""
+        self.flushes = 0
+        # Counters for the job, updated with what has been written so far
+        self.stats = stats
+        self._written: Dict[str, str] = {}
+        self._pending: Dict[str, str] = {}
+        self._pending_chunks = 0
+        self._last_flush = time.monotonic()
+    
+    @property
+    def enabled(self) -> bool:
+        """True if translations are written back before the job finishes."""
+        return self.every_chunks > 0 or self.every_seconds > 0
+    
+    async def add(self, translations: Dict[str, str]) -> None:
+        """
+        Queue one chunk's translations and flush if a threshold is reached.
+        
+        Args:
+            translations (Dict[str, str]): Translated key-value pairs from one chunk
+        """
+        self._pending.update(translations)
+        self._pending_chunks += 1
+        due_by_chunks = self.every_chunks > 0 and self._pending_chunks >= self.every_chunks
+        due_by_time = self.every_seconds > 0 and time.monotonic() - self._last_flush >= self.every_seconds
+        if self._pending and (due_by_chunks or due_by_time):
+            await self.flush()
+    
+    async def flush(self) -> None:
+        """Write the translations queued since the last flush to the catalog."""
+        if not self._pending:
+            return
+        await self._write(self._pending)
+        written = {**self._written, **self._pending}
+        self._written = written
+        self._pending = {}
+        self._pending_chunks = 0
+        self.flushes += 1
+        if self.stats is not None:
+            self.stats.record_write_back(len(written), self.backup_path)
+        print(f"Wrote {len(written)} {self.target_language} translations to {self.file_path} so far")
+    
+    async def write(self, translations: Dict[str, str]) -> str:
+        """
+        Write the final set of translations to the catalog.
+        
+        Args:
+            translations (Dict[str, str]): All translated key-value pairs for the language
+            
+        Returns:
+            str: Path of the backup taken before the first write
+        """
+        unwritten = {key: value for key, value in translations.items() if self._written.get(key) != value}
+        if not unwritten:
+            # Everything was already flushed
+            return self.backup_path
+        await self._write(unwritten)
+        self._written = dict(translations)
+        self._pending = {}
+        if self.stats is not None:
+            self.stats.record_write_back(len(self._written), self.backup_path)
+        return self.backup_path
+    
+    async def _write(self, translations: Dict[str, str]) -> None:
+        self._last_flush = time.monotonic()
+        backup_path = await catalog_writer.update(
+            self.file_path, {self.target_language: translations}, backup=not self.backup_path
+        )
+        self.backup_path = self.backup_path or backup_path
+
+
+
+def encode_chunk_payload(strings_chunk: Dict[str, str]) -> Tuple[str, Dict[str, str]]:
+    """
+    Encode a chunk for the prompt as compact JSON keyed by short numeric IDs.
+    
+    Args:
+        strings_chunk (Dict[str, str]): Chunk of key-value pairs to translate
+        
+    Returns:
+        Tuple[str, Dict[str, str]]: Tuple of (JSON payload mapping IDs to source text, mapping of IDs back to keys)
+    """
+    id_to_key = {str(i): key for i, key in enumerate(strings_chunk, 1)}
+    payload = {id_: strings_chunk[key] for id_, key in id_to_key.items()}
+    return json.dumps(payload, ensure_ascii=False, separators=(',', ':')), id_to_key
+
+
+def decode_chunk_response(
+    translated_json: Dict[str, Any],
     strings_chunk: Dict[str, str],
-    target_language: str,
-    source_language: str = "en",
-    app_description: Optional[str] = None
+    id_to_key: Dict[str, str]
 ) -> Dict[str, str]:
     """
-    Translate a chunk of strings asynchronously using OpenRouter API.
+    Map a model response keyed by numeric IDs back to the original keys.
     
     Args:
-        strings_chunk (Dict[str, str]): Chunk of key-value pairs to translate
-        target_language (str): Target language code
-        source_language (str): Source language code
-        app_description (Optional[str]): Optional description of the app for better translation context
+        translated_json (Dict[str, Any]): Parsed model response
+        strings_chunk (Dict[str, str]): Chunk of key-value pairs that was sent
+        id_to_key (Dict[str, str]): Mapping of IDs back to keys from encode_chunk_payload
         
     Returns:
         Dict[str, str]: Dictionary of translated key-value pairs
     """
-    if not strings_chunk:
-        return {}
+    translated_chunk = {}
     
-    client = AsyncOpenAI(
-        api_key=settings.openai_api_key,
-        base_url=settings.openai_base_url,
-    )
+    # Ensure we only include keys that were in the original chunk
+    for id_, value in translated_json.items():
+        key = id_to_key.get(id_)
+        if key is None or not isinstance(value, str):
+            print(f"Warning: Unexpected key in response: {id_}")
+            continue
+        
+        # Check if placeholders were preserved correctly
+        original_placeholders = extract_placeholders(strings_chunk[key])
+        translated_placeholders = extract_placeholders(value)
+        
+        if original_placeholders != translated_placeholders:
+            print(f"Warning: Placeholders modified in '{key}':")
+            print(f"  Original: {original_placeholders}")
+            print(f"  Translated: {translated_placeholders}")
+        
+        translated_chunk[key] = value
     
-    # Prepare the translation request
-    print(f"Processing chunk with {len(strings_chunk)} strings")
+    return translated_chunk
+
+
+def decode_multi_target_response(
+    translated_json: Dict[str, Any],
+    strings_chunk: Dict[str, str],
+    id_to_key: Dict[str, str],
+    target_languages: List[str]
+) -> Dict[str, Dict[str, str]]:
+    """
+    Split a multi-language model response into per-language translations.
     
-    # Convert strings to JSON for the prompt
-    strings_json = json.dumps(strings_chunk, ensure_ascii=False, indent=2)
+    Each language is validated on its own, so an entry with only some
+    languages filled still yields the languages that are present.
     
-    # Build comprehensive system prompt
-    system_prompt = f"""You are a professional iOS app translator specializing in UI/UX localization.{' You are translating for: ' + app_description if app_description else 'an app'}
+    Args:
+        translated_json (Dict[str, Any]): Parsed model response of the form {id: {language: text}}
+        strings_chunk (Dict[str, str]): Chunk of key-value pairs that was sent
+        id_to_key (Dict[str, str]): Mapping of IDs back to keys from encode_chunk_payload
+        target_languages (List[str]): Languages that were requested
+        
+    Returns:
+        Dict[str, Dict[str, str]]: Translated key-value pairs by language
+    """
+    by_language: Dict[str, Dict[str, Any]] = {lang: {} for lang in target_languages}
+    for id_, entry in translated_json.items():
+        if not isinstance(entry, dict):
+            print(f"Warning: Unexpected entry in response: {id_}")
+            continue
+        for lang in target_languages:
+            if isinstance(entry.get(lang), str):
+                by_language[lang][id_] = entry[lang]
+    
+    return {
+        lang: decode_chunk_response(values, strings_chunk, id_to_key)
+        for lang, values in by_language.items()
+    }
 
-Your task is to translate app interface strings from {source_language} to {target_language}.
 
-INSTRUCTIONS:
-1. Return a JSON object with the exact same structure as the input
-2. Keys remain UNCHANGED (they are string identifiers)
-3. Values are TRANSLATED to {target_language}
-4. Include ALL {len(strings_chunk)} keys from the input
+def create_limiter() -> AIMDLimiter:
+    """Create an adaptive concurrency limiter from the translation settings."""
+    return AIMDLimiter(
+        initial_limit=settings.translation_initial_concurrent_chunks,
+        min_limit=1,
+        max_limit=settings.translation_max_concurrent_chunks,
+        latency_threshold=settings.translation_latency_threshold,
+    )
+
+
+def _estimate_output_tokens(strings_chunk: Dict[str, str]) -> int:
+    return sum(estimate_entry_cost(text)[1] for text in strings_chunk.values())
+
+
+async def _create_completion(
+    limiter: Optional[AIMDLimiter],
+    retry_policy: Optional[RetryPolicy],
+    stats: Optional[TranslationStats],
+    expected_output_tokens: int,
+    **request: Any
+) -> Any:
+    """Send one chat completion request on the pooled client, retrying transient failures."""
+    input_tokens = sum(estimate_tokens(message["content"]) for message in request["messages"])
+    client = get_openai_client()
+    attempt = 0
+    
+    while True:
+        attempt += 1
+        # Charge the provider quota before taking a slot, so waiting for quota doesn't hold one
+        await provider_rate_limiter.acquire(input_tokens + expected_output_tokens)
+        if stats is not None:
+            stats.api_requests += 1
+        try:
+            if limiter is None:
+                return await client.chat.completions.create(**request)
+            async with limiter.request():
+                return await client.chat.completions.create(**request)
+        except Exception as e:
+            delay = retry_policy.next_delay(e, attempt) if retry_policy is not None else None
+            if delay is None:
+                raise
+            if stats is not None:
+                stats.record_retry(delay)
+            print(f"Request failed ({e}), retrying in {delay:.1f}s (attempt {attempt + 1})")
+            await asyncio.sleep(delay)
+
+
+class ChunkSplitRequired(Exception):
+    """Raised when a chunk's response is unusable in a way a smaller chunk may avoid."""
+
 
-CRITICAL RULES FOR iOS PLACEHOLDERS:
+PLACEHOLDER_RULES = """CRITICAL RULES FOR iOS PLACEHOLDERS:
 - Keep %@ as %@ (NOT %1$@ or %s)
 - Keep %lld as %lld (NOT %1$lld or %d)
 - Keep %d as %d (NOT %1$d)
 - Keep all other placeholders UNCHANGED
 - Do NOT add positional indicators like %1$, %2$, etc.
-- The order and format of placeholders must remain EXACTLY the same
+- The order and format of placeholders must remain EXACTLY the same"""
+
+
+def build_system_prompt(
+    source_language: str,
+    target: str,
+    instructions: List[str],
+    example: str,
+    app_description: Optional[str] = None
+) -> str:
+    """
+    Build the translator system prompt shared by single- and multi-language requests.
+    
+    Args:
+        source_language (str): Source language code
+        target (str): Description of the target, e.g. "es" or "each of these languages: es, fr"
+        instructions (List[str]): Numbered instructions describing the response format
+        example (str): Example input and output
+        app_description (Optional[str]): Optional description of the app for better translation context
+        
+    Returns:
+        str: System prompt
+    """
+    numbered = "\n".join(f"{i}. {instruction}" for i, instruction in enumerate(instructions, 1))
+    return f"""You are a professional iOS app translator specializing in UI/UX localization.{' You are translating for: ' + app_description if app_description else 'an app'}
+
+Your task is to translate app interface strings from {source_language} to {target}.
+
+INSTRUCTIONS:
+{numbered}
+
+{PLACEHOLDER_RULES}
 
-Example input: {{"welcome": "Hello %@", "%lld job%@": "%lld job%@"}}
-Example output: {{"welcome": "Hola %@", "%lld job%@": "%lld trabajo%@"}}
+{example}
 
 Use appropriate terminology for the app domain. Always respond with valid JSON only."""
 
-    # Simple user prompt with just the data
-    user_prompt = f"Translate this JSON to {target_language}:\n{strings_json}"
+
+async def _request_chunk_translation(
+    system_prompt: str,
+    user_prompt: str,
+    expected_output_tokens: int,
+    decode: Callable[[Any], Any],
+    limiter: Optional[AIMDLimiter],
+    retry_policy: Optional[RetryPolicy],
+    stats: Optional[TranslationStats]
+) -> Any:
+    """
+    Send a chunk translation request and decode its JSON response.
     
+    Args:
+        system_prompt (str): System prompt from build_system_prompt
+        user_prompt (str): User prompt carrying the chunk payload
+        expected_output_tokens (int): Estimated response size for the provider quota
+        decode (Callable[[Any], Any]): Maps the parsed response back to keys
+        limiter (Optional[AIMDLimiter]): Shared concurrency limiter for the job's API requests
+        retry_policy (Optional[RetryPolicy]): Retry policy holding the job's retry budget
+        stats (Optional[TranslationStats]): Counters to update for the job
+        
+    Returns:
+        Any: Decoded response, or an empty dict if the request failed
+        
+    Raises:
+        ChunkSplitRequired: If the response was truncated, malformed, or the request timed out
+    """
     try:
-        response = await client.chat.completions.create(
+        response = await _create_completion(
+            limiter,
+            retry_policy,
+            stats,
+            expected_output_tokens,
             model=settings.openai_model,
             messages=[
                 {"role": "system", "content": system_prompt},
@@ -185,211 +767,753 @@ Use appropriate terminology for the app domain. Always respond with valid JSON o
         # Debug: log first 500 chars of response
         print(f"API Response preview: {translated_text[:500]}...")
         
-        # Parse JSON response
+        if response.choices[0].finish_reason == "length":
+            raise ChunkSplitRequired("response was truncated (finish_reason=length)")
+        
+        try:
+            translated_json = json_backend.loads(translated_text)
+        except json.JSONDecodeError as e:
+            print(f"Error parsing JSON response: {e}")
+            print(f"Response was: {translated_text}")
+            raise ChunkSplitRequired(f"malformed JSON response: {e}")
+        
+        return decode(translated_json)
+        
+    except ChunkSplitRequired:
+        raise
+    except APITimeoutError as e:
+        raise ChunkSplitRequired("request timed out") from e
+    except Exception as e:
+        print(f"Warning: Translation failed for chunk: {str(e)}")
+        return {}
+
+
+async def translate_chunk_async(
+    strings_chunk: Dict[str, str],
+    target_language: str,
+    source_language: str = "en",
+    app_description: Optional[str] = None,
+    limiter: Optional[AIMDLimiter] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    stats: Optional[TranslationStats] = None
+) -> Dict[str, str]:
+    """
+    Translate a chunk of strings asynchronously using OpenRouter API.
+    
+    Args:
+        strings_chunk (Dict[str, str]): Chunk of key-value pairs to translate
+        target_language (str): Target language code
+        source_language (str): Source language code
+        app_description (Optional[str]): Optional description of the app for better translation context
+        limiter (Optional[AIMDLimiter]): Shared concurrency limiter for the job's API requests
+        retry_policy (Optional[RetryPolicy]): Retry policy holding the job's retry budget
+        stats (Optional[TranslationStats]): Counters to update for the job
+        
+    Returns:
+        Dict[str, str]: Dictionary of translated key-value pairs
+        
+    Raises:
+        ChunkSplitRequired: If the response was truncated, malformed, or the request timed out
+    """
+    if not strings_chunk:
+        return {}
+    
+    # Prepare the translation request
+    print(f"Processing chunk with {len(strings_chunk)} strings")
+    
+    # Send short numeric IDs instead of the keys; they are mapped back locally
+    strings_json, id_to_key = encode_chunk_payload(strings_chunk)
+    
+    system_prompt = build_system_prompt(
+        source_language,
+        target_language,
+        [
+            "Return a JSON object with the exact same structure as the input",
+            "Keys remain UNCHANGED (they are numeric string IDs)",
+            f"Values are TRANSLATED to {target_language}",
+            f"Include ALL {len(strings_chunk)} keys from the input",
+        ],
+        'Example input: {"1":"Hello %@","2":"%lld job%@"}\n'
+        'Example output: {"1":"Hola %@","2":"%lld trabajo%@"}',
+        app_description,
+    )
+    
+    # Simple user prompt with just the data
+    user_prompt = f"Translate this JSON to {target_language}:\n{strings_json}"
+    
+    translated_chunk = await _request_chunk_translation(
+        system_prompt,
+        user_prompt,
+        _estimate_output_tokens(strings_chunk),
+        lambda translated_json: decode_chunk_response(translated_json, strings_chunk, id_to_key),
+        limiter,
+        retry_policy,
+        stats,
+    )
+    
+    # Missing keys are requeued into later chunks by the caller
+    missing = [key for key in strings_chunk if key not in translated_chunk]
+    if translated_chunk and missing:
+        print(f"Warning: {len(missing)} keys not returned: {missing[:5]}{'...' if len(missing) > 5 else ''}")
+    
+    return translated_chunk
+
+
+async def translate_chunk_multi_async(
+    strings_chunk: Dict[str, str],
+    target_languages: List[str],
+    source_language: str = "en",
+    app_description: Optional[str] = None,
+    limiter: Optional[AIMDLimiter] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    stats: Optional[TranslationStats] = None
+) -> Dict[str, Dict[str, str]]:
+    """
+    Translate a chunk of strings into several languages with one request.
+    
+    The source strings and instructions are sent once and the model answers
+    with {id: {language: text}}; a single language falls back to
+    translate_chunk_async.
+    
+    Args:
+        strings_chunk (Dict[str, str]): Chunk of key-value pairs to translate
+        target_languages (List[str]): Target language codes
+        source_language (str): Source language code
+        app_description (Optional[str]): Optional description of the app for better translation context
+        limiter (Optional[AIMDLimiter]): Shared concurrency limiter for the job's API requests
+        retry_policy (Optional[RetryPolicy]): Retry policy holding the job's retry budget
+        stats (Optional[TranslationStats]): Counters to update for the job
+        
+    Returns:
+        Dict[str, Dict[str, str]]: Translated key-value pairs by language; languages or keys missing from the response are left out
+        
+    Raises:
+        ChunkSplitRequired: If the response was truncated, malformed, or the request timed out
+    """
+    if len(target_languages) == 1:
+        target_language = target_languages[0]
+        return {target_language: await translate_chunk_async(
+            strings_chunk, target_language, source_language, app_description, limiter, retry_policy, stats
+        )}
+    
+    if not strings_chunk:
+        return {}
+    
+    languages = ", ".join(target_languages)
+    print(f"Processing chunk with {len(strings_chunk)} strings for {languages}")
+    
+    strings_json, id_to_key = encode_chunk_payload(strings_chunk)
+    language_fields = ",".join(f'"{lang}":"..."' for lang in target_languages)
+    
+    system_prompt = build_system_prompt(
+        source_language,
+        f"each of these languages: {languages}",
+        [
+            "Return a JSON object with the same keys as the input (they are numeric string IDs)",
+            f"Each value is an object with one translation per language code: {{{language_fields}}}",
+            f"Include ALL {len(strings_chunk)} keys from the input and ALL {len(target_languages)} languages for each key",
+        ],
+        'Example input: {"1":"Hello %@"}\n'
+        'Example output for es, fr: {"1":{"es":"Hola %@","fr":"Bonjour %@"}}',
+        app_description,
+    )
+    
+    user_prompt = f"Translate this JSON to {languages}:\n{strings_json}"
+    
+    translated = await _request_chunk_translation(
+        system_prompt,
+        user_prompt,
+        _estimate_output_tokens(strings_chunk) * len(target_languages),
+        lambda translated_json: decode_multi_target_response(
+            translated_json, strings_chunk, id_to_key, target_languages
+        ),
+        limiter,
+        retry_policy,
+        stats,
+    )
+    
+    for lang, translated_chunk in translated.items():
+        missing = len(strings_chunk) - len(translated_chunk)
+        if missing:
+            print(f"Warning: {missing} {lang} translations not returned")
+    
+    return translated
+
+
+async def _translate_chunk_bisecting(
+    strings_chunk: Dict[str, str],
+    label: str,
+    target_language: str,
+    source_language: str,
+    app_description: Optional[str],
+    limiter: Optional[AIMDLimiter],
+    retry_policy: Optional[RetryPolicy],
+    stats: Optional[TranslationStats]
+) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """
+    Translate a chunk, splitting it in half and recursing when the response is unusable.
+    
+    Returns:
+        Tuple[Dict[str, str], Dict[str, str]]: Tuple of (translated key-value pairs, failed keys with reasons)
+    """
+    try:
+        translated = await translate_chunk_async(
+            strings_chunk, target_language, source_language, app_description, limiter, retry_policy, stats
+        )
+        return translated, {}
+    except ChunkSplitRequired as e:
+        if len(strings_chunk) <= max(1, settings.translation_min_chunk_size):
+            print(f"Warning: {label} failed and is too small to split: {e}")
+            return {}, {key: f"{label} failed: {e}" for key in strings_chunk}
+        
+        # Requeue both halves; each may split again independently
+        items = list(strings_chunk.items())
+        middle = len(items) // 2
+        print(f"Splitting {label} ({len(items)} strings) after failure: {e}")
+        if stats is not None:
+            stats.chunk_splits += 1
+        halves = await asyncio.gather(
+            _translate_chunk_bisecting(
+                dict(items[:middle]), f"{label}a", target_language, source_language, app_description,
+                limiter, retry_policy, stats
+            ),
+            _translate_chunk_bisecting(
+                dict(items[middle:]), f"{label}b", target_language, source_language, app_description,
+                limiter, retry_policy, stats
+            ),
+        )
+        translated, failed = {}, {}
+        for half_translated, half_failed in halves:
+            translated.update(half_translated)
+            failed.update(half_failed)
+        return translated, failed
+
+
+def placeholders_preserved(translations: Dict[str, str]) -> Dict[str, str]:
+    """
+    Keep only translations whose placeholders match their source text.
+    
+    Translations with modified placeholders are still applied, with a
+    warning, but must not be remembered and replayed on later runs.
+    
+    Args:
+        translations (Dict[str, str]): Translations keyed by source text
+        
+    Returns:
+        Dict[str, str]: The translations that are safe to store in or reuse from the translation memory
+    """
+    return {
+        text: value for text, value in translations.items()
+        if extract_placeholders(text) == extract_placeholders(value)
+    }
+
+
+def translation_memory_key(source_language: str, target_language: str, app_description: Optional[str]) -> Tuple[Any, ...]:
+    """Return the translation memory lookup parameters for a language pair."""
+    return (source_language, target_language, settings.openai_model, TRANSLATION_PROMPT_VERSION, app_description)
+
+
+async def translate_strings_async(
+    keys: List[str],
+    target_language: str, 
+    source_language: str = "en",
+    app_description: Optional[str] = None,
+    stats: Optional[TranslationStats] = None,
+    journal: Optional[LanguageJournal] = None,
+    on_chunk: Optional[Callable[[Dict[str, str]], Awaitable[None]]] = None,
+    limiter: Optional[AIMDLimiter] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    source_texts: Optional[Dict[str, str]] = None
+) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """
+    Translate a dictionary of strings using chunked async processing with openai API.
+    
+    Keys with the same normalized source text are translated once and the
+    translation is copied to each of them. The source text is what is sent
+    to the API, so keys that are identifiers are translated by their value.
+    
+    Args:
+        keys (Dict[str, str]): Dictionary of key-value pairs to translate
+        target_language (str): Target language code (e.g., 'es', 'fr', 'de')
+        source_language (str): Source language code (default: 'en')
+        app_description (Optional[str]): Optional description of the app for better translation context
+        stats (Optional[TranslationStats]): Counters to update for the job (requests, retries, cache hits)
+        journal (Optional[LanguageJournal]): Job journal to replay completed chunks from and record new ones to
+        on_chunk (Optional[Callable[[Dict[str, str]], Awaitable[None]]]): Awaited with each batch of translations as it becomes available
+        limiter (Optional[AIMDLimiter]): Concurrency limiter shared with other translations; a new one is created if omitted
+        retry_policy (Optional[RetryPolicy]): Retry policy holding the job's retry budget; a new one is created if omitted
+        source_texts (Optional[Dict[str, str]]): Source-language text by key, from lookup_source_texts; keys are their own text if omitted
+        
+    Returns:
+        Tuple[Dict[str, str], Dict[str, str]]: Tuple of (translated key-value pairs, skipped keys with reasons)
+        
+    Raises:
+        Exception: If translation fails
+    """
+    if not keys:
+        return {}, {}
+    
+    # Translate each distinct source text once
+    groups = SourceTextGroups(keys, source_texts)
+    if stats is not None:
+        stats.record_dedup(groups.key_count, len(groups.groups))
+    if groups.duplicates:
+        print(f"Deduplicated {groups.key_count} keys to {len(groups.groups)} unique source texts")
+    
+    fan_out_chunk = None
+    if on_chunk is not None:
+        async def fan_out_chunk(translated: Dict[str, str]) -> None:
+            await on_chunk(groups.fan_out(translated))
+    
+    translated, skipped_keys = await _translate_texts_async(
+        groups.texts, target_language, source_language, app_description, stats, journal, fan_out_chunk, limiter,
+        retry_policy
+    )
+    translated = groups.fan_out(translated)
+    return {key: translated[key] for key in keys if key in translated}, groups.fan_out(skipped_keys, rewrap=False)
+
+
+async def _translate_texts_async(
+    keys: List[str],
+    target_language: str,
+    source_language: str,
+    app_description: Optional[str],
+    stats: Optional[TranslationStats],
+    journal: Optional[LanguageJournal],
+    on_chunk: Optional[Callable[[Dict[str, str]], Awaitable[None]]],
+    limiter: Optional[AIMDLimiter],
+    retry_policy: Optional[RetryPolicy]
+) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """Translate unique source texts, replaying the journal and the translation memory before calling the API."""
+    if stats is not None:
+        stats.keys_total += len(keys)
+    
+    # Replay chunks this job already paid for before it was interrupted
+    replayed = {}
+    if journal is not None:
+        journaled = await asyncio.to_thread(journal.translations)
+        replayed = {key: journaled[key] for key in keys if key in journaled}
+        if replayed:
+            print(f"Journal: replaying {len(replayed)} translations from completed chunks")
+            if stats is not None:
+                stats.journal_replayed += len(replayed)
+                stats.keys_translated += len(replayed)
+                await stats.report_progress()
+            if on_chunk is not None:
+                await on_chunk(replayed)
+    pending_keys = [key for key in keys if key not in replayed]
+    
+    # Only send strings that are not already in the translation memory
+    cached = {}
+    memory_key = translation_memory_key(source_language, target_language, app_description)
+    if translation_memory is not None and translation_memory.enabled and pending_keys:
+        # Entries stored before placeholder checks applied to the memory are ignored
+        cached = placeholders_preserved(
+            await asyncio.to_thread(translation_memory.lookup, pending_keys, *memory_key)
+        )
+        print(f"Translation memory: {len(cached)} hits, {len(pending_keys) - len(cached)} misses")
+        if stats is not None:
+            stats.memory_hits += len(cached)
+            stats.memory_misses += len(pending_keys) - len(cached)
+            stats.keys_translated += len(cached)
+            if cached:
+                await stats.report_progress()
+        if cached and on_chunk is not None:
+            await on_chunk(cached)
+    uncached_keys = [key for key in pending_keys if key not in cached]
+    
+    translated, skipped_keys = {}, {}
+    if uncached_keys:
+        translated, skipped_keys = await _translate_with_api(
+            uncached_keys, target_language, source_language, app_description, stats, journal, on_chunk, limiter,
+            retry_policy
+        )
+        if translation_memory is not None:
+            await asyncio.to_thread(translation_memory.store, placeholders_preserved(translated), *memory_key)
+    
+    combined = {**replayed, **cached, **translated}
+    return {key: combined[key] for key in keys if key in combined}, skipped_keys
+
+
+def translate_strings(
+    keys: List[str],
+    target_language: str, 
+    source_language: str = "en",
+    app_description: Optional[str] = None,
+    stats: Optional[TranslationStats] = None
+) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """Synchronous version of translate_strings_async for callers without an event loop."""
+    return run_sync(translate_strings_async(keys, target_language, source_language, app_description, stats))
+
+
+async def _translate_with_api(
+    keys: List[str],
+    target_language: str,
+    source_language: str = "en",
+    app_description: Optional[str] = None,
+    stats: Optional[TranslationStats] = None,
+    journal: Optional[LanguageJournal] = None,
+    on_chunk: Optional[Callable[[Dict[str, str]], Awaitable[None]]] = None,
+    limiter: Optional[AIMDLimiter] = None,
+    retry_policy: Optional[RetryPolicy] = None
+) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """Translate keys with the API, bypassing the translation memory."""
+    if retry_policy is None:
+        retry_policy = create_retry_policy()
+    if limiter is None:
+        limiter = create_limiter()
+
+    # Convert list of keys to dictionary where key=value (for translation purposes)
+    keys_dict = {key: key for key in keys}
+    
+    # Pack strings into chunks of roughly equal token cost
+    chunks = chunk_by_token_budget(
+        keys_dict,
+        settings.translation_chunk_input_tokens,
+        settings.translation_chunk_output_tokens,
+        settings.translation_chunk_size,
+    )
+    
+    if len(chunks) > 1:
+        print(f"Processing {len(keys_dict)} strings in {len(chunks)} chunks of {min(len(c) for c in chunks)}-{max(len(c) for c in chunks)} strings each...")
+    
+    async def process_all_chunks():
+        """
+        Process chunks concurrently with adaptive concurrency and rate limiting.
+        
+        Keys missing from a response are merged into later chunks until they
+        reach the per-key attempt cap, instead of being dropped.
+        """
+        planned = deque(chunks)
+        leftovers: Dict[str, str] = {}
+        attempts: Dict[str, int] = {}
+        in_flight: Dict[asyncio.Task, Dict[str, str]] = {}
+        combined_results = {}
+        skipped_keys = {}
+        dispatched_chunks = 0
+        successful_chunks = 0
+        budget = (
+            settings.translation_chunk_input_tokens,
+            settings.translation_chunk_output_tokens,
+            settings.translation_chunk_size,
+        )
+        
+        def next_chunk() -> Optional[Dict[str, str]]:
+            if not planned:
+                # Hold leftovers back while chunks are in flight so they can be merged with later misses
+                if in_flight or not leftovers:
+                    return None
+                planned.extend(chunk_by_token_budget(leftovers, *budget))
+                leftovers.clear()
+            chunk = planned.popleft()
+            if leftovers:
+                chunk = top_up_chunk(chunk, leftovers, *budget)
+                for key in chunk:
+                    leftovers.pop(key, None)
+            return chunk
+        
         try:
-            translated_json = json.loads(translated_text)
-            translated_chunk = {}
-            
-            # Ensure we only include keys that were in the original chunk
-            for key, value in translated_json.items():
-                if key in strings_chunk:
-                    # Check if placeholders were preserved correctly
-                    original_placeholders = extract_placeholders(strings_chunk[key])
-                    translated_placeholders = extract_placeholders(value)
+            while True:
+                # Keep about one chunk per concurrency slot in flight, building each at dispatch time
+                while len(in_flight) < limiter.window:
+                    chunk = next_chunk()
+                    if chunk is None:
+                        break
+                    dispatched_chunks += 1
+                    if stats is not None:
+                        stats.chunks_started += 1
+                    for key in chunk:
+                        attempts[key] = attempts.get(key, 0) + 1
+                    task = asyncio.create_task(_translate_chunk_bisecting(
+                        chunk, f"Chunk {dispatched_chunks}", target_language, source_language, app_description,
+                        limiter, retry_policy, stats
+                    ))
+                    in_flight[task] = chunk
+                
+                if not in_flight:
+                    break
+                
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    chunk = in_flight.pop(task)
+                    try:
+                        translated, failed = task.result()
+                        reason = "Not returned by API"
+                    except Exception as e:
+                        print(f"Warning: Chunk failed: {e}")
+                        translated, failed = {}, {}
+                        reason = f"Chunk failed: {str(e)}"
                     
-                    if original_placeholders != translated_placeholders:
-                        print(f"Warning: Placeholders modified in '{key}':")
-                        print(f"  Original: {original_placeholders}")
-                        print(f"  Translated: {translated_placeholders}")
+                    combined_results.update(translated)
+                    skipped_keys.update(failed)
+                    if journal is not None:
+                        await asyncio.to_thread(journal.record_chunk, translated)
+                    if on_chunk is not None and translated:
+                        await on_chunk(translated)
+                    missing = {key: text for key, text in chunk.items() if key not in translated and key not in failed}
+                    if not missing and not failed:
+                        successful_chunks += 1
                     
-                    translated_chunk[key] = value
-                else:
-                    print(f"Warning: Unexpected key in response: {key}")
+                    for key, text in missing.items():
+                        if attempts[key] < settings.translation_max_key_attempts:
+                            leftovers[key] = text
+                            if stats is not None:
+                                stats.requeued_keys += 1
+                        else:
+                            skipped_keys[key] = f"{reason} after {attempts[key]} attempts"
                     
-        except json.JSONDecodeError as e:
-            print(f"Error parsing JSON response: {e}")
-            print(f"Response was: {translated_text}")
-            # Fallback to empty dict on parse error
-            translated_chunk = {}
+                    if stats is not None:
+                        stats.chunks_done += 1
+                        stats.keys_translated += len(translated)
+                        stats.keys_skipped += len(failed) + sum(1 for key in missing if key not in leftovers)
+                        await stats.report_progress()
+        finally:
+            for task in in_flight:
+                task.cancel()
         
-        # Check for missing translations and retry once if needed
-        missing_keys = set(strings_chunk.keys()) - set(translated_chunk.keys())
-        if missing_keys and len(missing_keys) <= 10:  # Only retry if a small number are missing
-            print(f"Retrying {len(missing_keys)} missing keys: {list(missing_keys)[:5]}{'...' if len(missing_keys) > 5 else ''}")
-            
-            # Create a chunk with just the missing keys
-            missing_chunk = {key: strings_chunk[key] for key in missing_keys}
-            
-            # Simplified retry with a more direct prompt
-            retry_system_prompt = f"""You are translating iOS app strings from {source_language} to {target_language}.
+        print(f"Successfully translated {successful_chunks}/{dispatched_chunks} chunks")
+        print(f"Total translations collected: {len(combined_results)} out of {len(keys_dict)} requested")
+        print(f"Skipped keys: {len(skipped_keys)}")
+        print(f"Concurrency: {limiter.stats()}")
+        print(f"Rate limit wait so far: {provider_rate_limiter.waited_seconds:.1f}s")
+        return combined_results, skipped_keys
+    
+    try:
+        return await process_all_chunks()
+    except Exception as e:
+        raise Exception(f"Chunked translation failed: {str(e)}")
 
-Return ONLY a JSON object with the exact same keys as the input. Translate ONLY the values.
-Keep all iOS placeholders (%@, %d, %lld, etc.) exactly as they are.
 
-Example: {{"key": "Hello %@"}} -> {{"key": "Hola %@"}}"""
-            
-            retry_user_prompt = f"Translate to {target_language}:\n{json.dumps(missing_chunk, ensure_ascii=False)}"
-            
-            try:
-                retry_response = await client.chat.completions.create(
-                    model=settings.openai_model,
-                    messages=[
-                        {"role": "system", "content": retry_system_prompt},
-                        {"role": "user", "content": retry_user_prompt}
-                    ],
-                    temperature=0.3,  # Lower temperature for more consistent output
-                    response_format={"type": "json_object"}
-                )
-                
-                retry_text = retry_response.choices[0].message.content
-                try:
-                    retry_json = json.loads(retry_text)
-                    # Add successful retries to the main result
-                    for key, value in retry_json.items():
-                        if key in missing_keys:
-                            translated_chunk[key] = value
-                            print(f"Successfully retried key: {key}")
-                except json.JSONDecodeError:
-                    print(f"Retry failed to parse JSON: {retry_text}")
-            except Exception as e:
-                print(f"Retry request failed: {e}")
-        
-        # Final check for still missing keys
-        final_missing = set(strings_chunk.keys()) - set(translated_chunk.keys())
-        if final_missing:
-            print(f"Warning: {len(final_missing)} keys still not translated after retry: {list(final_missing)[:5]}{'...' if len(final_missing) > 5 else ''}")
-        
-        return translated_chunk
-        
-    except Exception as e:
-        print(f"Warning: Translation failed for chunk: {str(e)}")
-        return {}
+def group_languages(languages: List[str], group_size: int) -> List[List[str]]:
+    """Split target languages into groups requested together, keeping their order."""
+    group_size = max(1, group_size)
+    return [languages[i:i + group_size] for i in range(0, len(languages), group_size)]
 
 
-def translate_strings(
-    keys: List[str],
-    target_language: str, 
+async def translate_languages_async(
+    keys_by_language: Dict[str, List[str]],
     source_language: str = "en",
-    app_description: Optional[str] = None
-) -> Tuple[Dict[str, str], Dict[str, str]]:
+    app_description: Optional[str] = None,
+    stats: Optional[TranslationStats] = None,
+    limiter: Optional[AIMDLimiter] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    source_texts: Optional[Dict[str, str]] = None
+) -> Tuple[Dict[str, Dict[str, str]], Dict[str, Dict[str, str]]]:
     """
-    Translate a dictionary of strings using chunked async processing with openai API.
+    Translate keys into several languages, requesting groups of languages together.
+    
+    Languages are grouped by the translation_language_group_size setting.
+    Within a group, keys needed by the same languages are chunked together
+    and each chunk is translated into all of them with one request. Keys a
+    response leaves out for some language, and chunks that fail, go through
+    the single-language pipeline for that language, which requeues and
+    splits as usual. Keys with the same normalized source text are
+    translated once per language.
     
     Args:
-        keys (Dict[str, str]): Dictionary of key-value pairs to translate
-        target_language (str): Target language code (e.g., 'es', 'fr', 'de')
+        keys_by_language (Dict[str, List[str]]): Keys to translate for each target language
         source_language (str): Source language code (default: 'en')
         app_description (Optional[str]): Optional description of the app for better translation context
+        stats (Optional[TranslationStats]): Counters to update for the job (requests, retries, cache hits)
+        limiter (Optional[AIMDLimiter]): Concurrency limiter shared by all languages; a new one is created if omitted
+        retry_policy (Optional[RetryPolicy]): Retry policy holding the job's retry budget, shared by all languages; a new one is created if omitted
+        source_texts (Optional[Dict[str, str]]): Source-language text by key, from lookup_source_texts; keys are their own text if omitted
         
     Returns:
-        Tuple[Dict[str, str], Dict[str, str]]: Tuple of (translated key-value pairs, skipped keys with reasons)
-        
-    Raises:
-        Exception: If translation fails
+        Tuple[Dict[str, Dict[str, str]], Dict[str, Dict[str, str]]]: Tuple of (translations by language, skipped keys with reasons by language)
     """
-    if not keys:
+    # Translate each distinct source text once per language
+    groups_by_language = {lang: SourceTextGroups(keys, source_texts) for lang, keys in keys_by_language.items() if keys}
+    for lang, groups in groups_by_language.items():
+        if stats is not None:
+            stats.record_dedup(groups.key_count, len(groups.groups))
+        if groups.duplicates:
+            print(f"Deduplicated {groups.key_count} {lang} keys to {len(groups.groups)} unique source texts")
+    
+    translated_texts, skipped_texts = await _translate_languages_texts_async(
+        {lang: groups.texts for lang, groups in groups_by_language.items()},
+        source_language, app_description, stats, limiter, retry_policy
+    )
+    
+    translations = {}
+    for lang, by_text in translated_texts.items():
+        translated = groups_by_language[lang].fan_out(by_text)
+        translations[lang] = {key: translated[key] for key in keys_by_language[lang] if key in translated}
+    skipped = {lang: groups_by_language[lang].fan_out(by_text, rewrap=False) for lang, by_text in skipped_texts.items()}
+    return translations, skipped
+
+
+async def _translate_languages_texts_async(
+    keys_by_language: Dict[str, List[str]],
+    source_language: str,
+    app_description: Optional[str],
+    stats: Optional[TranslationStats],
+    limiter: Optional[AIMDLimiter],
+    retry_policy: Optional[RetryPolicy]
+) -> Tuple[Dict[str, Dict[str, str]], Dict[str, Dict[str, str]]]:
+    """Translate unique source texts into several languages, checking the translation memory first."""
+    languages = [lang for lang, keys in keys_by_language.items() if keys]
+    if not languages:
         return {}, {}
     
-    # Convert list of keys to dictionary where key=value (for translation purposes)
-    keys_dict = {key: key for key in keys}
+    if stats is not None:
+        stats.keys_total += sum(len(keys_by_language[lang]) for lang in languages)
+    if limiter is None:
+        limiter = create_limiter()
+    if retry_policy is None:
+        retry_policy = create_retry_policy()
     
-    # If small enough, process as single chunk
-    if len(keys_dict) <= settings.translation_chunk_size:
-        async def single_chunk_wrapper():
-            return await translate_chunk_async(keys_dict, target_language, source_language, app_description)
-        
-        def run_async_in_thread():
-            return asyncio.run(single_chunk_wrapper())
-        
+    translations: Dict[str, Dict[str, str]] = {lang: {} for lang in languages}
+    skipped: Dict[str, Dict[str, str]] = {lang: {} for lang in languages}
+    pending: Dict[str, List[str]] = {}
+    
+    # Only send strings that are not already in the translation memory
+    cached_by_language: Dict[str, Dict[str, str]] = {}
+    for lang in languages:
+        keys = keys_by_language[lang]
+        cached = {}
+        if translation_memory is not None and translation_memory.enabled:
+            cached = placeholders_preserved(await asyncio.to_thread(
+                translation_memory.lookup, keys, *translation_memory_key(source_language, lang, app_description)
+            ))
+            print(f"Translation memory ({lang}): {len(cached)} hits, {len(keys) - len(cached)} misses")
+            if stats is not None:
+                stats.memory_hits += len(cached)
+                stats.memory_misses += len(keys) - len(cached)
+                stats.keys_translated += len(cached)
+                if cached:
+                    await stats.report_progress()
+        cached_by_language[lang] = cached
+        translations[lang].update(cached)
+        pending[lang] = [key for key in keys if key not in cached]
+    
+    budget = (
+        settings.translation_chunk_input_tokens,
+        settings.translation_chunk_output_tokens,
+        settings.translation_chunk_size,
+    )
+    
+    async def translate_language(lang: str, keys: List[str]) -> None:
         try:
-            # Check if we're in an event loop
-            asyncio.get_running_loop()
-            # We're in an event loop, run in a separate thread
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(run_async_in_thread)
-                result = future.result()
-        except RuntimeError:
-            # No event loop running, safe to use asyncio.run directly
-            result = asyncio.run(single_chunk_wrapper())
-        
-        skipped_keys = {k: "Translation not returned by API" for k in keys if k not in result}
-        return result, skipped_keys
-    
-    # Split into chunks for large dictionaries
-    items = list(keys_dict.items())
-    chunks = []
-    
-    for i in range(0, len(items), settings.translation_chunk_size):
-        chunk_items = items[i:i + settings.translation_chunk_size]
-        chunk_dict = dict(chunk_items)
-        chunks.append(chunk_dict)
-    
-    print(f"Processing {len(keys_dict)} strings in {len(chunks)} chunks of max {settings.translation_chunk_size} each...")
+            translated, failed = await _translate_with_api(
+                keys, lang, source_language, app_description, stats, limiter=limiter, retry_policy=retry_policy
+            )
+        except Exception as e:
+            print(f"Warning: {lang} translation failed: {e}")
+            translated, failed = {}, {key: f"Translation failed: {str(e)}" for key in keys}
+            if stats is not None:
+                stats.keys_skipped += len(keys)
+        translations[lang].update(translated)
+        skipped[lang].update(failed)
     
-    async def process_all_chunks():
-        """Process all chunks concurrently with limited concurrency and rate limiting."""
-        semaphore = asyncio.Semaphore(settings.translation_max_concurrent_chunks)  # Limit concurrent requests for rate limiting
+    async def translate_group(group: List[str]) -> None:
+        # Keys needed by the same languages of the group share requests
+        needed = {lang: set(pending[lang]) for lang in group}
+        keys_by_languages: Dict[Tuple[str, ...], List[str]] = {}
+        for key in dict.fromkeys(key for lang in group for key in pending[lang]):
+            key_languages = tuple(lang for lang in group if key in needed[lang])
+            keys_by_languages.setdefault(key_languages, []).append(key)
         
-        async def process_chunk_with_semaphore(chunk):
-            async with semaphore:
-                # Add delay between requests to respect rate limits
-                await asyncio.sleep(settings.translation_rate_limit_delay)
-                return await translate_chunk_async(chunk, target_language, source_language, app_description)
+        leftovers: Dict[str, List[str]] = {lang: [] for lang in group}
         
-        # Process chunks concurrently
-        tasks = [process_chunk_with_semaphore(chunk) for chunk in chunks]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        async def translate_chunk(chunk: Dict[str, str], chunk_languages: Tuple[str, ...]) -> None:
+            if stats is not None:
+                stats.chunks_started += 1
+            try:
+                result = await translate_chunk_multi_async(
+                    chunk, list(chunk_languages), source_language, app_description, limiter, retry_policy, stats
+                )
+            except Exception as e:
+                print(f"Warning: Chunk for {', '.join(chunk_languages)} failed, retrying per language: {e}")
+                result = {}
+            for lang in chunk_languages:
+                translated = result.get(lang, {})
+                translations[lang].update(translated)
+                leftovers[lang].extend(key for key in chunk if key not in translated)
+            if stats is not None:
+                stats.chunks_done += 1
+                stats.keys_translated += sum(len(result.get(lang, {})) for lang in chunk_languages)
+                await stats.report_progress()
         
-        # Combine results
-        combined_results = {}
-        skipped_keys = {}
-        successful_chunks = 0
+        tasks = []
+        for key_languages, keys in keys_by_languages.items():
+            if len(key_languages) == 1:
+                leftovers[key_languages[0]].extend(keys)
+                continue
+            # The response carries one translation per language, so size chunks to keep it within budget
+            chunks = chunk_by_token_budget(
+                {key: key for key in keys},
+                budget[0],
+                max(1, budget[1] // len(key_languages)),
+                budget[2],
+            )
+            print(f"Processing {len(keys)} strings for {', '.join(key_languages)} in {len(chunks)} multi-language chunks")
+            tasks.extend(translate_chunk(chunk, key_languages) for chunk in chunks)
+        await asyncio.gather(*tasks)
         
-        for i, (chunk, result) in enumerate(zip(chunks, results)):
-            if isinstance(result, Exception):
-                print(f"Warning: Chunk {i+1} failed: {result}")
-                # Mark all keys in this chunk as skipped due to error
-                for key in chunk:
-                    skipped_keys[key] = f"Chunk {i+1} failed: {str(result)}"
-            elif isinstance(result, dict):
-                combined_results.update(result)
-                successful_chunks += 1
-                # Check for missing keys in this chunk
-                for key in chunk:
-                    if key not in result:
-                        skipped_keys[key] = f"Not returned by API in chunk {i+1}"
-            
-        print(f"Successfully translated {successful_chunks}/{len(chunks)} chunks")
-        print(f"Total translations collected: {len(combined_results)} out of {len(keys_dict)} requested")
-        print(f"Skipped keys: {len(skipped_keys)}")
-        return combined_results, skipped_keys
+        await asyncio.gather(*(translate_language(lang, keys) for lang, keys in leftovers.items() if keys))
     
-    def run_chunks_in_thread():
-        return asyncio.run(process_all_chunks())
+    await asyncio.gather(*(
+        translate_group(group) for group in group_languages(languages, settings.translation_language_group_size)
+    ))
     
-    try:
-        # Check if we're in an event loop
+    if translation_memory is not None:
+        for lang in languages:
+            fresh = placeholders_preserved(
+                {key: value for key, value in translations[lang].items() if key not in cached_by_language[lang]}
+            )
+            if fresh:
+                await asyncio.to_thread(
+                    translation_memory.store, fresh, *translation_memory_key(source_language, lang, app_description)
+                )
+    
+    ordered = {
+        lang: {key: translations[lang][key] for key in keys_by_language[lang] if key in translations[lang]}
+        for lang in languages
+        if translations[lang]
+    }
+    return ordered, {lang: failed for lang, failed in skipped.items() if failed}
+
+
+def run_sync(coroutine: Any) -> Any:
+    """
+    Run a translation coroutine to completion from synchronous code.
+    
+    The coroutine runs on a private event loop, in a worker thread if the
+    caller is itself inside a running loop, and the pooled client bound to
+    that loop is closed afterwards.
+    
+    Args:
+        coroutine: Coroutine to run
+        
+    Returns:
+        Any: The coroutine's result
+    """
+    async def run_and_close():
         try:
-            asyncio.get_running_loop()
-            # We're in an event loop, run in a separate thread
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(run_chunks_in_thread)
-                return future.result()
-        except RuntimeError:
-            # No event loop running, safe to use asyncio.run directly
-            return asyncio.run(process_all_chunks())
-    except Exception as e:
-        raise Exception(f"Chunked translation failed: {str(e)}")
+            return await coroutine
+        finally:
+            await close_openai_client()
+    
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        # No event loop running, safe to use asyncio.run directly
+        return asyncio.run(run_and_close())
+    
+    # We're in an event loop, run in a separate thread
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, run_and_close()).result()
 
 
-def translate_single_key(
+async def translate_single_key_async(
     file_path: str,
     key: str,
     target_languages: List[str],
     source_language: str = "en",
-    app_description: Optional[str] = None
+    app_description: Optional[str] = None,
+    data: Optional[Dict[str, Any]] = None,
+    stats: Optional[TranslationStats] = None
 ) -> Tuple[Dict[str, Dict[str, str]], str, Dict[str, str]]:
     """
     Translate a single key to multiple target languages and apply translations to a Localizable.xcstrings file.
@@ -400,6 +1524,8 @@ def translate_single_key(
         target_languages (List[str]): List of target language codes
         source_language (str): Source language code (default: 'en')
         app_description (Optional[str]): Optional description of the app for better translation context
+        data (Optional[Dict[str, Any]]): Already-loaded catalog; loaded from file_path if omitted
+        stats (Optional[TranslationStats]): Counters to update for the job (requests, retries, cache hits)
         
     Returns:
         Tuple[Dict[str, Dict[str, str]], str, Dict[str, str]]: Tuple of (translations by language, backup file path, errors by language)
@@ -412,78 +1538,51 @@ def translate_single_key(
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"File not found: {file_path}")
     
-    # Get base language strings (now returns list of keys)
-    base_keys = get_base_language_strings(file_path)
-    if key not in base_keys:
-        raise KeyError(f"Key '{key}' not found in {file_path}")
-    
-    # For translation, we'll use the key as both key and value
-    single_key_dict = {key: key}
-    
-    # Create backup before modifying the file
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    backup_path = f"{file_path}.bak.{timestamp}"
-    try:
-        shutil.copy2(file_path, backup_path)
-        print(f"Created backup: {backup_path}")
-    except Exception as e:
-        raise Exception(f"Failed to create backup: {str(e)}")
-    
-    # Load the xcstrings file
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    if data is None:
+        data = await asyncio.to_thread(load_catalog, file_path)
     
-    if 'strings' not in data:
-        data['strings'] = {}
+    if key not in data.get('strings', {}):
+        raise KeyError(f"Key '{key}' not found in {file_path}")
     
-    # Translate to each target language
-    translations_by_language = {}
-    errors_by_language = {}
+    # Entries that need no translation are filled locally or left alone
+    source_texts = lookup_source_texts([key], data['strings'], data.get('sourceLanguage', source_language))
+    plan = plan_translations([key], data['strings'], source_texts=source_texts)
+    for target_lang in target_languages:
+        record_plan(plan, stats, target_lang)
     
+    # Translate to all target languages concurrently on one shared concurrency budget
+    translations_by_language, skipped_by_language = await translate_languages_async(
+        {target_lang: plan.translate for target_lang in target_languages}, source_language, app_description, stats,
+        source_texts=source_texts
+    )
     for target_lang in target_languages:
-        try:
-            # Translate the single key
-            translated, skipped = translate_strings(single_key_dict, target_lang, source_language, app_description)
-            
-            if key in translated:
-                # Apply the translation
-                if key not in data['strings']:
-                    data['strings'][key] = {"localizations": {}}
-                
-                if 'localizations' not in data['strings'][key]:
-                    data['strings'][key]['localizations'] = {}
-                
-                data['strings'][key]['localizations'][target_lang] = {
-                    "stringUnit": {
-                        "state": "translated",
-                        "value": translated[key]
-                    }
-                }
-                
-                translations_by_language[target_lang] = {key: translated[key]}
-            else:
-                error_msg = skipped.get(key, "Translation failed") if skipped else "Translation failed"
-                errors_by_language[target_lang] = error_msg
-                
-        except Exception as e:
-            errors_by_language[target_lang] = str(e)
+        if plan.verbatim:
+            translations_by_language[target_lang] = dict(plan.verbatim)
+        elif plan.skipped:
+            skipped_by_language[target_lang] = dict(plan.skipped)
+    errors_by_language = {
+        target_lang: skipped_by_language.get(target_lang, {}).get(key, "Translation failed")
+        for target_lang in target_languages
+        if target_lang not in translations_by_language
+    }
     
-    # Write back to file if we have any successful translations
+    # Write all languages back in one update, backing up the file first
+    backup_path = ""
     if translations_by_language:
-        try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            raise Exception(f"Failed to write file: {str(e)}")
+        backup_path = await catalog_writer.update(file_path, translations_by_language, backup=True)
     
     return translations_by_language, backup_path, errors_by_language
 
 
-def apply_missing_translations(
+async def apply_missing_translations_async(
     file_path: str,
     target_language: str,
     source_language: str = "en",
-    app_description: Optional[str] = None
+    app_description: Optional[str] = None,
+    data: Optional[Dict[str, Any]] = None,
+    stats: Optional[TranslationStats] = None,
+    journal: Optional[LanguageJournal] = None,
+    retry_policy: Optional[RetryPolicy] = None
 ) -> Tuple[Dict[str, str], str, str, Dict[str, str]]:
     """
     Translate and apply only missing translations for a target language in a Localizable.xcstrings file.
@@ -494,6 +1593,10 @@ def apply_missing_translations(
         target_language (str): Target language code
         source_language (str): Source language code (default: 'en')
         app_description (Optional[str]): Optional description of the app for better translation context
+        data (Optional[Dict[str, Any]]): Already-loaded catalog; loaded from file_path if omitted
+        stats (Optional[TranslationStats]): Counters to update for the job (requests, retries, cache hits)
+        journal (Optional[LanguageJournal]): Job journal to replay completed chunks from and record new ones to
+        retry_policy (Optional[RetryPolicy]): Retry policy holding the job's retry budget; a new one is created if omitted
         
     Returns:
         Tuple[Dict[str, str], str, str, Dict[str, str]]: Tuple of (translated key-value pairs, backup file path, summary message, skipped keys with reasons)
@@ -506,34 +1609,25 @@ def apply_missing_translations(
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"File not found: {file_path}")
     
-    # Load the xcstrings file to check existing translations
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    if 'strings' not in data:
-        data['strings'] = {}
+    if data is None:
+        data = await asyncio.to_thread(load_catalog, file_path)
     
-    # Get base language strings (now returns list of keys)
-    base_keys = get_base_language_strings(file_path)
+    base_keys = catalog_keys(data)
     if not base_keys:
         return {}, "", f"No base language strings found in {file_path}", {}
     
     # Filter out keys that already have translations in the target language
     missing_keys = []
     existing_translations = {}
+    strings = data['strings']
     
     for key in base_keys:
-        # Check if this key already has a translation in the target language
-        if key in data['strings']:
-            localizations = data['strings'][key].get('localizations', {})
-            if target_language in localizations:
-                # Key already has translation in target language
-                existing_translations[key] = localizations[target_language].get('stringUnit', {}).get('value', '')
-            else:
-                # Key missing translation in target language
-                missing_keys.append(key)
+        localizations = strings[key].get('localizations', {})
+        if target_language in localizations:
+            # Key already has translation in target language
+            existing_translations[key] = localizations[target_language].get('stringUnit', {}).get('value', '')
         else:
-            # Key doesn't exist at all, needs translation
+            # Key missing translation in target language
             missing_keys.append(key)
     
     total_strings = len(base_keys)
@@ -545,67 +1639,51 @@ def apply_missing_translations(
     
     print(f"Found {existing_count} existing {target_language} translations, {missing_count} missing translations")
     
-    # Translate only the missing keys
-    translations, skipped_keys = translate_strings(missing_keys, target_language, source_language, app_description)
+    # Entries that need no translation are filled locally or left alone
+    source_texts = lookup_source_texts(missing_keys, strings, data.get('sourceLanguage', source_language))
+    plan = plan_translations(missing_keys, strings, source_texts=source_texts)
+    record_plan(plan, stats)
+    
+    # Translate only the missing keys, writing them back as chunks complete if enabled
+    writer = IncrementalCatalogWriter(file_path, target_language, stats=stats)
+    translations, skipped_keys = await translate_strings_async(
+        plan.translate, target_language, source_language, app_description, stats, journal,
+        on_chunk=writer.add if writer.enabled else None,
+        retry_policy=retry_policy,
+        source_texts=source_texts
+    )
+    translations = {**plan.verbatim, **translations}
+    skipped_keys = {**plan.skipped, **skipped_keys}
     if not translations and not skipped_keys:
         return {}, "", f"Translation failed for {target_language}", {}
     
-    # Create backup before modifying the file
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    backup_path = f"{file_path}.bak.{timestamp}"
-    try:
-        shutil.copy2(file_path, backup_path)
-        print(f"Created backup: {backup_path}")
-    except Exception as e:
-        raise Exception(f"Failed to create backup: {str(e)}")
+    # Apply translations and write back to file, backing up the original before the first write
+    applied_translations = dict(translations)
+    backup_path = await writer.write(applied_translations)
     
-    # Apply translations and track successful translations
-    applied_translations = {}
-    for key, value in translations.items():
-        if key not in data['strings']:
-            # Create new string entry if it doesn't exist
-            data['strings'][key] = {
-                "localizations": {}
-            }
-        
-        if 'localizations' not in data['strings'][key]:
-            data['strings'][key]['localizations'] = {}
-        
-        # Add the translation for the target language (only if it was missing)
-        data['strings'][key]['localizations'][target_language] = {
-            "stringUnit": {
-                "state": "translated",
-                "value": value
-            }
-        }
-        applied_translations[key] = value
+    # Create summary message
+    new_translations_count = len(applied_translations)
+    total_translations_now = existing_count + new_translations_count
     
-    # Write back to file
-    try:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        
-        # Create summary message
-        new_translations_count = len(applied_translations)
-        total_translations_now = existing_count + new_translations_count
-        
-        if new_translations_count == 0:
-            summary = f"No new {target_language} translations added to {file_path} (all {missing_count} missing translations failed)"
-        elif missing_count == new_translations_count:
-            summary = f"{target_language} missing translations added to {file_path} ({new_translations_count} new, {total_translations_now}/{total_strings} total)"
-        else:
-            summary = f"{target_language} missing translations added to {file_path} ({new_translations_count}/{missing_count} new translations completed, {total_translations_now}/{total_strings} total)"
-        
-        return applied_translations, backup_path, summary, skipped_keys
-    except Exception as e:
-        raise Exception(f"Failed to write file: {str(e)}")
+    if new_translations_count == 0:
+        summary = f"No new {target_language} translations added to {file_path} (all {missing_count} missing translations failed)"
+    elif missing_count == new_translations_count:
+        summary = f"{target_language} missing translations added to {file_path} ({new_translations_count} new, {total_translations_now}/{total_strings} total)"
+    else:
+        summary = f"{target_language} missing translations added to {file_path} ({new_translations_count}/{missing_count} new translations completed, {total_translations_now}/{total_strings} total)"
+    
+    return applied_translations, backup_path, summary, skipped_keys
 
 
-def translate_and_apply(
+async def translate_and_apply_async(
     file_path: str,
     target_language: str,
     source_language: str = "en",
-    app_description: Optional[str] = None
+    app_description: Optional[str] = None,
+    data: Optional[Dict[str, Any]] = None,
+    stats: Optional[TranslationStats] = None,
+    journal: Optional[LanguageJournal] = None,
+    retry_policy: Optional[RetryPolicy] = None
 ) -> Tuple[Dict[str, str], str, str, Dict[str, str]]:
     """
     Translate base language strings and apply translations to a Localizable.xcstrings file.
@@ -615,6 +1693,10 @@ def translate_and_apply(
         target_language (str): Target language code
         source_language (str): Source language code (default: 'en')
         app_description (Optional[str]): Optional description of the app for better translation context
+        data (Optional[Dict[str, Any]]): Already-loaded catalog; loaded from file_path if omitted
+        stats (Optional[TranslationStats]): Counters to update for the job (requests, retries, cache hits)
+        journal (Optional[LanguageJournal]): Job journal to replay completed chunks from and record new ones to
+        retry_policy (Optional[RetryPolicy]): Retry policy holding the job's retry budget; a new one is created if omitted
         
     Returns:
         Tuple[Dict[str, str], str, str, Dict[str, str]]: Tuple of (translated key-value pairs, backup file path, summary message, skipped keys with reasons)
@@ -627,72 +1709,271 @@ def translate_and_apply(
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"File not found: {file_path}")
     
-    # Get base language strings (now returns list of keys)
-    base_keys = get_base_language_strings(file_path)
+    if data is None:
+        data = await asyncio.to_thread(load_catalog, file_path)
+    
+    base_keys = catalog_keys(data)
     if not base_keys:
         return {}, "", f"No base language strings found in {file_path}", {}
     
     total_strings = len(base_keys)
     
-    # Translate keys
-    translations, skipped_keys = translate_strings(base_keys, target_language, source_language, app_description)
+    # Entries that need no translation are filled locally or left alone
+    source_texts = lookup_source_texts(base_keys, data['strings'], data.get('sourceLanguage', source_language))
+    plan = plan_translations(base_keys, data['strings'], source_texts=source_texts)
+    record_plan(plan, stats)
+    
+    # Translate keys, writing them back as chunks complete if enabled
+    writer = IncrementalCatalogWriter(file_path, target_language, stats=stats)
+    translations, skipped_keys = await translate_strings_async(
+        plan.translate, target_language, source_language, app_description, stats, journal,
+        on_chunk=writer.add if writer.enabled else None,
+        retry_policy=retry_policy,
+        source_texts=source_texts
+    )
+    translations = {**plan.verbatim, **translations}
+    skipped_keys = {**plan.skipped, **skipped_keys}
     if not translations and not skipped_keys:
         return {}, "", f"Translation failed for {target_language}", {}
     
-    # Create backup before modifying the file
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    backup_path = f"{file_path}.bak.{timestamp}"
-    try:
-        shutil.copy2(file_path, backup_path)
-        print(f"Created backup: {backup_path}")
-    except Exception as e:
-        raise Exception(f"Failed to create backup: {str(e)}")
+    # Apply translations and write back to file, backing up the original before the first write
+    applied_translations = dict(translations)
+    backup_path = await writer.write(applied_translations)
     
-    # Load the xcstrings file
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    # Create summary message
+    success_count = len(applied_translations)
+    skipped_count = len(skipped_keys)
+    success_rate = f"{success_count}/{total_strings}"
     
-    if 'strings' not in data:
-        data['strings'] = {}
+    if success_count == total_strings:
+        summary = f"{target_language} added to {file_path} ({success_count} translations completed)"
+    elif skipped_count > 0:
+        summary = f"{target_language} added to {file_path} ({success_rate} translations completed, {skipped_count} failed/skipped)"
+    else:
+        summary = f"{target_language} added to {file_path} ({success_rate} translations completed)"
     
-    # Apply translations and track successful translations
-    applied_translations = {}
-    for key, value in translations.items():
-        if key not in data['strings']:
-            # Create new string entry if it doesn't exist
-            data['strings'][key] = {
-                "localizations": {}
-            }
+    return applied_translations, backup_path, summary, skipped_keys
+
+
+async def apply_languages_async(
+    file_path: str,
+    target_languages: List[str],
+    source_language: str = "en",
+    app_description: Optional[str] = None,
+    only_missing: bool = True,
+    data: Optional[Dict[str, Any]] = None,
+    stats: Optional[TranslationStats] = None,
+    retry_policy: Optional[RetryPolicy] = None
+) -> Tuple[Dict[str, Dict[str, str]], str, Dict[str, str], Dict[str, Dict[str, str]]]:
+    """
+    Translate a Localizable.xcstrings file into several languages and apply them in one write.
+    
+    The catalog is parsed once, the chunks of every language share one
+    adaptive concurrency budget, and all translations are written back
+    together with a single backup.
+    
+    Args:
+        file_path (str): Path to the .xcstrings file
+        target_languages (List[str]): List of target language codes
+        source_language (str): Source language code (default: 'en')
+        app_description (Optional[str]): Optional description of the app for better translation context
+        only_missing (bool): Translate only keys without a translation in each language (default: True)
+        data (Optional[Dict[str, Any]]): Already-loaded catalog; loaded from file_path if omitted
+        stats (Optional[TranslationStats]): Counters to update for the job (requests, retries, cache hits)
+        retry_policy (Optional[RetryPolicy]): Retry policy holding the job's retry budget; a new one is created if omitted
         
-        if 'localizations' not in data['strings'][key]:
-            data['strings'][key]['localizations'] = {}
+    Returns:
+        Tuple[Dict[str, Dict[str, str]], str, Dict[str, str], Dict[str, Dict[str, str]]]: Tuple of (translations by language, backup file path, summary message by language, skipped keys with reasons by language)
         
-        # Add or update the translation for the target language
-        data['strings'][key]['localizations'][target_language] = {
-            "stringUnit": {
-                "state": "translated",
-                "value": value
-            }
-        }
-        applied_translations[key] = value
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        json.JSONDecodeError: If the file is not valid JSON
+        Exception: If file writing fails
+    """
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"File not found: {file_path}")
     
-    # Write back to file
-    try:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        
-        # Create summary message
-        success_count = len(applied_translations)
-        skipped_count = len(skipped_keys)
-        success_rate = f"{success_count}/{total_strings}"
-        
-        if success_count == total_strings:
-            summary = f"{target_language} added to {file_path} ({success_count} translations completed)"
-        elif skipped_count > 0:
-            summary = f"{target_language} added to {file_path} ({success_rate} translations completed, {skipped_count} failed/skipped)"
-        else:
-            summary = f"{target_language} added to {file_path} ({success_rate} translations completed)"
+    if data is None:
+        data = await asyncio.to_thread(load_catalog, file_path)
+    
+    base_keys = catalog_keys(data)
+    if not base_keys:
+        return {}, "", {lang: f"No base language strings found in {file_path}" for lang in target_languages}, {}
+    
+    if only_missing:
+        keys_by_language = missing_keys_by_language(data, target_languages)
+    else:
+        keys_by_language = {lang: base_keys for lang in target_languages}
+    
+    return await _apply_keys_by_language(
+        file_path, data, keys_by_language, len(base_keys), source_language, app_description, stats, retry_policy
+    )
+
+
+async def fill_all_missing_async(
+    file_path: str,
+    source_language: str = "en",
+    app_description: Optional[str] = None,
+    data: Optional[Dict[str, Any]] = None,
+    stats: Optional[TranslationStats] = None,
+    retry_policy: Optional[RetryPolicy] = None
+) -> Tuple[Dict[str, Dict[str, str]], str, Dict[str, str], Dict[str, Dict[str, str]]]:
+    """
+    Translate and apply the missing translations of every language already in a Localizable.xcstrings file.
+    
+    Missing keys are found for all languages in one pass over the catalog,
+    every language's chunks are scheduled on one shared concurrency budget,
+    and the results are written back once with a single backup.
+    
+    Args:
+        file_path (str): Path to the .xcstrings file
+        source_language (str): Source language code, used if the catalog doesn't declare one (default: 'en')
+        app_description (Optional[str]): Optional description of the app for better translation context
+        data (Optional[Dict[str, Any]]): Already-loaded catalog; loaded from file_path if omitted
+        stats (Optional[TranslationStats]): Counters to update for the job (requests, retries, cache hits)
+        retry_policy (Optional[RetryPolicy]): Retry policy holding the job's retry budget; a new one is created if omitted
         
-        return applied_translations, backup_path, summary, skipped_keys
-    except Exception as e:
-        raise Exception(f"Failed to write file: {str(e)}")
\ No newline at end of file
+    Returns:
+        Tuple[Dict[str, Dict[str, str]], str, Dict[str, str], Dict[str, Dict[str, str]]]: Tuple of (translations by language, backup file path, summary message by language, skipped keys with reasons by language)
+        
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        json.JSONDecodeError: If the file is not valid JSON
+        Exception: If file writing fails
+    """
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"File not found: {file_path}")
+    
+    if data is None:
+        data = await asyncio.to_thread(load_catalog, file_path)
+    
+    base_keys = catalog_keys(data)
+    if not base_keys:
+        return {}, "", {}, {}
+    
+    keys_by_language = missing_keys_by_language(data)
+    return await _apply_keys_by_language(
+        file_path, data, keys_by_language, len(base_keys), data.get('sourceLanguage', source_language),
+        app_description, stats, retry_policy
+    )
+
+
+async def _apply_keys_by_language(
+    file_path: str,
+    data: Dict[str, Any],
+    keys_by_language: Dict[str, List[str]],
+    total_strings: int,
+    source_language: str,
+    app_description: Optional[str],
+    stats: Optional[TranslationStats],
+    retry_policy: Optional[RetryPolicy]
+) -> Tuple[Dict[str, Dict[str, str]], str, Dict[str, str], Dict[str, Dict[str, str]]]:
+    """Translate the given keys of each language and apply them all in one write."""
+    summaries = {}
+    for target_lang, keys in keys_by_language.items():
+        if not keys:
+            summaries[target_lang] = f"All {total_strings} strings already have {target_lang} translations"
+    
+    # Entries that need no translation are filled locally or left alone; classify each key once
+    all_keys = list(dict.fromkeys(key for keys in keys_by_language.values() for key in keys))
+    source_texts = lookup_source_texts(all_keys, data['strings'], data.get('sourceLanguage', source_language))
+    catalog_plan = plan_translations(all_keys, data['strings'], source_texts=source_texts)
+    plans = {lang: catalog_plan.for_keys(keys) for lang, keys in keys_by_language.items()}
+    for target_lang, plan in plans.items():
+        record_plan(plan, stats, target_lang)
+    
+    # Translate all languages on one shared concurrency budget, grouping languages per request if enabled
+    translations_by_language, skipped_by_language = await translate_languages_async(
+        {lang: plan.translate for lang, plan in plans.items()}, source_language, app_description, stats,
+        retry_policy=retry_policy,
+        source_texts=source_texts
+    )
+    for target_lang, plan in plans.items():
+        if plan.verbatim:
+            translations_by_language[target_lang] = {**plan.verbatim, **translations_by_language.get(target_lang, {})}
+        if plan.skipped:
+            skipped_by_language[target_lang] = {**plan.skipped, **skipped_by_language.get(target_lang, {})}
+    
+    for target_lang, keys in keys_by_language.items():
+        if not keys:
+            continue
+        translated = translations_by_language.get(target_lang, {})
+        skipped = skipped_by_language.get(target_lang, {})
+        if not translated and len(skipped) == len(plans[target_lang].skipped):
+            summaries[target_lang] = f"All translatable strings already have {target_lang} translations ({len(skipped)} not translatable)"
+        elif not translated:
+            summaries[target_lang] = f"No {target_lang} translations added ({len(keys)} requested, {len(skipped)} failed/skipped)"
+        elif skipped:
+            summaries[target_lang] = f"{target_lang}: {len(translated)}/{len(keys)} translations completed, {len(skipped)} failed/skipped"
+        else:
+            summaries[target_lang] = f"{target_lang}: {len(translated)} translations completed"
+    
+    # Write every language back in one update, backing up the file first
+    backup_path = ""
+    if translations_by_language:
+        backup_path = await catalog_writer.update(file_path, translations_by_language, backup=True)
+    
+    # Report languages in the order they were requested
+    summaries = {lang: summaries[lang] for lang in keys_by_language}
+    return translations_by_language, backup_path, summaries, skipped_by_language
+
+
+def translate_single_key(
+    file_path: str,
+    key: str,
+    target_languages: List[str],
+    source_language: str = "en",
+    app_description: Optional[str] = None,
+    data: Optional[Dict[str, Any]] = None,
+    stats: Optional[TranslationStats] = None
+) -> Tuple[Dict[str, Dict[str, str]], str, Dict[str, str]]:
+    """Synchronous version of translate_single_key_async for callers without an event loop."""
+    return run_sync(translate_single_key_async(file_path, key, target_languages, source_language, app_description, data, stats))
+
+
+def apply_languages(
+    file_path: str,
+    target_languages: List[str],
+    source_language: str = "en",
+    app_description: Optional[str] = None,
+    only_missing: bool = True,
+    data: Optional[Dict[str, Any]] = None,
+    stats: Optional[TranslationStats] = None
+) -> Tuple[Dict[str, Dict[str, str]], str, Dict[str, str], Dict[str, Dict[str, str]]]:
+    """Synchronous version of apply_languages_async for callers without an event loop."""
+    return run_sync(apply_languages_async(file_path, target_languages, source_language, app_description, only_missing, data, stats))
+
+
+def fill_all_missing(
+    file_path: str,
+    source_language: str = "en",
+    app_description: Optional[str] = None,
+    data: Optional[Dict[str, Any]] = None,
+    stats: Optional[TranslationStats] = None
+) -> Tuple[Dict[str, Dict[str, str]], str, Dict[str, str], Dict[str, Dict[str, str]]]:
+    """Synchronous version of fill_all_missing_async for callers without an event loop."""
+    return run_sync(fill_all_missing_async(file_path, source_language, app_description, data, stats))
+
+
+def apply_missing_translations(
+    file_path: str,
+    target_language: str,
+    source_language: str = "en",
+    app_description: Optional[str] = None,
+    data: Optional[Dict[str, Any]] = None,
+    stats: Optional[TranslationStats] = None
+) -> Tuple[Dict[str, str], str, str, Dict[str, str]]:
+    """Synchronous version of apply_missing_translations_async for callers without an event loop."""
+    return run_sync(apply_missing_translations_async(file_path, target_language, source_language, app_description, data, stats))
+
+
+def translate_and_apply(
+    file_path: str,
+    target_language: str,
+    source_language: str = "en",
+    app_description: Optional[str] = None,
+    data: Optional[Dict[str, Any]] = None,
+    stats: Optional[TranslationStats] = None
+) -> Tuple[Dict[str, str], str, str, Dict[str, str]]:
+    """Synchronous version of translate_and_apply_async for callers without an event loop."""
+    return run_sync(translate_and_apply_async(file_path, target_language, source_language, app_description, data, stats))
@@ -0,0 +1,67 @@
+import json
+import os
+import sys
+import types
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pytest
+
+# The server modules import each other as top-level modules
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src", "localizable_xstrings_mcp"))
+
+# Settings are read at import time; keep tests away from the real API and the user's caches
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+os.environ["TRANSLATION_MEMORY_ENABLED"] = "false"
+os.environ["TRANSLATION_JOURNAL_ENABLED"] = "false"
+
+
+class FakeCompletions:
+    """
+    Chat completions stub that answers chunk prompts with ``translate(text)`` for each string.
+
+    Set ``respond`` to take over the reply: it gets the request's texts by ID
+    and returns the response content and finish reason.
+    """
+
+    def __init__(self, translate: Callable[[str], str]):
+        self.translate = translate
+        self.respond: Optional[Callable[[Dict[str, str]], Tuple[str, str]]] = None
+        self.requests: List[Dict[str, Any]] = []
+        # Texts sent by ID, one dict per request
+        self.payloads: List[Dict[str, str]] = []
+
+    async def create(self, **request):
+        self.requests.append(request)
+        system_prompt, user_prompt = (message["content"] for message in request["messages"])
+        header, strings_json = user_prompt.split("\n", 1)
+        payload = json.loads(strings_json)
+        self.payloads.append(payload)
+        finish_reason = "stop"
+        if self.respond is not None:
+            content, finish_reason = self.respond(payload)
+        elif "each of these languages" in system_prompt:
+            languages = header[len("Translate this JSON to "):-1].split(", ")
+            content = json.dumps({id_: {lang: self.translate(text) for lang in languages} for id_, text in payload.items()})
+        else:
+            content = json.dumps({id_: self.translate(text) for id_, text in payload.items()})
+        message = types.SimpleNamespace(content=content)
+        return types.SimpleNamespace(choices=[types.SimpleNamespace(message=message, finish_reason=finish_reason)])
+
+
+@pytest.fixture(autouse=True)
+def lock_dir(monkeypatch, tmp_path):
+    """Keep catalog lock files in a temporary directory."""
+    import xcstrings_tools
+
+    monkeypatch.setattr(xcstrings_tools, "default_lock_dir", lambda: str(tmp_path / "locks"))
+
+
+@pytest.fixture
+def fake_openai(monkeypatch):
+    """Replace the pooled OpenAI client with a stub."""
+    import xcstrings_tools
+
+    completions = FakeCompletions(lambda text: f"T[{text}]")
+    client = types.SimpleNamespace(chat=types.SimpleNamespace(completions=completions))
+    monkeypatch.setattr(xcstrings_tools, "get_openai_client", lambda: client)
+    return completions
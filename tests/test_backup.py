@@ -0,0 +1,27 @@
+import os
+from pathlib import Path
+
+import xcstrings_tools
+
+
+def test_backup_is_an_independent_copy(tmp_path):
+    path = tmp_path / "Localizable.xcstrings"
+    path.write_text('{"strings" : {}}', encoding="utf-8")
+
+    backup_path = xcstrings_tools.create_backup(str(path))
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("\n")
+
+    assert not os.path.samefile(backup_path, path)
+    assert Path(backup_path).read_text(encoding="utf-8") == '{"strings" : {}}'
+
+
+def test_backups_in_the_same_second_do_not_collide(tmp_path):
+    path = tmp_path / "Localizable.xcstrings"
+    path.write_text("{}", encoding="utf-8")
+
+    first = xcstrings_tools.create_backup(str(path))
+    second = xcstrings_tools.create_backup(str(path))
+
+    assert first != second
+    assert os.path.exists(first) and os.path.exists(second)
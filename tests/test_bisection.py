@@ -0,0 +1,80 @@
+import asyncio
+import json
+
+import xcstrings_tools
+from translation_stats import TranslationStats
+
+CHUNK = {f"Text {i}": f"Text {i}" for i in range(8)}
+
+
+def translate_unless_larger_than(size, finish_reason="length"):
+    def respond(payload):
+        if len(payload) > size:
+            return '{"1": "cut off', finish_reason
+        return json.dumps({id_: f"T[{text}]" for id_, text in payload.items()}), "stop"
+    return respond
+
+
+def bisect(chunk, stats=None):
+    return asyncio.run(xcstrings_tools._translate_chunk_bisecting(
+        chunk, "Chunk 1", "de", "en", None, xcstrings_tools.create_limiter(), None, stats
+    ))
+
+
+def test_truncated_response_resends_both_halves(fake_openai):
+    fake_openai.respond = translate_unless_larger_than(2)
+    stats = TranslationStats()
+
+    translated, failed = bisect(CHUNK, stats)
+
+    assert translated == {key: f"T[{key}]" for key in CHUNK}
+    assert not failed
+    assert sorted(len(payload) for payload in fake_openai.payloads) == [2, 2, 2, 2, 4, 4, 8]
+    assert stats.chunk_splits == 3
+    # Every key is sent once per level
+    resent = [text for payload in fake_openai.payloads for text in payload.values()]
+    assert all(resent.count(key) == 3 for key in CHUNK)
+
+
+def test_malformed_json_splits_down_to_the_minimum_chunk_size(fake_openai, monkeypatch):
+    monkeypatch.setattr(xcstrings_tools.settings, "translation_min_chunk_size", 2)
+    fake_openai.respond = lambda payload: ("not json", "stop")
+
+    translated, failed = bisect(CHUNK)
+
+    assert not translated
+    assert sorted(len(payload) for payload in fake_openai.payloads) == [2, 2, 2, 2, 4, 4, 8]
+    assert set(failed) == set(CHUNK)
+    labels = {reason.split(" failed: ")[0] for reason in failed.values()}
+    assert labels == {"Chunk 1aa", "Chunk 1ab", "Chunk 1ba", "Chunk 1bb"}
+    assert all("malformed JSON response" in reason for reason in failed.values())
+
+
+def test_single_key_that_keeps_failing_is_not_split(fake_openai):
+    fake_openai.respond = lambda payload: ('{"1": "cut off', "length")
+
+    translated, failed = bisect({"Hello": "Hello"})
+
+    assert not translated
+    assert failed == {"Hello": "Chunk 1 failed: response was truncated (finish_reason=length)"}
+    assert len(fake_openai.payloads) == 1
+
+
+def test_pipeline_skips_leaf_keys_with_their_chunk_label(fake_openai):
+    poisoned = "Text 5"
+
+    def respond(payload):
+        if poisoned in payload.values():
+            return '{"1": "cut off', "length"
+        return json.dumps({id_: f"T[{text}]" for id_, text in payload.items()}), "stop"
+
+    fake_openai.respond = respond
+    stats = TranslationStats()
+
+    translated, skipped = asyncio.run(xcstrings_tools.translate_strings_async(list(CHUNK), "de", stats=stats))
+
+    assert translated == {key: f"T[{key}]" for key in CHUNK if key != poisoned}
+    assert list(skipped) == [poisoned]
+    assert skipped[poisoned].startswith("Chunk 1")
+    assert "response was truncated" in skipped[poisoned]
+    assert stats.chunk_splits == 3
@@ -0,0 +1,103 @@
+import json
+import os
+
+import pytest
+
+import xcstrings_tools
+from catalog_cache import CatalogCache, catalog_cache, load_catalog
+
+
+def write(path, strings):
+    path.write_text(json.dumps({"sourceLanguage": "en", "strings": strings, "version": "1.0"}), encoding="utf-8")
+    return str(path)
+
+
+@pytest.fixture
+def catalog_path(tmp_path):
+    return write(tmp_path / "Localizable.xcstrings", {"Hello": {}})
+
+
+def test_unchanged_file_is_parsed_once(catalog_path):
+    cache = CatalogCache(1 << 20)
+
+    first = cache.get(catalog_path)
+    second = cache.get(catalog_path)
+
+    assert second is first
+    assert (cache.misses, cache.hits) == (1, 1)
+
+
+def test_mtime_change_causes_a_reparse(catalog_path):
+    cache = CatalogCache(1 << 20)
+    first = cache.get(catalog_path)
+    stat = os.stat(catalog_path)
+    os.utime(catalog_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert cache.get(catalog_path) is not first
+    assert cache.misses == 2
+
+
+def test_size_change_causes_a_reparse(tmp_path, catalog_path):
+    cache = CatalogCache(1 << 20)
+    cache.get(catalog_path)
+    stat = os.stat(catalog_path)
+    write(tmp_path / "Localizable.xcstrings", {"Hello": {}, "Goodbye": {}})
+    # Same mtime, so only the size gives the change away
+    os.utime(catalog_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert set(cache.get(catalog_path)["strings"]) == {"Hello", "Goodbye"}
+    assert cache.misses == 2
+
+
+def test_inode_change_causes_a_reparse(tmp_path, catalog_path):
+    cache = CatalogCache(1 << 20)
+    cache.get(catalog_path)
+    stat = os.stat(catalog_path)
+    # An atomic replace with a same-sized file and the same mtime
+    replacement = write(tmp_path / "replacement.xcstrings", {"Howdy": {}})
+    os.utime(replacement, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert os.stat(replacement).st_size == stat.st_size
+    os.replace(replacement, catalog_path)
+
+    assert set(cache.get(catalog_path)["strings"]) == {"Howdy"}
+    assert cache.misses == 2
+
+
+def test_put_after_write_catalog_serves_the_next_read(catalog_path):
+    catalog_cache.clear()
+    data = xcstrings_tools.apply_translations_to_catalog(load_catalog(catalog_path), "de", {"Hello": "Hallo"})
+    misses = catalog_cache.misses
+
+    xcstrings_tools.write_catalog(catalog_path, data)
+
+    assert load_catalog(catalog_path) is data
+    assert catalog_cache.misses == misses
+    catalog_cache.clear()
+
+
+def test_byte_cap_evicts_the_least_recently_used_entry(tmp_path):
+    paths = [write(tmp_path / f"{name}.xcstrings", {name: {}}) for name in ("a", "b", "c")]
+    size = os.stat(paths[0]).st_size
+    assert all(os.stat(path).st_size == size for path in paths)
+    cache = CatalogCache(size * 2)
+
+    cache.get(paths[0])
+    cache.get(paths[1])
+    cache.get(paths[0])  # "a" is now the most recently used
+    cache.get(paths[2])  # Over the cap: "b" goes
+    misses = cache.misses
+
+    cache.get(paths[0])
+    cache.get(paths[2])
+    assert cache.misses == misses
+    cache.get(paths[1])
+    assert cache.misses == misses + 1
+
+
+def test_file_larger_than_the_cap_is_not_cached(catalog_path):
+    cache = CatalogCache(os.stat(catalog_path).st_size - 1)
+
+    cache.get(catalog_path)
+    cache.get(catalog_path)
+
+    assert cache.misses == 2
@@ -0,0 +1,72 @@
+import asyncio
+import json
+
+import xcstrings_tools
+from catalog_cache import load_catalog
+from xcstrings_tools import CatalogWriteCoordinator
+
+
+def test_writes_succeed_without_a_writable_lock_dir(fake_openai, tmp_path, monkeypatch):
+    # Lock files can't be created under a regular file
+    blocker = tmp_path / "not-a-directory"
+    blocker.write_text("", encoding="utf-8")
+    monkeypatch.setattr(xcstrings_tools, "default_lock_dir", lambda: str(blocker / "locks"))
+    monkeypatch.setattr(xcstrings_tools.settings, "translation_write_back_chunks", 0)
+    monkeypatch.setattr(xcstrings_tools.settings, "translation_write_back_seconds", 0.0)
+    path = tmp_path / "Localizable.xcstrings"
+    path.write_text(json.dumps({"sourceLanguage": "en", "strings": {"Hello": {}}, "version": "1.0"}), encoding="utf-8")
+
+    applied, backup_path, _, _ = asyncio.run(xcstrings_tools.apply_missing_translations_async(str(path), "de"))
+
+    assert applied == {"Hello": "T[Hello]"}
+    assert backup_path
+    with open(path, encoding="utf-8") as f:
+        assert json.load(f)["strings"]["Hello"]["localizations"]["de"]["stringUnit"]["value"] == "T[Hello]"
+
+
+def test_concurrent_updates_merge_into_one_write(tmp_path):
+    path = tmp_path / "Localizable.xcstrings"
+    strings = {"Hello": {}, "Goodbye": {}, "Gone": {}}
+    path.write_text(json.dumps({"sourceLanguage": "en", "strings": strings, "version": "1.0"}), encoding="utf-8")
+    snapshot = load_catalog(str(path))
+    assert "Gone" in snapshot["strings"]
+
+    # The key is deleted on disk after the callers took their snapshot
+    del strings["Gone"]
+    path.write_text(json.dumps({"sourceLanguage": "en", "strings": strings, "version": "1.0"}), encoding="utf-8")
+
+    writer = CatalogWriteCoordinator()
+
+    async def update_both():
+        return await asyncio.gather(
+            writer.update(str(path), {"de": {"Hello": "Hallo", "Gone": "Weg"}}, backup=True),
+            writer.update(str(path), {"fr": {"Hello": "Bonjour", "Goodbye": "Au revoir"}}),
+        )
+
+    backup_path, other_backup = asyncio.run(update_both())
+
+    assert writer.writes == 1
+    assert writer.merged_updates == 2
+    assert backup_path and other_backup == ""
+    with open(path, encoding="utf-8") as f:
+        written = json.load(f)["strings"]
+    assert written["Hello"]["localizations"]["de"]["stringUnit"]["value"] == "Hallo"
+    assert written["Hello"]["localizations"]["fr"]["stringUnit"]["value"] == "Bonjour"
+    assert written["Goodbye"]["localizations"]["fr"]["stringUnit"]["value"] == "Au revoir"
+    assert "Gone" not in written
+
+
+def test_updates_in_sequence_are_separate_writes(tmp_path):
+    path = tmp_path / "Localizable.xcstrings"
+    path.write_text(json.dumps({"sourceLanguage": "en", "strings": {"Hello": {}}, "version": "1.0"}), encoding="utf-8")
+    writer = CatalogWriteCoordinator()
+
+    async def update_in_turn():
+        await writer.update(str(path), {"de": {"Hello": "Hallo"}})
+        await writer.update(str(path), {"fr": {"Hello": "Bonjour"}})
+
+    asyncio.run(update_in_turn())
+
+    assert writer.writes == 2
+    with open(path, encoding="utf-8") as f:
+        assert set(json.load(f)["strings"]["Hello"]["localizations"]) == {"de", "fr"}
@@ -0,0 +1,61 @@
+import asyncio
+import json
+
+import xcstrings_tools
+from dedup import SourceTextGroups, lookup_source_texts
+
+
+def source_entry(value):
+    return {"localizations": {"en": {"stringUnit": {"state": "translated", "value": value}}}}
+
+
+def test_keys_are_grouped_by_source_language_value():
+    strings = {
+        "settings.save": source_entry("Save"),
+        "editor.save": source_entry("Save"),
+        "toolbar.save": source_entry(" Save "),
+        "Save": {},
+        "settings.cancel": source_entry("Cancel"),
+    }
+    keys = list(strings)
+
+    groups = SourceTextGroups(keys, lookup_source_texts(keys, strings, "en"))
+
+    assert groups.texts == ["Save", "Cancel"]
+    assert groups.duplicates == 3
+    assert groups.fan_out({"Save": "Guardar", "Cancel": "Cancelar"}) == {
+        "settings.save": "Guardar",
+        "editor.save": "Guardar",
+        "toolbar.save": " Guardar ",
+        "Save": "Guardar",
+        "settings.cancel": "Cancelar",
+    }
+
+
+def test_keys_without_a_source_value_are_their_own_text():
+    strings = {"Hello": {}, "greeting": {"localizations": {"de": {"stringUnit": {"value": "Hallo"}}}}}
+
+    assert lookup_source_texts(["Hello", "greeting", "missing"], strings, "en") == {
+        "Hello": "Hello",
+        "greeting": "greeting",
+        "missing": "missing",
+    }
+
+
+def test_apply_sends_source_values_once(fake_openai, tmp_path, monkeypatch):
+    monkeypatch.setattr(xcstrings_tools.settings, "translation_write_back_chunks", 0)
+    monkeypatch.setattr(xcstrings_tools.settings, "translation_write_back_seconds", 0.0)
+    strings = {
+        "settings.save": source_entry("Save"),
+        "editor.save": source_entry("Save"),
+        "settings.cancel": source_entry("Cancel"),
+    }
+    path = tmp_path / "Localizable.xcstrings"
+    path.write_text(json.dumps({"sourceLanguage": "en", "strings": strings, "version": "1.0"}), encoding="utf-8")
+
+    applied, _, _, skipped = asyncio.run(xcstrings_tools.apply_missing_translations_async(str(path), "es"))
+
+    sent = [json.loads(request["messages"][-1]["content"].split("\n", 1)[1]) for request in fake_openai.requests]
+    assert sorted(text for payload in sent for text in payload.values()) == ["Cancel", "Save"]
+    assert applied == {"settings.save": "T[Save]", "editor.save": "T[Save]", "settings.cancel": "T[Cancel]"}
+    assert not skipped
@@ -0,0 +1,91 @@
+import asyncio
+import json
+
+import pytest
+
+import xcstrings_tools
+from dedup import lookup_source_texts
+from eligibility import COPY_VERBATIM, SKIP, TRANSLATE, classify_entry, plan_translations
+
+BRANDS = {"acme"}
+
+
+def source_entry(value, **entry):
+    return {"localizations": {"en": {"stringUnit": {"state": "translated", "value": value}}}, **entry}
+
+
+@pytest.mark.parametrize("text, entry, action", [
+    ("Hello", {}, TRANSLATE),
+    ("Hello %@", {}, TRANSLATE),
+    ("Hello", {"shouldTranslate": False}, SKIP),
+    ("", {}, SKIP),
+    ("   ", {}, SKIP),
+    ("Acme", {}, COPY_VERBATIM),
+    (" ACME ", {}, COPY_VERBATIM),
+    ("%lld", {}, COPY_VERBATIM),
+    ("%@ / %@", {}, COPY_VERBATIM),
+    ("2024", {}, COPY_VERBATIM),
+])
+def test_classify_entry(text, entry, action):
+    assert classify_entry(text, entry, BRANDS)[0] == action
+
+
+def test_plan_for_catalog_keyed_by_text():
+    strings = {"Hello": {}, "Acme": {}, "%lld": {}, "": {}, "Debug": {"shouldTranslate": False}}
+    keys = list(strings)
+
+    plan = plan_translations(keys, strings, BRANDS)
+
+    assert plan.translate == ["Hello"]
+    assert plan.verbatim == {"Acme": "Acme", "%lld": "%lld"}
+    assert plan.skipped == {"": "Empty string", "Debug": "Marked shouldTranslate: false"}
+
+
+def test_plan_for_catalog_with_identifier_keys():
+    strings = {
+        "404": source_entry("Page not found"),
+        "app.name": source_entry("Acme"),
+        "count.label": source_entry("%lld"),
+        "empty.label": source_entry(""),
+        "debug.label": source_entry("Debug", shouldTranslate=False),
+        "greeting": source_entry("Hello"),
+    }
+    keys = list(strings)
+
+    plan = plan_translations(keys, strings, BRANDS, lookup_source_texts(keys, strings, "en"))
+
+    assert plan.translate == ["404", "greeting"]
+    assert plan.verbatim == {"app.name": "Acme", "count.label": "%lld"}
+    assert set(plan.skipped) == {"empty.label", "debug.label"}
+
+
+def test_plan_for_keys_keeps_source_texts():
+    strings = {"app.name": source_entry("Acme"), "greeting": source_entry("Hello")}
+    keys = list(strings)
+    plan = plan_translations(keys, strings, BRANDS, lookup_source_texts(keys, strings, "en"))
+
+    part = plan.for_keys(["app.name"])
+
+    assert part.verbatim == {"app.name": "Acme"}
+    assert part.source_texts == {"app.name": "Acme"}
+
+
+def test_apply_missing_uses_source_values(fake_openai, tmp_path, monkeypatch):
+    monkeypatch.setattr(xcstrings_tools.settings, "translation_brand_names", "Acme")
+    monkeypatch.setattr(xcstrings_tools.settings, "translation_write_back_chunks", 0)
+    monkeypatch.setattr(xcstrings_tools.settings, "translation_write_back_seconds", 0.0)
+    strings = {
+        "404": source_entry("Page not found"),
+        "app.name": source_entry("Acme"),
+        "count.label": source_entry("%lld"),
+        "empty.label": source_entry(""),
+    }
+    path = tmp_path / "Localizable.xcstrings"
+    path.write_text(json.dumps({"sourceLanguage": "en", "strings": strings, "version": "1.0"}), encoding="utf-8")
+
+    applied, _, _, skipped = asyncio.run(xcstrings_tools.apply_missing_translations_async(str(path), "de"))
+
+    sent = [json.loads(request["messages"][-1]["content"].split("\n", 1)[1]) for request in fake_openai.requests]
+    assert [list(payload.values()) for payload in sent] == [["Page not found"]]
+    assert applied == {"404": "T[Page not found]", "app.name": "Acme", "count.label": "%lld"}
+    assert set(skipped) == {"empty.label"}
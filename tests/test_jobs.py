@@ -0,0 +1,65 @@
+import asyncio
+import json
+
+import pytest
+
+import xcstrings_tools
+from jobs import JobManager
+
+
+@pytest.fixture
+def catalog_path(tmp_path):
+    strings = {f"Item {i}": {} for i in range(4)}
+    path = tmp_path / "Localizable.xcstrings"
+    path.write_text(json.dumps({"sourceLanguage": "en", "strings": strings, "version": "1.0"}), encoding="utf-8")
+    return str(path)
+
+
+def stall_after_first_request(fake_openai):
+    """Answer the first chunk request and leave every later one waiting."""
+    answer = fake_openai.create
+
+    async def create(**request):
+        if fake_openai.requests:
+            fake_openai.requests.append(request)
+            await asyncio.Event().wait()
+        return await answer(**request)
+
+    fake_openai.create = create
+
+
+async def run_and_cancel(catalog_path, until):
+    manager = JobManager()
+    job = manager.start(catalog_path, ["de"])
+    while not until(job):
+        await asyncio.sleep(0.01)
+    manager.cancel(job.id)
+    await asyncio.gather(job.task, return_exceptions=True)
+    return job
+
+
+def test_cancel_reports_translations_already_written_back(fake_openai, monkeypatch, catalog_path):
+    monkeypatch.setattr(xcstrings_tools.settings, "translation_chunk_size", 2)
+    monkeypatch.setattr(xcstrings_tools.settings, "translation_write_back_chunks", 1)
+    stall_after_first_request(fake_openai)
+
+    job = asyncio.run(run_and_cancel(catalog_path, lambda job: job.stats["de"].keys_written))
+
+    assert job.status == "cancelled"
+    assert job.language_summary["de"] == "Cancelled after writing 2 translations to the catalog"
+    assert job.backups["de"]
+    with open(catalog_path, encoding="utf-8") as f:
+        written = [key for key, entry in json.load(f)["strings"].items() if "de" in entry.get("localizations", {})]
+    assert len(written) == 2
+
+
+def test_cancel_without_write_back_reports_nothing_written(fake_openai, monkeypatch, catalog_path):
+    monkeypatch.setattr(xcstrings_tools.settings, "translation_chunk_size", 2)
+    monkeypatch.setattr(xcstrings_tools.settings, "translation_write_back_chunks", 0)
+    monkeypatch.setattr(xcstrings_tools.settings, "translation_write_back_seconds", 0.0)
+    stall_after_first_request(fake_openai)
+
+    job = asyncio.run(run_and_cancel(catalog_path, lambda job: len(fake_openai.requests) >= 2))
+
+    assert job.language_summary["de"] == "Cancelled; no changes written for this language"
+    assert "de" not in job.backups
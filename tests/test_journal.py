@@ -0,0 +1,100 @@
+import asyncio
+import json
+
+import pytest
+
+import xcstrings_tools
+from jobs import JobManager
+from journal import JobJournal
+
+KEYS = [f"Text {i}" for i in range(6)]
+
+
+@pytest.fixture
+def journal_dir(monkeypatch, tmp_path):
+    directory = tmp_path / "journal"
+    monkeypatch.setattr(xcstrings_tools.settings, "translation_journal_enabled", True)
+    monkeypatch.setattr(xcstrings_tools.settings, "translation_journal_dir", str(directory))
+    return directory
+
+
+@pytest.fixture
+def catalog_path(tmp_path, monkeypatch):
+    # Three chunks of two, sent one at a time, and nothing written before the language finishes
+    monkeypatch.setattr(xcstrings_tools.settings, "translation_chunk_size", 2)
+    monkeypatch.setattr(xcstrings_tools.settings, "translation_initial_concurrent_chunks", 1)
+    monkeypatch.setattr(xcstrings_tools.settings, "translation_max_concurrent_chunks", 1)
+    monkeypatch.setattr(xcstrings_tools.settings, "translation_write_back_chunks", 0)
+    monkeypatch.setattr(xcstrings_tools.settings, "translation_write_back_seconds", 0.0)
+    path = tmp_path / "Localizable.xcstrings"
+    strings = {key: {} for key in KEYS}
+    path.write_text(json.dumps({"sourceLanguage": "en", "strings": strings, "version": "1.0"}), encoding="utf-8")
+    return str(path)
+
+
+def test_resume_sends_only_unjournaled_texts(fake_openai, journal_dir, catalog_path):
+    answer = fake_openai.create
+
+    async def stall_after_two_chunks(**request):
+        if len(fake_openai.payloads) >= 2:
+            await asyncio.Event().wait()
+        return await answer(**request)
+
+    fake_openai.create = stall_after_two_chunks
+
+    async def start_and_kill():
+        job = JobManager().start(catalog_path, ["de"])
+        while job.stats["de"].chunks_done < 2:
+            await asyncio.sleep(0.01)
+        job.task.cancel()
+        await asyncio.gather(job.task, return_exceptions=True)
+        return job
+
+    first = asyncio.run(start_and_kill())
+    first_texts = [text for payload in fake_openai.payloads[:2] for text in payload.values()]
+    assert first.status == "cancelled"
+    assert (journal_dir / f"{first.id}.jsonl").exists()
+
+    # A new server process picks the job up from its journal
+    fake_openai.create = answer
+    fake_openai.payloads.clear()
+
+    async def resume():
+        job = await JobManager().resume(first.id)
+        await job.task
+        return job
+
+    resumed = asyncio.run(resume())
+
+    resent = [text for payload in fake_openai.payloads for text in payload.values()]
+    assert sorted(resent) == sorted(key for key in KEYS if key not in first_texts)
+    assert resumed.status == "completed"
+    assert resumed.stats["de"].journal_replayed == 4
+    with open(catalog_path, encoding="utf-8") as f:
+        strings = json.load(f)["strings"]
+    assert {key: strings[key]["localizations"]["de"]["stringUnit"]["value"] for key in KEYS} == {
+        key: f"T[{key}]" for key in KEYS
+    }
+    # Nothing left to resume
+    assert not (journal_dir / f"{first.id}.jsonl").exists()
+
+
+def test_torn_final_line_is_ignored_and_terminated(tmp_path):
+    journal = JobJournal.create(str(tmp_path), "abc123", {"file_path": "Localizable.xcstrings", "languages": ["de"]})
+    journal.record_chunk("de", {"Hello": "Hallo"})
+    # A crash in the middle of the next append
+    with open(journal.path, "ab") as f:
+        f.write(b'{"type": "chunk", "language": "de", "transla')
+
+    reopened = JobJournal.open(str(tmp_path), "abc123")
+    assert reopened.translations("de") == {"Hello": "Hallo"}
+    assert reopened.params == {"file_path": "Localizable.xcstrings", "languages": ["de"]}
+
+    reopened.record_chunk("de", {"Goodbye": "Tschüss"})
+    reopened.record_language_done("de")
+
+    again = JobJournal.open(str(tmp_path), "abc123")
+    assert again.translations("de") == {"Hello": "Hallo", "Goodbye": "Tschüss"}
+    assert again.completed_languages() == {"de"}
+    with open(journal.path, "rb") as f:
+        assert f.read().endswith(b"\n")
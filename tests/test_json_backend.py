@@ -0,0 +1,106 @@
+import json
+
+import pytest
+
+import json_backend
+from xcstrings_format import dumps_catalog
+
+BACKENDS = list(json_backend.available_backends())
+
+VALID_DOCUMENTS = {
+    "duplicate keys": '{"a": 1, "b": 2, "a": 3}',
+    "NaN": '{"value": NaN, "inf": Infinity, "-inf": -Infinity}',
+    "huge integers": '{"big": 123456789012345678901234567890, "neg": -98765432109876543210987654321}',
+    "lone surrogates": '{"high": "\\ud800", "low": "x\\udfffy", "\\udbff": "key"}',
+    "escaped slashes": '{"path": "a\\/b", "unicode": "Gr\\u00fc\\u00dfe \\ud83d\\ude00"}',
+    "nested catalog": json.dumps({
+        "sourceLanguage": "en",
+        "strings": {
+            "Hello %@": {"localizations": {"de": {"stringUnit": {"state": "translated", "value": "Hallo %@"}}}},
+            "": {},
+        },
+        "version": "1.0",
+    }),
+}
+
+INVALID_DOCUMENTS = {
+    "truncated": '{"a": 1',
+    "trailing comma": '{"a": 1,}',
+    "trailing data": '{"a": 1} {"b": 2}',
+    "single quotes": "{'a': 1}",
+    "empty": "",
+    "bare control character": '{"a": "line\nbreak"}',
+}
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request, monkeypatch):
+    """Route json_backend.loads through each installed backend in turn."""
+    fast_loads = None if request.param == "stdlib" else json_backend.available_backends()[request.param]
+    monkeypatch.setattr(json_backend, "_fast_loads", fast_loads)
+    return request.param
+
+
+def same_document(left, right):
+    # NaN != NaN, so compare the serialized forms
+    return json.dumps(left, sort_keys=True) == json.dumps(right, sort_keys=True)
+
+
+@pytest.mark.parametrize("name", VALID_DOCUMENTS)
+def test_matches_stdlib_on_text(backend, name):
+    text = VALID_DOCUMENTS[name]
+
+    assert same_document(json_backend.loads(text), json.loads(text))
+
+
+@pytest.mark.parametrize("name", VALID_DOCUMENTS)
+def test_matches_stdlib_on_bytes(backend, name):
+    data = VALID_DOCUMENTS[name].encode("utf-8", "surrogatepass")
+
+    assert same_document(json_backend.loads(data), json.loads(data))
+
+
+@pytest.mark.parametrize("text", ["18446744073709551616", "-9223372036854775809", '{"a": [1, 10000000000000000000000]}'])
+def test_integers_outside_64_bits_stay_exact(backend, text):
+    # 1e22 == 10**22, so compare representations to tell floats from ints
+    assert repr(json_backend.loads(text)) == repr(json.loads(text))
+
+
+def test_utf8_bom_in_bytes_matches_stdlib(backend):
+    data = b'\xef\xbb\xbf{"a": "\xc3\xa9"}'
+
+    assert json_backend.loads(data) == json.loads(data) == {"a": "é"}
+
+
+@pytest.mark.parametrize("name", INVALID_DOCUMENTS)
+def test_invalid_input_raises_json_decode_error(backend, name):
+    text = INVALID_DOCUMENTS[name]
+
+    with pytest.raises(json.JSONDecodeError):
+        json_backend.loads(text)
+    with pytest.raises(json.JSONDecodeError):
+        json_backend.loads(text.encode("utf-8"))
+
+
+def test_utf8_bom_in_text_is_rejected(backend):
+    with pytest.raises(json.JSONDecodeError):
+        json_backend.loads('\ufeff{"a": 1}')
+
+
+def test_invalid_utf8_raises_like_stdlib(backend):
+    data = b'{"a": "\xff"}'
+
+    with pytest.raises(Exception) as expected:
+        json.loads(data)
+    with pytest.raises(type(expected.value)):
+        json_backend.loads(data)
+
+
+@pytest.mark.parametrize("name", ["duplicate keys", "lone surrogates", "escaped slashes", "nested catalog"])
+def test_round_trips_through_catalog_serializer(backend, name):
+    document = json_backend.loads(VALID_DOCUMENTS[name])
+    text = dumps_catalog(document)
+
+    assert json_backend.loads(text) == document
+    assert json.loads(text) == document
+    assert dumps_catalog(json_backend.loads(text.encode("utf-8", "surrogatepass"))) == text
@@ -0,0 +1,59 @@
+import asyncio
+import json
+
+import xcstrings_tools
+
+KEYS = ["Hello", "Goodbye", "Thanks"]
+
+
+def languages_of(request):
+    header = request["messages"][-1]["content"].split("\n", 1)[0]
+    return header[len("Translate this JSON to "):-1].split(", ")
+
+
+def omitting(fake_openai, omitted):
+    """Leave the given (language, text) pairs out of multi-language responses."""
+    answer = fake_openai.create
+
+    async def create(**request):
+        response = await answer(**request)
+        if len(languages_of(request)) > 1:
+            payload = fake_openai.payloads[-1]
+            content = json.loads(response.choices[0].message.content)
+            for id_, translations in content.items():
+                for lang in list(translations):
+                    if (lang, payload[id_]) in omitted:
+                        del translations[lang]
+            response.choices[0].message.content = json.dumps(content)
+        return response
+
+    fake_openai.create = create
+
+
+def test_languages_missing_from_a_multi_response_fall_back_to_single_requests(fake_openai, monkeypatch):
+    monkeypatch.setattr(xcstrings_tools.settings, "translation_language_group_size", 2)
+    omitting(fake_openai, {("es", "Goodbye"), ("fr", "Thanks")})
+
+    results, skipped = asyncio.run(xcstrings_tools.translate_languages_async({"es": KEYS, "fr": KEYS}, "en"))
+
+    singles = [
+        (languages_of(request), sorted(payload.values()))
+        for request, payload in zip(fake_openai.requests, fake_openai.payloads)
+        if len(languages_of(request)) == 1
+    ]
+    assert sorted(singles) == [(["es"], ["Goodbye"]), (["fr"], ["Thanks"])]
+    assert len(fake_openai.requests) == 3
+    assert results == {lang: {key: f"T[{key}]" for key in KEYS} for lang in ("es", "fr")}
+    assert not any(skipped.values())
+
+
+def test_multi_language_prompt_keeps_the_placeholder_rules(fake_openai, monkeypatch):
+    monkeypatch.setattr(xcstrings_tools.settings, "translation_language_group_size", 2)
+
+    asyncio.run(xcstrings_tools.translate_languages_async({"es": KEYS, "fr": KEYS}, "en"))
+    asyncio.run(xcstrings_tools.translate_strings_async(KEYS, "de", "en"))
+
+    multi, single = (request["messages"][0]["content"] for request in fake_openai.requests)
+    assert "each of these languages: es, fr" in multi
+    assert xcstrings_tools.PLACEHOLDER_RULES in multi
+    assert xcstrings_tools.PLACEHOLDER_RULES in single
@@ -0,0 +1,68 @@
+import asyncio
+import json
+
+import pytest
+
+import xcstrings_tools
+from translation_stats import TranslationStats
+
+KEYS = [f"Text {i}" for i in range(12)]
+
+
+@pytest.fixture
+def one_chunk_at_a_time(monkeypatch):
+    # 12 keys in chunks of at most 5 plan as three chunks of 4, leaving room for one requeued key each
+    monkeypatch.setattr(xcstrings_tools.settings, "translation_chunk_size", 5)
+    monkeypatch.setattr(xcstrings_tools.settings, "translation_initial_concurrent_chunks", 1)
+    monkeypatch.setattr(xcstrings_tools.settings, "translation_max_concurrent_chunks", 1)
+
+
+def dropping(fake_openai, should_drop):
+    """Leave out texts from responses while ``should_drop(text, times_sent)`` is true."""
+    sent = {}
+
+    def respond(payload):
+        response = {}
+        for id_, text in payload.items():
+            sent[text] = sent.get(text, 0) + 1
+            if not should_drop(text, sent[text]):
+                response[id_] = f"T[{text}]"
+        return json.dumps(response), "stop"
+
+    fake_openai.respond = respond
+
+
+def translate(stats):
+    return asyncio.run(xcstrings_tools.translate_strings_async(KEYS, "de", stats=stats))
+
+
+def test_dropped_keys_are_merged_into_later_chunks(fake_openai, one_chunk_at_a_time):
+    dropping(fake_openai, lambda text, times_sent: text == "Text 1" and times_sent == 1)
+    stats = TranslationStats()
+
+    translated, skipped = translate(stats)
+
+    assert translated == {key: f"T[{key}]" for key in KEYS}
+    assert not skipped
+    # No extra request for the dropped key: it rides along with the next planned chunk
+    assert [len(payload) for payload in fake_openai.payloads] == [4, 5, 4]
+    assert "Text 1" in fake_openai.payloads[1].values()
+    assert stats.requeued_keys == 1
+    assert stats.keys_skipped == 0
+    assert stats.keys_translated == 12
+
+
+def test_keys_dropped_every_time_are_skipped_after_max_attempts(fake_openai, one_chunk_at_a_time, monkeypatch):
+    monkeypatch.setattr(xcstrings_tools.settings, "translation_max_key_attempts", 3)
+    dropping(fake_openai, lambda text, times_sent: text == "Text 1")
+    stats = TranslationStats()
+
+    translated, skipped = translate(stats)
+
+    assert translated == {key: f"T[{key}]" for key in KEYS if key != "Text 1"}
+    assert skipped == {"Text 1": "Not returned by API after 3 attempts"}
+    assert [len(payload) for payload in fake_openai.payloads] == [4, 5, 5]
+    assert sum(list(payload.values()).count("Text 1") for payload in fake_openai.payloads) == 3
+    assert stats.requeued_keys == 2
+    assert stats.keys_skipped == 1
+    assert stats.keys_translated == 11
@@ -0,0 +1,140 @@
+import email.utils
+import time
+
+import httpx
+import openai
+import pytest
+
+import retry
+from retry import RetryPolicy, parse_duration, retry_after_from_headers
+
+REQUEST = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+
+
+def status_error(status, headers=None):
+    response = httpx.Response(status, headers=headers or {}, request=REQUEST)
+    if status == 429:
+        return openai.RateLimitError("rate limited", response=response, body=None)
+    if status >= 500:
+        return openai.InternalServerError("server error", response=response, body=None)
+    return openai.BadRequestError("bad request", response=response, body=None)
+
+
+@pytest.fixture(autouse=True)
+def full_backoff(monkeypatch):
+    """Make jitter deterministic by always picking the top of the range."""
+    monkeypatch.setattr(retry.random, "uniform", lambda low, high: high)
+
+
+@pytest.mark.parametrize("value, seconds", [
+    ("1", 1.0),
+    ("0.5", 0.5),
+    ("1s", 1.0),
+    ("20ms", 0.02),
+    ("6m0s", 360.0),
+    ("1h2m3.5s", 3723.5),
+    (" 2s ", 2.0),
+])
+def test_parse_duration(value, seconds):
+    assert parse_duration(value) == pytest.approx(seconds)
+
+
+@pytest.mark.parametrize("value", ["", "soon", "6m0", "1s garbage", "1d"])
+def test_parse_duration_rejects_malformed_values(value):
+    assert parse_duration(value) is None
+
+
+def test_retry_after_ms_takes_precedence():
+    headers = httpx.Headers({"retry-after-ms": "1500", "retry-after": "30", "x-ratelimit-reset-requests": "6m0s"})
+
+    assert retry_after_from_headers(headers) == pytest.approx(1.5)
+
+
+def test_retry_after_in_seconds():
+    assert retry_after_from_headers(httpx.Headers({"retry-after": "7"})) == 7.0
+
+
+def test_retry_after_as_http_date():
+    retry_at = email.utils.formatdate(time.time() + 30, usegmt=True)
+
+    assert retry_after_from_headers(httpx.Headers({"retry-after": retry_at})) == pytest.approx(30, abs=2)
+
+
+def test_retry_after_http_date_in_the_past_means_no_wait():
+    retry_at = email.utils.formatdate(time.time() - 30, usegmt=True)
+
+    assert retry_after_from_headers(httpx.Headers({"retry-after": retry_at})) == 0.0
+
+
+def test_rate_limit_resets_use_the_longest():
+    headers = httpx.Headers({"x-ratelimit-reset-requests": "20ms", "x-ratelimit-reset-tokens": "6m0s"})
+
+    assert retry_after_from_headers(headers) == pytest.approx(360.0)
+
+
+def test_unparseable_headers_are_ignored():
+    headers = httpx.Headers({"retry-after": "later", "x-ratelimit-reset-requests": "soon", "x-ratelimit-reset-tokens": "20ms"})
+
+    assert retry_after_from_headers(headers) == pytest.approx(0.02)
+    assert retry_after_from_headers(httpx.Headers({})) is None
+
+
+def test_backoff_doubles_up_to_max_delay():
+    policy = RetryPolicy(max_attempts=10, base_delay=1.0, max_delay=5.0, budget=10)
+    error = openai.APITimeoutError(request=REQUEST)
+
+    assert [policy.next_delay(error, attempt) for attempt in range(1, 6)] == [1.0, 2.0, 4.0, 5.0, 5.0]
+
+
+def test_requested_delay_takes_precedence_over_backoff():
+    policy = RetryPolicy(max_attempts=5, base_delay=1.0, max_delay=60.0, budget=10)
+
+    delay = policy.next_delay(status_error(429, {"x-ratelimit-reset-tokens": "20ms"}), 1)
+
+    # The requested wait plus a tenth of the backoff as jitter
+    assert delay == pytest.approx(0.02 + 0.1)
+
+
+def test_requested_delay_above_max_delay_gives_up():
+    policy = RetryPolicy(max_attempts=5, base_delay=1.0, max_delay=60.0, budget=10)
+
+    assert policy.next_delay(status_error(429, {"retry-after": "120"}), 1) is None
+    assert policy.remaining_budget == 10
+
+
+def test_gives_up_after_max_attempts():
+    policy = RetryPolicy(max_attempts=3, base_delay=1.0, max_delay=60.0, budget=10)
+    error = status_error(503)
+
+    assert policy.next_delay(error, 2) is not None
+    assert policy.next_delay(error, 3) is None
+
+
+@pytest.mark.parametrize("error", [status_error(400), ValueError("bad response")])
+def test_non_retryable_errors_are_not_retried(error):
+    policy = RetryPolicy(max_attempts=5, base_delay=1.0, max_delay=60.0, budget=10)
+
+    assert policy.next_delay(error, 1) is None
+    assert policy.remaining_budget == 10
+
+
+@pytest.mark.parametrize("error", [
+    status_error(429),
+    status_error(500),
+    openai.APITimeoutError(request=REQUEST),
+    openai.APIConnectionError(request=REQUEST),
+])
+def test_transient_errors_are_retried(error):
+    policy = RetryPolicy(max_attempts=5, base_delay=1.0, max_delay=60.0, budget=10)
+
+    assert policy.next_delay(error, 1) == 1.0
+
+
+def test_each_retry_spends_the_budget():
+    policy = RetryPolicy(max_attempts=5, base_delay=1.0, max_delay=60.0, budget=2)
+    error = status_error(500)
+
+    assert policy.next_delay(error, 1) is not None
+    assert policy.next_delay(error, 1) is not None
+    assert policy.remaining_budget == 0
+    assert policy.next_delay(error, 1) is None
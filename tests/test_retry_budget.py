@@ -0,0 +1,96 @@
+import asyncio
+
+import httpx
+import openai
+import pytest
+
+import server
+import xcstrings_tools
+from jobs import JobManager
+from translation_stats import TranslationStats
+
+
+@pytest.fixture
+def timeouts(fake_openai, monkeypatch):
+    """Fail every request with a retryable timeout and retry without waiting."""
+    async def create(**request):
+        fake_openai.requests.append(request)
+        raise openai.APITimeoutError(request=httpx.Request("POST", "https://api.openai.com/v1/chat/completions"))
+
+    fake_openai.create = create
+    monkeypatch.setattr(xcstrings_tools.settings, "translation_retry_base_delay", 0.0)
+    monkeypatch.setattr(xcstrings_tools.settings, "translation_retry_max_delay", 0.0)
+    monkeypatch.setattr(xcstrings_tools.settings, "translation_retry_budget", 3)
+    return fake_openai
+
+
+def test_languages_share_one_retry_budget(timeouts):
+    stats = TranslationStats()
+    keys = ["Hello", "Goodbye"]
+
+    translations, skipped = asyncio.run(
+        xcstrings_tools.translate_languages_async({"es": keys, "fr": keys, "de": keys}, "en", stats=stats)
+    )
+
+    assert not any(translations.values())
+    assert all(set(skipped[lang]) == set(keys) for lang in ("es", "fr", "de"))
+    assert stats.retries == 3
+
+
+def test_given_retry_policy_is_used(timeouts):
+    stats = TranslationStats()
+    retry_policy = xcstrings_tools.create_retry_policy(budget=1)
+
+    asyncio.run(xcstrings_tools.translate_strings_async(["Hello"], "es", stats=stats, retry_policy=retry_policy))
+    asyncio.run(xcstrings_tools.translate_strings_async(["Goodbye"], "fr", stats=stats, retry_policy=retry_policy))
+
+    assert stats.retries == 1
+    assert retry_policy.remaining_budget == 0
+
+
+def test_job_languages_share_one_retry_budget(timeouts, tmp_path):
+    path = tmp_path / "Localizable.xcstrings"
+    path.write_text('{"sourceLanguage": "en", "strings": {"Hello": {}}, "version": "1.0"}', encoding="utf-8")
+
+    async def run_job():
+        job = JobManager().start(str(path), ["es", "fr", "de"])
+        await job.task
+        return job
+
+    job = asyncio.run(run_job())
+
+    assert sum(stats.retries for stats in job.stats.values()) == 3
+
+
+def test_job_retry_budget_overrides_the_setting(timeouts, tmp_path):
+    path = tmp_path / "Localizable.xcstrings"
+    path.write_text('{"sourceLanguage": "en", "strings": {"Hello": {}}, "version": "1.0"}', encoding="utf-8")
+
+    async def run_job():
+        job = JobManager().start(str(path), ["es", "fr"], retry_budget=1)
+        await job.task
+        return job
+
+    job = asyncio.run(run_job())
+
+    assert sum(stats.retries for stats in job.stats.values()) == 1
+
+
+def test_tool_retry_budget_overrides_the_setting(timeouts, tmp_path):
+    path = tmp_path / "Localizable.xcstrings"
+    path.write_text('{"sourceLanguage": "en", "strings": {"Hello": {}}, "version": "1.0"}', encoding="utf-8")
+
+    result = asyncio.run(server.apply_languages_tool(str(path), "es,fr", retry_budget=0))
+
+    assert "Error" not in result.splitlines()[0]
+    # One attempt per language, no retries
+    assert len(timeouts.requests) == 2
+
+
+def test_tools_reject_negative_retry_budgets(tmp_path):
+    path = tmp_path / "Localizable.xcstrings"
+    path.write_text('{"sourceLanguage": "en", "strings": {}, "version": "1.0"}', encoding="utf-8")
+
+    result = asyncio.run(server.start_translation_job_tool(str(path), "es", retry_budget=-1))
+
+    assert result.startswith("Error: Invalid retry budget")
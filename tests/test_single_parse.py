@@ -0,0 +1,74 @@
+import asyncio
+import json
+import types
+
+import pytest
+
+import catalog_cache
+import json_backend
+import server
+import xcstrings_tools
+from catalog_cache import catalog_cache as cache
+
+
+@pytest.fixture
+def parses(monkeypatch, fake_openai):
+    """Count catalog parses made through the catalog cache."""
+    calls = []
+
+    def counting_loads(data):
+        calls.append(len(data))
+        return json_backend.loads(data)
+
+    monkeypatch.setattr(catalog_cache, "json_backend", types.SimpleNamespace(loads=counting_loads))
+    monkeypatch.setattr(xcstrings_tools.settings, "translation_write_back_chunks", 0)
+    monkeypatch.setattr(xcstrings_tools.settings, "translation_write_back_seconds", 0.0)
+    cache.clear()
+    yield calls
+    cache.clear()
+
+
+@pytest.fixture
+def catalog_path(tmp_path):
+    strings = {f"Item {i}": {} for i in range(12)}
+    strings["Item 0"] = {"localizations": {"de": {"stringUnit": {"state": "translated", "value": "Eintrag 0"}}}}
+    path = tmp_path / "Localizable.xcstrings"
+    path.write_text(json.dumps({"sourceLanguage": "en", "strings": strings, "version": "1.0"}), encoding="utf-8")
+    return str(path)
+
+
+def read_catalog(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_apply_tool_parses_catalog_once(parses, catalog_path):
+    result = asyncio.run(server.apply_tool(catalog_path, "fr"))
+
+    assert "Backup created" in result
+    assert len(parses) == 1
+    strings = read_catalog(catalog_path)["strings"]
+    assert all("fr" in entry["localizations"] for entry in strings.values())
+
+
+def test_apply_missing_parses_catalog_once(parses, catalog_path):
+    writes_before = xcstrings_tools.catalog_writer.writes
+    applied, backup_path, _, skipped = asyncio.run(
+        xcstrings_tools.apply_missing_translations_async(catalog_path, "de")
+    )
+
+    assert len(applied) == 11 and not skipped
+    assert backup_path
+    # The write-back re-reads the file under the lock; that must be served from the cache
+    assert xcstrings_tools.catalog_writer.writes == writes_before + 1
+    assert len(parses) == 1
+
+
+def test_each_call_parses_once(parses, catalog_path):
+    asyncio.run(server.apply_missing_tool(catalog_path, "fr"))
+    assert len(parses) == 1
+
+    # A fresh call after the cache is dropped parses again, once
+    cache.clear()
+    asyncio.run(server.apply_missing_tool(catalog_path, "es"))
+    assert len(parses) == 2
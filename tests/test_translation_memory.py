@@ -0,0 +1,74 @@
+import asyncio
+
+import pytest
+
+import xcstrings_tools
+from translation_memory import TranslationMemory
+from translation_stats import TranslationStats
+
+
+@pytest.fixture
+def memory(monkeypatch, tmp_path):
+    memory = TranslationMemory(str(tmp_path / "memory.sqlite3"), 1000)
+    monkeypatch.setattr(xcstrings_tools, "translation_memory", memory)
+    return memory
+
+
+def lookup(memory, texts, target_language="es"):
+    return memory.lookup(texts, *xcstrings_tools.translation_memory_key("en", target_language, None))
+
+
+def test_modified_placeholders_are_applied_but_not_remembered(memory, fake_openai):
+    fake_openai.translate = lambda text: "Hola %1$@" if text == "Hello %@" else f"T[{text}]"
+
+    translated, _ = asyncio.run(xcstrings_tools.translate_strings_async(["Hello %@", "Goodbye"], "es", "en"))
+
+    assert translated == {"Hello %@": "Hola %1$@", "Goodbye": "T[Goodbye]"}
+    assert lookup(memory, ["Hello %@", "Goodbye"]) == {"Goodbye": "T[Goodbye]"}
+
+
+def test_modified_placeholders_in_memory_are_not_reused(memory, fake_openai):
+    memory.store({"Hello %@": "Hola"}, *xcstrings_tools.translation_memory_key("en", "es", None))
+
+    translated, _ = asyncio.run(xcstrings_tools.translate_strings_async(["Hello %@"], "es", "en"))
+
+    assert translated == {"Hello %@": "T[Hello %@]"}
+    assert len(fake_openai.requests) == 1
+
+
+def test_multi_language_path_skips_modified_placeholders(memory, fake_openai, monkeypatch):
+    monkeypatch.setattr(xcstrings_tools.settings, "translation_language_group_size", 2)
+    fake_openai.translate = lambda text: "%d elementos" if text == "%lld items" else f"T[{text}]"
+
+    keys = ["%lld items", "Done"]
+    results, _ = asyncio.run(xcstrings_tools.translate_languages_async({"es": keys, "fr": keys}, "en"))
+
+    assert len(fake_openai.requests) == 1
+    assert results["es"]["%lld items"] == "%d elementos"
+    assert lookup(memory, ["%lld items", "Done"], "es") == {"Done": "T[Done]"}
+    assert lookup(memory, ["%lld items", "Done"], "fr") == {"Done": "T[Done]"}
+
+
+def test_unusable_memory_is_disabled_instead_of_failing(monkeypatch, tmp_path, fake_openai):
+    blocker = tmp_path / "not-a-directory"
+    blocker.write_text("", encoding="utf-8")
+    memory = TranslationMemory(str(blocker / "memory.sqlite3"), 1000)
+    monkeypatch.setattr(xcstrings_tools, "translation_memory", memory)
+
+    translated, _ = asyncio.run(xcstrings_tools.translate_strings_async(["Hello"], "es", "en"))
+
+    assert translated == {"Hello": "T[Hello]"}
+    assert not memory.enabled
+    assert lookup(memory, ["Hello"]) == {}
+    assert memory.stats() == {"hits": 0, "misses": 0, "entries": 0}
+
+
+def test_summary_reports_memory_hits_and_misses(memory, fake_openai):
+    memory.store({"Hello": "Hola"}, *xcstrings_tools.translation_memory_key("en", "es", None))
+    stats = TranslationStats()
+
+    asyncio.run(xcstrings_tools.translate_strings_async(["Hello", "Goodbye", "Thanks"], "es", "en", stats=stats))
+
+    assert (stats.memory_hits, stats.memory_misses) == (1, 2)
+    assert "translation memory hits: 1, misses: 2" in stats.summary()
+    assert memory.stats() == {"hits": 1, "misses": 2, "entries": 3}
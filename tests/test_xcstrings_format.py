@@ -0,0 +1,48 @@
+import json
+import os
+
+import pytest
+
+import json_backend
+from catalog_cache import load_catalog
+from xcstrings_format import catalog_sort_key, dump_catalog, dumps_catalog
+
+GOLDEN_PATH = os.path.join(os.path.dirname(__file__), "data", "Golden.xcstrings")
+
+
+@pytest.fixture
+def golden_bytes():
+    with open(GOLDEN_PATH, "rb") as f:
+        return f.read()
+
+
+def test_golden_catalog_round_trips_byte_for_byte(golden_bytes):
+    data = load_catalog(GOLDEN_PATH)
+
+    assert dumps_catalog(data).encode("utf-8") == golden_bytes
+
+
+def test_golden_catalog_round_trips_from_any_key_order(golden_bytes):
+    # Keys come back in Xcode's order even if the document was built in another one
+    def reverse(value):
+        if isinstance(value, dict):
+            return {key: reverse(value[key]) for key in reversed(list(value))}
+        return value
+
+    data = reverse(json.loads(golden_bytes))
+
+    assert dumps_catalog(data).encode("utf-8") == golden_bytes
+
+
+def test_dump_catalog_matches_dumps_catalog(tmp_path, golden_bytes):
+    path = tmp_path / "Localizable.xcstrings"
+    with open(path, "w", encoding="utf-8") as f:
+        dump_catalog(json_backend.loads(golden_bytes), f)
+
+    assert path.read_bytes() == golden_bytes
+
+
+def test_catalog_sort_key_orders_like_xcode():
+    keys = ["Item 10", "banana", "Item 2", "Apple", "item 1", ""]
+
+    assert sorted(keys, key=catalog_sort_key) == ["", "Apple", "banana", "item 1", "Item 2", "Item 10"]